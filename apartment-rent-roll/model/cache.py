@@ -0,0 +1,304 @@
+import os
+import pickle
+import sys
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass
+from functools import wraps
+from itertools import islice
+from threading import RLock
+from typing import Any, Callable, Iterator
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Limits on the items model series keep in memory.
+
+    Attributes:
+        max_items: Items cached per node. Iterating past them regenerates the series without caching.
+        max_age: Seconds a node's cache is kept after it was last used.
+        max_nodes: Nodes with a cache in memory. The least recently used node is evicted first.
+        spill_dir: Directory evicted caches are pickled to and reloaded from on next use. Without it, evicted series
+                   are regenerated from the start.
+    """
+
+    max_items: int | None = None
+    max_age: float | None = None
+    max_nodes: int | None = None
+    spill_dir: str | None = None
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Memory accounting for one node's cache.
+
+    Attributes:
+        label: Node label given to `cached_series`, or its class and id.
+        method: Qualified name of the cached method.
+        items: Items held in memory.
+        bytes: Approximate size of the cached items in memory.
+        hits: Items served from the cache.
+        misses: Items generated.
+        spilled: Whether the cache is currently on disk rather than in memory.
+    """
+
+    label: str
+    method: str
+    items: int
+    bytes: int
+    hits: int
+    misses: int
+    spilled: bool
+
+
+def _sizeof(item: Any) -> int:
+    return sys.getsizeof(item) + (sys.getsizeof(vars(item)) if hasattr(item, "__dict__") else 0)
+
+
+# Prefix of the attribute holding a node's partly consumed series generator for each cached method. The generator
+# refers to the node, so it is kept on the node rather than on its cache entry, which would keep the node alive.
+_GENERATOR = "_cached_series_generator"
+
+# Cache entries are keyed by node id and the qualified name of the cached method
+type _Key = tuple[int, str]
+
+
+class _Entry:
+    __slots__ = ("label", "method", "node", "items", "generator", "last_used", "hits", "misses", "spill_path")
+
+    def __init__(self, label: str, method: str):
+        self.label = label
+        self.method = method
+        self.node: weakref.ref | None = None
+        self.items: list = []
+        self.generator: Iterator | None = None
+        self.last_used = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+        self.spill_path: str | None = None
+
+
+class SeriesCache:
+    """
+    Caches of model series under one `CachePolicy`, tracked per node and cached method.
+
+    Replaces `orcaset.cached_generator` for series decorated with `cached_series`. With the default policy every
+    item is kept, as with `cached_generator`.
+    """
+
+    def __init__(self, policy: CachePolicy = CachePolicy()):
+        self.policy = policy
+        # Least recently used first, which is also the order caches expire in
+        self._resident: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._spilled: dict[_Key, _Entry] = {}
+        # Keys of the cached methods of each node id, dropped once the node is garbage collected
+        self._watched: dict[int, set[_Key]] = {}
+        self._lock = RLock()
+
+    def configure(self, policy: CachePolicy) -> None:
+        """Apply `policy`, evicting any caches it no longer allows."""
+        with self._lock:
+            self.policy = policy
+            if policy.max_items is not None:
+                for entry in self._resident.values():
+                    if len(entry.items) > policy.max_items:
+                        del entry.items[policy.max_items :]
+                        self._drop_generator(entry)
+            self._enforce()
+
+    @staticmethod
+    def _generator(entry: _Entry) -> Iterator | None:
+        node = entry.node() if entry.node else None
+        return vars(node).get(f"{_GENERATOR}:{entry.method}") if node is not None else entry.generator
+
+    @staticmethod
+    def _set_generator(entry: _Entry, generator: Iterator) -> None:
+        node = entry.node() if entry.node else None
+        if node is not None:
+            vars(node)[f"{_GENERATOR}:{entry.method}"] = generator
+        else:
+            entry.generator = generator
+
+    @staticmethod
+    def _drop_generator(entry: _Entry) -> None:
+        node = entry.node() if entry.node else None
+        if node is not None:
+            vars(node).pop(f"{_GENERATOR}:{entry.method}", None)
+        entry.generator = None
+
+    def _evict(self, key: _Key) -> None:
+        entry = self._resident.pop(key)
+        self._drop_generator(entry)
+        if self.policy.spill_dir and entry.items:
+            os.makedirs(self.policy.spill_dir, exist_ok=True)
+            entry.spill_path = os.path.join(self.policy.spill_dir, f"{os.getpid()}-{id(entry):x}.pkl")
+            with open(entry.spill_path, "wb") as file:
+                pickle.dump(entry.items, file)
+            entry.items = []
+            self._spilled[key] = entry
+
+    def _enforce(self, keep: _Key | None = None) -> None:
+        """Evict expired caches and the least recently used caches over `max_nodes`, except `keep`."""
+        if self.policy.max_age is not None:
+            expired = time.monotonic() - self.policy.max_age
+            while self._resident:
+                key, entry = next(iter(self._resident.items()))
+                if entry.last_used >= expired or key == keep:
+                    break
+                self._evict(key)
+        if self.policy.max_nodes is not None:
+            while len(self._resident) > self.policy.max_nodes:
+                key = next(k for k in self._resident if k != keep)
+                self._evict(key)
+
+    def _forget(self, node_id: int) -> None:
+        """Drop every trace of a node's caches once the node is garbage collected."""
+        with self._lock:
+            for key in self._watched.pop(node_id, ()):
+                entry = self._resident.pop(key, None) or self._spilled.pop(key, None)
+                if entry is not None and entry.spill_path:
+                    with suppress(FileNotFoundError):
+                        os.remove(entry.spill_path)
+
+    def _entry(self, node: Any, label: str, method: str) -> _Entry:
+        key = (id(node), method)
+        entry = self._resident.get(key)
+        if entry is None:
+            entry = self._spilled.pop(key, None)
+            if entry is not None:
+                with open(entry.spill_path, "rb") as file:  # type: ignore[arg-type]
+                    entry.items = pickle.load(file)
+                os.remove(entry.spill_path)  # type: ignore[arg-type]
+                entry.spill_path = None
+            else:
+                entry = _Entry(label, method)
+                try:
+                    if id(node) not in self._watched:
+                        weakref.finalize(node, self._forget, id(node))
+                        self._watched[id(node)] = set()
+                    self._watched[id(node)].add(key)
+                    if hasattr(node, "__dict__"):
+                        entry.node = weakref.ref(node)
+                except TypeError:
+                    pass  # Nodes without weak references keep their cache until evicted
+            self._resident[key] = entry
+
+        self._resident.move_to_end(key)
+        entry.last_used = time.monotonic()
+        self._enforce(keep=key)
+        return entry
+
+    def iterate[T](self, node: Any, generate: Callable[[Any], Iterator[T]], label: str) -> Iterator[T]:
+        """Items of `generate(node)`, served from and added to the node's cache as the policy allows."""
+        method = generate.__qualname__
+        i = 0
+        while True:
+            with self._lock:
+                entry = self._entry(node, label, method)
+                if i < len(entry.items):
+                    entry.hits += 1
+                elif self.policy.max_items is not None and i >= self.policy.max_items:
+                    break
+                else:
+                    generator = self._generator(entry)
+                    if generator is None:
+                        generator = islice(generate(node), len(entry.items), None)
+                        self._set_generator(entry, generator)
+                    try:
+                        while len(entry.items) <= i:
+                            entry.items.append(next(generator))
+                            entry.misses += 1
+                    except StopIteration:
+                        return
+                item = entry.items[i]
+            yield item
+            i += 1
+
+        # Past `max_items`, so generate the rest of the series without caching it
+        yield from islice(generate(node), i, None)
+
+    def stats(self) -> list[CacheStats]:
+        """Memory accounting for every node with a cache, largest first."""
+        with self._lock:
+            stats = [
+                CacheStats(
+                    label=entry.label,
+                    method=entry.method,
+                    items=len(entry.items),
+                    bytes=sys.getsizeof(entry.items) + sum(_sizeof(item) for item in entry.items),
+                    hits=entry.hits,
+                    misses=entry.misses,
+                    spilled=entry.spill_path is not None,
+                )
+                for entry in (*self._resident.values(), *self._spilled.values())
+            ]
+        return sorted(stats, key=lambda s: s.bytes, reverse=True)
+
+
+series_cache = SeriesCache()
+
+
+def configure(policy: CachePolicy) -> None:
+    """Set the cache policy for every `cached_series`."""
+    series_cache.configure(policy)
+
+
+def cached_series[N, T](
+    label: Callable[[N], str] | None = None,
+) -> Callable[[Callable[[N], Iterator[T]]], Callable[[N], Iterator[T]]]:
+    """
+    Decorator caching a node's series in `series_cache` under the configured `CachePolicy`.
+
+    `label` names the node in `series_cache.stats()`.
+    """
+
+    def decorate(generate: Callable[[N], Iterator[T]]) -> Callable[[N], Iterator[T]]:
+        @wraps(generate)
+        def wrapper(node: N) -> Iterator[T]:
+            name = label(node) if label else f"{type(node).__name__}@{id(node):x}"
+            return series_cache.iterate(node, generate, name)
+
+        return wrapper
+
+    return decorate
+
+
+if __name__ == "__main__":
+    import tempfile
+    from datetime import date
+
+    from dateutil.relativedelta import relativedelta
+
+    # Use the cache module imported by `Unit`, rather than this module run as `__main__`
+    from . import cache
+    from .lease import Lease
+    from .unit import Unit
+
+    def next_lease(unit: Unit, prev: list[Lease]) -> Lease:
+        lease = prev[-1]
+        return Lease(lease.end, lease.end + relativedelta(years=1), lease.monthly_rent * 1.03, vacant=False)
+
+    units = [
+        Unit(
+            unit=f"{i:04d}",
+            unit_type="1br",
+            initial_lease=Lease(date(2024, 1, 1), date(2025, 1, 1), 3_000, vacant=False),
+            get_next_lease=next_lease,
+        )
+        for i in range(2_000)
+    ]
+
+    with tempfile.TemporaryDirectory() as spill_dir:
+        cache.configure(cache.CachePolicy(max_items=20, max_nodes=500, spill_dir=spill_dir))
+        for unit in units:
+            list(islice(unit, 30))
+
+        stats = cache.series_cache.stats()
+        resident = [s for s in stats if not s.spilled]
+        print(f"Units: {len(units):,}, in memory: {len(resident):,}, spilled: {len(stats) - len(resident):,}")
+        print(f"Cached bytes in memory: {sum(s.bytes for s in resident):,}")
+        print(f"Largest cache: {stats[0]}")
@@ -0,0 +1,15 @@
+from datetime import date
+from typing import Any
+
+
+def horizon(node: Any) -> date:
+    """
+    Last date projected by the model containing `node`, set by the nearest ancestor with a `horizon` date.
+
+    Defaults to `date.max` (unbounded).
+    """
+    while node is not None:
+        if isinstance(end := getattr(node, "horizon", None), date):
+            return end
+        node = getattr(node, "parent", None)
+    return date.max
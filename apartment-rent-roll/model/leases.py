@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from itertools import accumulate, takewhile
+from typing import TYPE_CHECKING, Iterable
+
+from dateutil.relativedelta import relativedelta
+
+from .lease import Lease
+
+if TYPE_CHECKING:
+    from .unit import Unit
+
+
+@dataclass(frozen=True)
+class LeaseEvent:
+    """
+    A lease of one unit.
+
+    Attributes:
+        unit: Unit identifier.
+        unit_type: Type of the unit.
+        lease: The lease.
+    """
+
+    unit: str
+    unit_type: str
+    lease: Lease
+
+
+class LeaseIndex:
+    """
+    Leases of every unit starting before `through`, indexed for expiry, occupancy and rollover queries.
+
+    Built once from the units' lease series. Expiries are sorted by end date with running totals of in-place rent,
+    and occupancy is kept as running counts of occupied and vacant units at each lease start or end, so each query
+    is a bisection rather than a scan of the units.
+
+    ```python
+    index = model.units.leases(through=date(2030, 1, 1))
+    index.occupied(date(2026, 6, 30)), index.rollover(date(2026, 1, 1), date(2027, 1, 1))
+    ```
+    """
+
+    def __init__(self, units: Iterable[Unit], through: date):
+        self.through = through
+        self.by_unit: dict[str, list[LeaseEvent]] = {}
+        self.by_type: dict[str, list[LeaseEvent]] = defaultdict(list)
+        self.by_expiry_month: dict[tuple[int, int], list[LeaseEvent]] = defaultdict(list)
+
+        changes: dict[date, list[int]] = defaultdict(lambda: [0, 0])
+        for unit in units:
+            leases = takewhile(lambda lease: lease.start < through, unit)
+            events = [LeaseEvent(unit.unit, unit.unit_type, lease) for lease in leases]
+            self.by_unit[unit.unit] = events
+            self.by_type[unit.unit_type] += events
+            for event in events:
+                lease = event.lease
+                self.by_expiry_month[lease.end.year, lease.end.month].append(event)
+                status = 1 if lease.vacant else 0
+                changes[lease.start][status] += 1
+                changes[lease.end][status] -= 1
+
+        # Occupied leases by end date, with running totals of their monthly rent
+        occupied = (e for events in self.by_unit.values() for e in events if not e.lease.vacant)
+        self._expiring = sorted(occupied, key=lambda e: e.lease.end)
+        self._expiry_dates = [e.lease.end for e in self._expiring]
+        self._expiring_rent = list(accumulate((e.lease.monthly_rent for e in self._expiring), initial=0.0))
+
+        # Occupied and vacant unit counts from each date where a lease starts or ends
+        self._change_dates = sorted(changes)
+        self._occupied = list(accumulate(changes[dt][0] for dt in self._change_dates))
+        self._vacant = list(accumulate(changes[dt][1] for dt in self._change_dates))
+        self._unit_starts = {unit: [e.lease.start for e in events] for unit, events in self.by_unit.items()}
+
+    def _count(self, counts: list[int], dt: date) -> int:
+        i = bisect_right(self._change_dates, dt)
+        return counts[i - 1] if i else 0
+
+    def occupied(self, dt: date) -> int:
+        """Units with an occupied lease on `dt` (leases run from their start up to, not including, their end)."""
+        return self._count(self._occupied, dt)
+
+    def vacant(self, dt: date) -> int:
+        """Units vacant on `dt`."""
+        return self._count(self._vacant, dt)
+
+    def occupancy(self, dt: date) -> float:
+        """Share of units with a lease on `dt` that are occupied."""
+        occupied, vacant = self.occupied(dt), self.vacant(dt)
+        return occupied / (occupied + vacant) if occupied + vacant else 0.0
+
+    def lease_at(self, unit: str, dt: date) -> Lease | None:
+        """Lease of `unit` on `dt`, or `None` if `dt` is before its first lease or after `through`."""
+        i = bisect_right(self._unit_starts[unit], dt) - 1
+        if i < 0 or self.by_unit[unit][i].lease.end <= dt:
+            return None
+        return self.by_unit[unit][i].lease
+
+    def expiries(self, start: date, end: date) -> list[LeaseEvent]:
+        """Occupied leases ending on or after `start` and before `end`, in end date order."""
+        return self._expiring[bisect_left(self._expiry_dates, start) : bisect_left(self._expiry_dates, end)]
+
+    def rollover(self, start: date, end: date) -> float:
+        """Monthly in-place rent of occupied leases ending on or after `start` and before `end`."""
+        lo, hi = bisect_left(self._expiry_dates, start), bisect_left(self._expiry_dates, end)
+        return self._expiring_rent[hi] - self._expiring_rent[lo]
+
+    def expiry_ladder(self, start: date, months: int) -> list[tuple[date, int, float]]:
+        """`(month start, leases expiring, monthly rent expiring)` for each month from the month of `start`."""
+        first = start.replace(day=1)
+        ladder = []
+        for i in range(months):
+            lo, hi = first + relativedelta(months=i), first + relativedelta(months=i + 1)
+            count = bisect_left(self._expiry_dates, hi) - bisect_left(self._expiry_dates, lo)
+            ladder.append((lo, count, self.rollover(lo, hi)))
+        return ladder
+
+
+if __name__ == "__main__":
+    import time
+
+    from .unit import Unit, Units
+
+    def next_lease(unit: Unit, prev: list[Lease]) -> Lease:
+        lease = prev[-1]
+        if lease.vacant:
+            return Lease(lease.end, lease.end + relativedelta(years=1), lease.monthly_rent * 1.03, vacant=False)
+        return Lease(lease.end, lease.end + relativedelta(months=1), lease.monthly_rent, vacant=True)
+
+    units = Units(
+        units=[
+            Unit(
+                unit=f"{i:04d}",
+                unit_type=("studio", "1br", "2br")[i % 3],
+                initial_lease=Lease(date(2024, 1 + i % 12, 1), date(2025, 1 + i % 12, 1), 2_000 + i % 3 * 500, False),
+                get_next_lease=next_lease,
+            )
+            for i in range(2_000)
+        ]
+    )
+
+    t0 = time.perf_counter()
+    index = units.leases(through=date(2035, 1, 1))
+    build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for month in range(120):
+        dt = date(2025, 1, 15) + relativedelta(months=month)
+        index.occupied(dt), index.rollover(dt, dt + relativedelta(years=1))
+    queries = time.perf_counter() - t0
+
+    leases = sum(len(events) for events in index.by_unit.values())
+    print(f"{len(units):,} units, {leases:,} leases, build: {build:.2f} s, 240 queries: {queries * 1000:.2f} ms")
+    print(f"Unit 0507: {units.get('0507').unit_type}, 2br units: {units.count('2br')}\n")
+    print("| Month | Expiring | Rent Expiring | Occupancy |\n| --- | --- | --- | --- |")
+    for month, count, rent in index.expiry_ladder(date(2026, 1, 1), 12):
+        print(f"| {month:%Y-%m} | {count} | {rent:,.0f} | {index.occupancy(month):.1%} |")
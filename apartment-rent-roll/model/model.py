@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import date
 from orcaset import Node
 from typing import Self
 
@@ -8,9 +9,19 @@ from .income import EffectiveGrossIncome
 
 @dataclass
 class ApartmentModel(Node[None]):
+    """
+    Attributes:
+        market: Market the property is in.
+        units: Units in the rent roll.
+        egi: Effective gross income.
+        horizon: Last date projected. Each unit stops generating leases after the lease containing it, which bounds
+                 the leases cached per unit in large batch runs. Unbounded by default.
+    """
+
     market: str
     units: "list[Unit]"
     egi: "EffectiveGrossIncome[Self]"
+    horizon: date = date.max
 
 
 if __name__ == "__main__":
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from datetime import date
+from functools import cached_property
 from typing import TYPE_CHECKING, Callable, Generator, List, Literal
 
-from orcaset import Node, cached_generator
+from orcaset import Node
 
+from .cache import cached_series
+from .horizon import horizon
 from .lease import Lease
+from .leases import LeaseIndex
 
 if TYPE_CHECKING:
     from .model import ApartmentModel
@@ -13,12 +18,49 @@ if TYPE_CHECKING:
 
 @dataclass
 class Units[P: ApartmentModel](Node[P]):
+    """
+    The units of a building, indexed by unit identifier and type.
+
+    Attributes:
+        units: Units in the building.
+    """
+
     units: list[Unit]
 
     def __post_init__(self):
+        self._leases: dict[date, LeaseIndex] = {}
         for unit in self.units:
             unit.parent = self
 
+    @cached_property
+    def by_id(self) -> dict[str, Unit]:
+        return {unit.unit: unit for unit in self.units}
+
+    @cached_property
+    def by_type(self) -> dict[str, list[Unit]]:
+        types: dict[str, list[Unit]] = {}
+        for unit in self.units:
+            types.setdefault(unit.unit_type, []).append(unit)
+        return types
+
+    def get(self, unit: str) -> Unit:
+        """Unit with identifier `unit`."""
+        return self.by_id[unit]
+
+    def count(self, unit_type: str) -> int:
+        """Number of units of `unit_type`."""
+        return len(self.by_type.get(unit_type, ()))
+
+    def leases(self, through: date) -> LeaseIndex:
+        """
+        Index of the leases of every unit starting before `through`.
+
+        Built once per `through` date from the units' cached lease series and reused by later queries.
+        """
+        if through not in self._leases:
+            self._leases[through] = LeaseIndex(self.units, through)
+        return self._leases[through]
+
     def __iter__(self):
         yield from iter(self.units)
 
@@ -44,12 +86,13 @@ class Unit[P: Units](Node[P]):
     initial_lease: Lease
     get_next_lease: Callable[[Unit, List[Lease]], Lease]
 
-    @cached_generator
+    @cached_series(label=lambda unit: unit.unit)
     def __iter__(self) -> Generator[Lease, None, None]:
         leases = [self.initial_lease]
         yield self.initial_lease
 
-        while True:
+        end = horizon(self)
+        while leases[-1].end < end:
             next_lease = self.get_next_lease(self, leases)
             leases.append(next_lease)
             yield next_lease
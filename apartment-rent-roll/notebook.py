@@ -213,7 +213,7 @@ def _(mo):
 def _(islice, model):
     print(f"Total units: {len(model.units)}\n")
 
-    unit_0507 = [unit for unit in model.units if unit.unit == "0507"][0]
+    unit_0507 = model.units.get("0507")
     print(f"Unit 0507 type: {unit_0507.unit_type}")
 
     print("Unit 0507 monthly rent:")
@@ -309,7 +309,7 @@ def _(main_123):
     print(f"Total units: {len(main_123.units)}")
     print("Unit types:")
     for t in ["studio", "1bd", "2bd"]:
-        print(f"\t{t.capitalize()}:\t{len([u for u in main_123.units if u.unit_type == t])}")
+        print(f"\t{t.capitalize()}:\t{main_123.units.count(t)}")
     return
 
 
@@ -0,0 +1,204 @@
+"""
+Forward-mode automatic differentiation of model outputs with respect to assumptions.
+
+Scalar assumptions are replaced by `Dual` values carrying their derivative with respect to themselves. Model values
+are ordinary arithmetic on floats, so every line item computed from them carries its derivatives with respect to each
+assumption it depends on, and one model evaluation gives an output and its full gradient.
+"""
+
+import operator
+from numbers import Real
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Sequence
+
+from model.curves import StepCurve
+
+if TYPE_CHECKING:
+    from base_case import Assumptions
+    from model.model import Traeger
+
+
+class Dual:
+    """
+    Value with its partial derivatives, keyed by assumption name.
+
+    Derivatives are sparse: a name missing from `grad` has a zero derivative. Duals compare and convert to `bool` by
+    value, so branches on model values (e.g. `min`) follow the branch taken by the value and differentiate it.
+    """
+
+    __slots__ = ("value", "grad")
+
+    def __init__(self, value: float, grad: Mapping[str, float] | None = None):
+        self.value = value
+        self.grad = dict(grad or {})
+
+    @staticmethod
+    def _lift(other: Any) -> "Dual | None":
+        if isinstance(other, Dual):
+            return other
+        if isinstance(other, Real):
+            return Dual(other)
+        return None
+
+    @staticmethod
+    def _combine(a: "Dual", da: float, b: "Dual", db: float) -> dict[str, float]:
+        """`da * a.grad + db * b.grad`."""
+        grad = {k: da * v for k, v in a.grad.items()} if da else {}
+        if db:
+            for k, v in b.grad.items():
+                grad[k] = grad.get(k, 0.0) + db * v
+        return grad
+
+    def __add__(self, other):
+        if (o := self._lift(other)) is None:
+            return NotImplemented
+        return Dual(self.value + o.value, self._combine(self, 1.0, o, 1.0))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if (o := self._lift(other)) is None:
+            return NotImplemented
+        return Dual(self.value - o.value, self._combine(self, 1.0, o, -1.0))
+
+    def __rsub__(self, other):
+        if (o := self._lift(other)) is None:
+            return NotImplemented
+        return o - self
+
+    def __mul__(self, other):
+        if (o := self._lift(other)) is None:
+            return NotImplemented
+        return Dual(self.value * o.value, self._combine(self, o.value, o, self.value))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if (o := self._lift(other)) is None:
+            return NotImplemented
+        return Dual(self.value / o.value, self._combine(self, 1 / o.value, o, -self.value / o.value**2))
+
+    def __rtruediv__(self, other):
+        if (o := self._lift(other)) is None:
+            return NotImplemented
+        return o / self
+
+    def __pow__(self, exponent):
+        if not isinstance(exponent, Real):
+            return NotImplemented
+        return Dual(self.value**exponent, self._combine(self, exponent * self.value ** (exponent - 1), self, 0.0))
+
+    def __neg__(self) -> "Dual":
+        return Dual(-self.value, {k: -v for k, v in self.grad.items()})
+
+    def __pos__(self) -> "Dual":
+        return self
+
+    def __abs__(self) -> "Dual":
+        return -self if self.value < 0 else self
+
+    def _compare(self, other: Any, op: Callable[[float, float], bool]) -> bool:
+        if (o := self._lift(other)) is None:
+            return NotImplemented
+        return op(self.value, o.value)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __bool__(self) -> bool:
+        return bool(self.value)
+
+    def __float__(self) -> float:
+        return float(self.value)
+
+    def __format__(self, spec: str) -> str:
+        return format(self.value, spec)
+
+    def __repr__(self) -> str:
+        return f"Dual({self.value!r}, {self.grad!r})"
+
+    def d(self, name: str) -> float:
+        """Derivative with respect to assumption `name`."""
+        return self.grad.get(name, 0.0)
+
+
+def _seed(value: Any, name: str) -> Any:
+    if isinstance(value, StepCurve):
+        return StepCurve(value.starts, [_seed(rate, name) for rate in value.rates], value.yf)
+    return Dual(value, {name: 1.0})
+
+
+def _is_scalar(value: Any) -> bool:
+    return isinstance(value, StepCurve) or (isinstance(value, Real) and not isinstance(value, bool))
+
+
+def differentiable(assumptions: type["Assumptions"]) -> list[str]:
+    """Names of the scalar assumptions and step curves of `assumptions`, deriving them if needed."""
+    names = dict.fromkeys(name for cls in reversed(assumptions.__mro__) for name in vars(cls))
+    return [name for name in names if not name.startswith("_") and _is_scalar(getattr(assumptions, name))]
+
+
+def gradients(
+    targets: Sequence[Callable[["Traeger"], Any]],
+    names: Sequence[str] | None = None,
+    assumptions: type["Assumptions"] | None = None,
+) -> list[Dual]:
+    """
+    Each of `targets` with its derivative with respect to each assumption in `names`, from one model evaluation.
+
+    `names` defaults to every scalar assumption and step curve. The derivative with respect to a step curve is for a
+    parallel shift of all of its rates. A target takes a model and returns a value or a `.value` holder such as a
+    `Balance`. A target that does not depend on any of `names` has an empty gradient.
+    """
+    from base_case import Assumptions, build_traeger, scenario
+
+    assumptions = assumptions or Assumptions
+    names = differentiable(assumptions) if names is None else names
+    seeded = scenario(assumptions, **{name: _seed(getattr(assumptions, name), name) for name in names})
+
+    results = []
+    with build_traeger(seeded) as m:
+        for target in targets:
+            result = target(m)
+            if not isinstance(result, Dual):
+                result = getattr(result, "value", result)
+            results.append(result if isinstance(result, Dual) else Dual(result))
+    return results
+
+
+def gradient(
+    target: Callable[["Traeger"], Any],
+    names: Sequence[str] | None = None,
+    assumptions: type["Assumptions"] | None = None,
+) -> Dual:
+    """`target` with its derivative with respect to each assumption in `names`. See `gradients`."""
+    return gradients([target], names, assumptions)[0]
+
+
+if __name__ == "__main__":
+    import time
+    from datetime import date
+
+    start = time.perf_counter()
+    net_income = gradient(lambda m: m.income.accrue(date(2026, 12, 31), date(2027, 12, 31)))
+    elapsed = time.perf_counter() - start
+
+    print(f"## 2027 net income: {net_income.value:,.0f}\n")
+    print("| Assumption | Derivative |\n| --- | --- |")
+    for name, value in sorted(net_income.grad.items(), key=lambda item: -abs(item[1])):
+        print(f"| {name} | {value:,.2f} |")
+    print(f"\n{len(net_income.grad)} derivatives from one evaluation: {elapsed:.2f} s")
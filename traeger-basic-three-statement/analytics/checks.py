@@ -0,0 +1,161 @@
+from dataclasses import dataclass
+from datetime import date
+from itertools import pairwise
+from operator import attrgetter
+from typing import Mapping, Sequence
+
+from model.grid import accrue_grid, balances_at, payments_over
+from model.model import Traeger
+
+
+@dataclass
+class IntegrityReport:
+    """
+    Balance sheet and cash reconciliation results for one scenario over a date grid.
+
+    Attributes:
+        dates: Ascending dates the balance sheet is tested at. Cash flows are reconciled over each consecutive pair.
+        imbalance: `assets - (liabilities + equity)` at each date.
+        cash_flow: Total cash flow over each period.
+        cash_change: Change in the cash balance over each period.
+        tolerance: Absolute difference treated as zero.
+    """
+
+    dates: list[date]
+    imbalance: list[float]
+    cash_flow: list[float]
+    cash_change: list[float]
+    tolerance: float
+
+    @property
+    def unbalanced(self) -> list[date]:
+        return [dt for dt, diff in zip(self.dates, self.imbalance) if abs(diff) > self.tolerance]
+
+    @property
+    def unreconciled(self) -> list[date]:
+        return [
+            dt
+            for dt, cf, change in zip(self.dates[1:], self.cash_flow, self.cash_change)
+            if abs(cf - change) > self.tolerance
+        ]
+
+    @property
+    def ok(self) -> bool:
+        return not (self.unbalanced or self.unreconciled)
+
+    def raise_for_errors(self) -> None:
+        if self.ok:
+            return
+        errors = [
+            f"Balance sheet out of balance on {dt.isoformat()} by {diff:,.2f}"
+            for dt, diff in zip(self.dates, self.imbalance)
+            if abs(diff) > self.tolerance
+        ] + [
+            f"Cash flow {cf:,.2f} does not reconcile to change in cash {change:,.2f} for period ending {dt.isoformat()}"
+            for dt, cf, change in zip(self.dates[1:], self.cash_flow, self.cash_change)
+            if abs(cf - change) > self.tolerance
+        ]
+        raise AssertionError("\n".join(errors))
+
+
+def check(model: Traeger, dates: Sequence[date], tolerance: float = 1.0) -> IntegrityReport:
+    """
+    Test that the balance sheet balances at each of `dates` and that cash flow reconciles to the change in cash.
+
+    Assets, liabilities, equity, cash and total cash flow are each materialized in a single pass over the date grid
+    rather than walking the full balance sheet once per date.
+    """
+    dates = list(dates)
+    with model as m:
+        assets = balances_at(m.balance_sheet.assets, dates)
+        liabilities = balances_at(m.balance_sheet.liabilities, dates)
+        equity = balances_at(m.balance_sheet.equity, dates)
+        cash = balances_at(m.balance_sheet.assets.cash, dates)
+        cash_flow = payments_over(m.cash_flow, dates)
+
+    return IntegrityReport(
+        dates=dates,
+        imbalance=[a - (li + e) for a, li, e in zip(assets, liabilities, equity)],
+        cash_flow=cash_flow,
+        cash_change=[c2 - c1 for c1, c2 in pairwise(cash)],
+        tolerance=tolerance,
+    )
+
+
+def check_all(
+    scenarios: Mapping[str, Traeger], dates: Sequence[date], tolerance: float = 1.0
+) -> dict[str, IntegrityReport]:
+    """Run `check` for each scenario."""
+    return {name: check(model, dates, tolerance) for name, model in scenarios.items()}
+
+
+# Balances projected as a ratio of a quarterly flow
+WORKING_CAPITAL = (
+    "balance_sheet.assets.receivables",
+    "balance_sheet.assets.inventory",
+    "balance_sheet.assets.other_current_assets",
+    "balance_sheet.liabilities.accounts_payable",
+    "balance_sheet.liabilities.accrued_expenses",
+    "balance_sheet.liabilities.other_current_liabilities",
+)
+REVENUE = "income.pretax_income.operating_income.gross_profit.revenue"
+NET_INCOME = "income"
+
+
+def check_frequencies(
+    quarterly: Traeger, monthly: Traeger, dates: Sequence[date], tolerance: float = 1.0, relative: float = 0.01
+) -> dict[str, list[date]]:
+    """
+    Quarter end `dates` where a `monthly` model differs from the `quarterly` one, for each line item that differs.
+
+    Working capital balances are compared at every date, and revenue and net income over each quarter between
+    consecutive dates. Growth rates and working capital ratios are quarterly, so these agree within `tolerance`,
+    except that monthly net income also includes interest on balances within each quarter. Net income may differ by
+    up to `relative` times the quarter's revenue.
+    """
+    values = []
+    for model in (quarterly, monthly):
+        with model as m:
+            results = {path: balances_at(attrgetter(path)(m), dates) for path in WORKING_CAPITAL}
+            results |= {path: accrue_grid(attrgetter(path)(m), dates) for path in (REVENUE, NET_INCOME)}
+            values.append(results)
+
+    q, mo = values
+    limits = {path: [tolerance] * len(dates) for path in WORKING_CAPITAL}
+    limits[REVENUE] = [tolerance] * (len(dates) - 1)
+    limits[NET_INCOME] = [max(tolerance, relative * abs(revenue)) for revenue in q[REVENUE]]
+
+    differences = {}
+    for path, path_limits in limits.items():
+        ends = dates if path in WORKING_CAPITAL else dates[1:]
+        breaks = [dt for dt, a, b, limit in zip(ends, q[path], mo[path], path_limits) if abs(a - b) > limit]
+        if breaks:
+            differences[path] = breaks
+    return differences
+
+
+if __name__ == "__main__":
+    from dateutil.relativedelta import relativedelta
+    from orcaset.financial import Period
+
+    from base_case import traeger
+
+    # Historical cash flows are estimated, so only projected periods are reconciled
+    quarters = Period.series(date(2025, 3, 31), relativedelta(months=3, day=31), relativedelta(years=5))
+    dates = [date(2025, 3, 31)] + [end for _, end in quarters]
+
+    report = check(traeger, dates)
+    print(f"Checked {len(dates)} balance sheet dates and {len(dates) - 1} cash flow periods")
+    print(f"Max imbalance: {max(abs(v) for v in report.imbalance):,.2f}")
+    max_diff = max(abs(cf - change) for cf, change in zip(report.cash_flow, report.cash_change))
+    print(f"Max cash reconciliation difference: {max_diff:,.2f}")
+    report.raise_for_errors()
+
+    from base_case import build_traeger, scenario
+
+    monthly = build_traeger(scenario(frequency="monthly", horizon=dates[-1]))
+    differences = check_frequencies(build_traeger(scenario(horizon=dates[-1])), monthly, dates)
+    print(f"Monthly and quarterly working capital, revenue and net income agree by quarter: {not differences}")
+    if differences:
+        errors = [f"{path} differs on {', '.join(map(date.isoformat, breaks))}" for path, breaks in differences.items()]
+        raise AssertionError("\n".join(errors))
@@ -0,0 +1,205 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Literal, Mapping, Sequence
+
+from analytics.rolling import ltm
+from analytics.stochastic import Paths
+from model.grid import balances_at
+from model.model import Traeger
+from model.numeric import divide
+
+
+@dataclass
+class Metrics:
+    """Covenant inputs for one scenario materialized over a quarter-end date grid."""
+
+    dates: list[date]
+    cash: list[float]
+    total_debt: list[float]
+    ltm_ebitda: list[float]
+    ltm_interest: list[float]
+
+    @classmethod
+    def from_model(cls, model: Traeger, dates: Sequence[date]) -> "Metrics":
+        dates = list(dates)
+        with model as m:
+            operating_income = m.income.pretax_income.operating_income
+            liabilities = m.balance_sheet.liabilities
+
+            # Depreciation and amortization are negative expenses, so subtracting adds them back
+            ebitda = [
+                oi - dep - amort
+                for oi, dep, amort in zip(
+                    ltm(operating_income, dates),
+                    ltm(m.footnotes.depreciation, dates),
+                    ltm(operating_income.operating_expenses.amort_of_intangibles, dates),
+                )
+            ]
+
+            return cls(
+                dates=dates,
+                cash=balances_at(m.balance_sheet.assets.cash, dates),
+                total_debt=balances_at(liabilities.revolver + liabilities.long_term_debt, dates),
+                ltm_ebitda=ebitda,
+                ltm_interest=[-v for v in ltm(m.income.pretax_income.interest_expense, dates)],
+            )
+
+
+def leverage(metrics: Metrics) -> list[float]:
+    """Total debt / LTM EBITDA. Infinite where EBITDA is not positive."""
+    return [divide(debt, ebitda) for debt, ebitda in zip(metrics.total_debt, metrics.ltm_ebitda)]
+
+
+def interest_coverage(metrics: Metrics) -> list[float]:
+    """LTM EBITDA / LTM interest expense. Infinite where there is no interest expense."""
+    return [divide(ebitda, interest) for ebitda, interest in zip(metrics.ltm_ebitda, metrics.ltm_interest)]
+
+
+def liquidity(metrics: Metrics) -> list[float]:
+    """Balance sheet cash."""
+    return metrics.cash
+
+
+@dataclass(frozen=True)
+class Covenant:
+    """
+    Ratio test applied at every date of a `Metrics` grid.
+
+    Attributes:
+        name: Label for reporting.
+        metric: Function computing the tested value at each date from the materialized metrics.
+        limit: Threshold the metric is compared to.
+        kind: `"max"` if the metric must not exceed `limit`, `"min"` if it must not fall below it.
+        tolerance: Relative margin past `limit` treated as meeting it, so floating point residue in a metric held at
+                   its limit (e.g. cash swept to minimum cash) is not a breach.
+    """
+
+    name: str
+    metric: Callable[[Metrics], list[float]]
+    limit: float
+    kind: Literal["max", "min"]
+    tolerance: float = 1e-9
+
+    def breaches(self, values: Sequence[Any]) -> list[list[bool]]:
+        """
+        Whether each path breaches the covenant at each date, indexed `[date][path]`.
+
+        `Paths` values are tested path by path. A float is a single path.
+        """
+        margin = self.tolerance * max(1.0, abs(self.limit))
+        rows = [v.values if isinstance(v, Paths) else [v] for v in values]
+        if self.kind == "max":
+            threshold = self.limit + margin
+            return [[v > threshold for v in row] for row in rows]
+        threshold = self.limit - margin
+        return [[v < threshold for v in row] for row in rows]
+
+    def first_breaches(self, dates: Sequence[date], values: Sequence[Any]) -> list[date | None]:
+        """First date each path breaches the covenant, or `None` if it never does."""
+        first: list[date | None] = []
+        for dt, row in zip(dates, self.breaches(values)):
+            if not first:
+                first = [None] * len(row)
+            for i, breached in enumerate(row):
+                if breached and first[i] is None:
+                    first[i] = dt
+        return first
+
+
+@dataclass
+class CovenantResult:
+    """
+    Attributes:
+        scenario: Scenario name.
+        covenant: Covenant name.
+        values: Tested value at each date, as `Paths` for a Monte Carlo scenario.
+        path_breaches: First breach date of each path (one for a deterministic scenario), or `None`.
+    """
+
+    scenario: str
+    covenant: str
+    values: list[Any]
+    path_breaches: list[date | None]
+
+    @property
+    def first_breach(self) -> date | None:
+        """First date any path breaches."""
+        return min((dt for dt in self.path_breaches if dt is not None), default=None)
+
+    @property
+    def breach_share(self) -> float:
+        """Share of paths that breach at some date."""
+        if not self.path_breaches:
+            return 0.0
+        return sum(dt is not None for dt in self.path_breaches) / len(self.path_breaches)
+
+
+# Example maintenance covenant package
+COVENANTS = (
+    Covenant("Max leverage", leverage, 4.5, "max"),
+    Covenant("Min interest coverage", interest_coverage, 2.0, "min"),
+    # Equal to the base case minimum cash, which the revolver restores at every period end, so it is met exactly
+    Covenant("Min liquidity", liquidity, 10_000, "min"),
+)
+
+
+def evaluate(
+    scenarios: Mapping[str, Traeger], dates: Sequence[date], covenants: Sequence[Covenant] = COVENANTS
+) -> list[CovenantResult]:
+    """
+    Test every covenant at every date for each scenario.
+
+    Inputs are materialized once per scenario and shared by all tests, so adding covenants does not add model
+    queries. A scenario can be a single model carrying many paths as `Paths` values (see `analytics.stochastic`),
+    which reports the first breach of each path from one model evaluation rather than one model per path.
+    """
+    results = []
+    for name, model in scenarios.items():
+        metrics = Metrics.from_model(model, dates)
+        for covenant in covenants:
+            values = covenant.metric(metrics)
+            results.append(CovenantResult(name, covenant.name, values, covenant.first_breaches(metrics.dates, values)))
+    return results
+
+
+if __name__ == "__main__":
+    from dateutil.relativedelta import relativedelta
+    from orcaset.financial import Period
+
+    from base_case import traeger
+
+    quarters = Period.series(date(2025, 3, 31), relativedelta(months=3, day=31), relativedelta(years=5))
+    dates = [end for _, end in quarters]
+
+    print("| Scenario | Covenant | Limit | First Breach | " + " | ".join(dt.isoformat() for dt in dates) + " |")
+    print("| " + " | ".join(["---"] * (len(dates) + 4)) + " |")
+    limits = {c.name: c.limit for c in COVENANTS}
+    for result in evaluate({"Base": traeger}, dates):
+        breach = result.first_breach.isoformat() if result.first_breach else "-"
+        print(
+            f"| {result.scenario} | {result.covenant} | {limits[result.covenant]:,.2f} | {breach} | "
+            + " | ".join(f"{v:,.2f}" for v in result.values)
+            + " |"
+        )
+
+    # Monte Carlo: every path through one model, first breach reported per path
+    import random
+    import time
+
+    from analytics.stochastic import AR1, correlated_normals
+    from base_case import build_traeger, scenario
+    from model.curves import StepCurve
+
+    n_paths = 10_000
+    starts = [date(2025, 3, 31)] + dates[:-1]
+    (shocks,) = correlated_normals([[1.0]], n_paths, len(starts), random.Random(0))
+    growth = StepCurve(starts, AR1(mean=0.05, phi=0.6, sigma=0.08).paths(shocks))
+    t0 = time.perf_counter()
+    results = evaluate({"Monte Carlo": build_traeger(scenario(revenue_growth_rates=growth))}, dates)
+    elapsed = time.perf_counter() - t0
+
+    print(f"\n{n_paths:,} paths in {elapsed:.1f} s\n")
+    print("| Covenant | Limit | Paths Breaching | First Breach |\n| --- | --- | --- | --- |")
+    for result in results:
+        breach = result.first_breach.isoformat() if result.first_breach else "-"
+        print(f"| {result.covenant} | {limits[result.covenant]:,.2f} | {result.breach_share:.1%} | {breach} |")
@@ -0,0 +1,160 @@
+"""
+Daily cash and revolver balances with a minimum cash sweep.
+
+The model draws on the revolver to restore `min_cash` at period ends only. Here the model's cash flow before revolver
+is laid out on a day-indexed array, either on each payment date or spread evenly over the days of its period, and a
+single scan over the days applies each day's flows and draws or repays the revolver to hold cash at the minimum.
+"""
+
+from array import array
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Iterable
+
+from dateutil.relativedelta import relativedelta
+from orcaset.financial import Payment
+
+if TYPE_CHECKING:
+    from model.model import Traeger
+
+
+@dataclass
+class DailyCash:
+    """
+    Cash and revolver balances at the end of each day.
+
+    Attributes:
+        start: Day of the opening balances. Index `i` of the balances is the end of day `start + i + 1`.
+        cash: Cash at the end of each day.
+        revolver: Revolver balance at the end of each day.
+    """
+
+    start: date
+    cash: array
+    revolver: array
+
+    def index(self, dt: date) -> int:
+        i = (dt - self.start).days - 1
+        if not 0 <= i < len(self.cash):
+            raise ValueError(f"{dt} is outside {self.start + timedelta(days=1)} to {self.end}")
+        return i
+
+    @property
+    def end(self) -> date:
+        return self.start + timedelta(days=len(self.cash))
+
+    def cash_at(self, dt: date) -> float:
+        return self.cash[self.index(dt)]
+
+    def revolver_at(self, dt: date) -> float:
+        return self.revolver[self.index(dt)]
+
+    def peak_revolver(self, start: date | None = None, end: date | None = None) -> tuple[date, float]:
+        """First day of the highest revolver balance from `start` to `end` (inclusive) and that balance."""
+        lo = self.index(start) if start else 0
+        hi = self.index(end) + 1 if end else len(self.revolver)
+        i = max(range(lo, hi), key=self.revolver.__getitem__)
+        return self.start + timedelta(days=i + 1), self.revolver[i]
+
+
+def daily_flows(payments: Iterable[Payment], start: date, days: int, spread: bool = False) -> array:
+    """
+    Payments after `start` summed by day for `days` days.
+
+    Payments must be in date order. With `spread`, each payment is spread evenly over the days since the prior
+    payment (or `start`), which approximates flows paid through a period rather than at its end. Payments are cut
+    off at the end of the grid.
+    """
+    flows = array("d", bytes(8 * days))
+    prior = start
+    for pmt in payments:
+        if pmt.date <= start:
+            continue
+        first, last = (prior - start).days, (pmt.date - start).days
+        if spread and last - first > 1:
+            per_day = float(pmt.value) / (last - first)
+            for i in range(first, min(last, days)):
+                flows[i] += per_day
+        elif last <= days:
+            flows[last - 1] += float(pmt.value)
+        if last >= days:
+            break
+        prior = pmt.date
+    return flows
+
+
+def sweep(
+    start: date,
+    flows: array,
+    opening_cash: float,
+    opening_revolver: float = 0.0,
+    min_cash: float = 0.0,
+    limit: float = float("inf"),
+) -> DailyCash:
+    """
+    Daily balances from applying `flows` to opening cash and revolver balances in one pass.
+
+    Each day, the revolver is drawn to bring cash up to `min_cash`, up to `limit`, and excess cash over `min_cash`
+    repays any balance outstanding. Cash falls below `min_cash` only when the revolver is fully drawn.
+    """
+    cash = array("d", bytes(8 * len(flows)))
+    revolver = array("d", bytes(8 * len(flows)))
+    c, r = opening_cash, opening_revolver
+    for i, flow in enumerate(flows):
+        c += flow
+        if c < min_cash:
+            draw = max(min(min_cash - c, limit - r), 0.0)
+            c, r = c + draw, r + draw
+        elif r > 0 and c > min_cash:
+            repay = min(c - min_cash, r)
+            c, r = c - repay, r - repay
+        cash[i], revolver[i] = c, r
+    return DailyCash(start, cash, revolver)
+
+
+def daily_cash(
+    model: "Traeger", start: date, years: int = 10, spread: bool = True, limit: float = float("inf")
+) -> DailyCash:
+    """
+    Daily cash and revolver balances for `years` from `start`, a date with balance sheet balances in `model`.
+
+    Uses the model's cash flow before revolver draws and its `min_cash`. Evaluates the model through the end of the
+    grid, so set a `horizon` beyond it to bound the projection.
+    """
+    days = (start + relativedelta(years=years) - start).days
+    with model as m:
+        net_revolver_draws = m.footnotes.net_revolver_draws
+        flows = daily_flows(m.footnotes.cash_flow_before_revolver.after(start), start, days, spread)
+        return sweep(
+            start,
+            flows,
+            opening_cash=float(m.balance_sheet.assets.cash.at(start)),
+            opening_revolver=float(m.balance_sheet.liabilities.revolver.at(start)),
+            min_cash=net_revolver_draws.min_cash,
+            limit=limit,
+        )
+
+
+if __name__ == "__main__":
+    import time
+
+    from base_case import Assumptions, build_traeger, scenario
+
+    start = Assumptions.start_date
+    model = build_traeger(scenario(horizon=start + relativedelta(years=10)))
+
+    t0 = time.perf_counter()
+    result = daily_cash(model, start, years=10, limit=150_000)
+    elapsed = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    sweep(result.start, array("d", [100.0, -250.0] * (len(result.cash) // 2)), 1_000.0, min_cash=500.0)
+    scan = time.perf_counter() - t0
+
+    peak_date, peak = result.peak_revolver()
+    print(f"{len(result.cash):,} days from {start}, model and scan: {elapsed:.2f} s, scan alone: {scan * 1000:.1f} ms")
+    print(f"Peak revolver: {peak:,.0f} on {peak_date}\n")
+    print("| Month End | Cash | Revolver |\n| --- | --- | --- |")
+    for month in range(1, 25):
+        dt = start + relativedelta(months=month, day=31)
+        print(f"| {dt} | {result.cash_at(dt):,.0f} | {result.revolver_at(dt):,.0f} |")
@@ -0,0 +1,138 @@
+from collections import Counter
+from dataclasses import fields, is_dataclass
+from functools import wraps
+from typing import Any, Callable, Iterator
+
+from orcaset import Node
+from orcaset.financial import AccrualSeriesBase, BalanceSeriesBase, PaymentSeriesBase
+
+QUERY_METHODS: dict[type, tuple[str, ...]] = {
+    AccrualSeriesBase: ("accrue", "w_avg"),
+    BalanceSeriesBase: ("at",),
+    PaymentSeriesBase: ("over",),
+}
+
+_MISSING = object()
+
+
+class CycleError(RecursionError):
+    """A query was made again, with the same arguments, while it was still being evaluated."""
+
+    def __init__(self, cycle: list[str]):
+        super().__init__("Query cycle: " + " → ".join(cycle))
+        self.cycle = cycle
+
+
+def node_paths(node: Node, prefix: str = "") -> Iterator[tuple[str, Node]]:
+    """Yield `(dotted path, node)` for every node below `node`, e.g. `balance_sheet.assets.cash`."""
+    for field in fields(node):
+        child = getattr(node, field.name)
+        if isinstance(child, Node):
+            path = f"{prefix}{field.name}"
+            yield path, child
+            if is_dataclass(child):
+                yield from node_paths(child, f"{path}.")
+
+
+class QueryGuard:
+    """
+    Checks every `at`, `accrue`, `w_avg` and `over` query on any series while active.
+
+    A query that is made again with the same arguments before it returns raises `CycleError` with the chain of
+    queries that led back to it, named by each node's path in `model`. Series that are not attributes of the model
+    (e.g. sums of line items) are named by class. The guard also counts queries per node and records the deepest
+    chain of nested queries. A `RecursionError` raised while the guard is active gets a note with the most recent
+    queries on the chain.
+
+    ```python
+    with traeger as trg, QueryGuard(trg) as guard:
+        trg.balance_sheet.assets.cash.at(date(2026, 12, 31))
+    print(guard.max_depth, guard.calls.most_common(5))
+    ```
+    """
+
+    _active = False
+
+    def __init__(self, model: Node):
+        self.names = {id(node): path for path, node in node_paths(model)}
+        self.calls: Counter[str] = Counter()
+        self.max_depth = 0
+        self.deepest: list[str] = []
+        self._stack: list[str] = []
+        self._open: dict[tuple, int] = {}
+        self._patched: list[tuple[type, str, Any]] = []
+
+    def _label(self, node: Node, method: str, args: tuple) -> str:
+        name = self.names.get(id(node), f"<{type(node).__name__}>")
+        return f"{name}.{method}({', '.join(map(str, args))})"
+
+    def _wrap(self, method: str, query: Callable) -> Callable:
+        @wraps(query)
+        def guarded(node, *args, **kwargs):
+            label = self._label(node, method, args)
+            key = (id(node), method, args)
+            try:
+                hash(key)
+            except TypeError:
+                key = None
+
+            if key in self._open:
+                raise CycleError(self._stack[self._open[key] :] + [label])
+            if key is not None:
+                self._open[key] = len(self._stack)
+            self._stack.append(label)
+            self.calls[label.partition("(")[0]] += 1
+            if len(self._stack) > self.max_depth:
+                self.max_depth = len(self._stack)
+                self.deepest = self._stack[:]
+
+            try:
+                return query(node, *args, **kwargs)
+            except RecursionError as err:
+                if len(self._stack) == 1 and not isinstance(err, CycleError):
+                    err.add_note(f"Deepest query chain ({self.max_depth}) ends: " + " → ".join(self.deepest[-10:]))
+                raise
+            finally:
+                self._stack.pop()
+                if key is not None:
+                    del self._open[key]
+
+        return guarded
+
+    def __enter__(self) -> "QueryGuard":
+        if QueryGuard._active:
+            raise RuntimeError("Query guards cannot be nested")
+        QueryGuard._active = True
+        for cls, methods in QUERY_METHODS.items():
+            for method in methods:
+                self._patched.append((cls, method, cls.__dict__.get(method, _MISSING)))
+                setattr(cls, method, self._wrap(method, getattr(cls, method)))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for cls, method, original in reversed(self._patched):
+            if original is _MISSING:
+                delattr(cls, method)
+            else:
+                setattr(cls, method, original)
+        self._patched.clear()
+        QueryGuard._active = False
+
+    def report(self, top: int = 10) -> str:
+        """Markdown summary of query depth and the most queried nodes."""
+        lines = [f"Max query depth: {self.max_depth}", "", "| Node query | Calls |", "| --- | --- |"]
+        lines += [f"| {name} | {count:,} |" for name, count in self.calls.most_common(top)]
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    from datetime import date
+
+    from base_case import traeger
+
+    with traeger as trg, QueryGuard(trg) as guard:
+        trg.balance_sheet.assets.cash.at(date(2027, 12, 31))
+
+    print(guard.report())
+    print("\nDeepest chain ends:\n")
+    print("\n".join(f"- {label}" for label in guard.deepest[-5:]))
@@ -0,0 +1,72 @@
+from datetime import date
+from itertools import pairwise
+from typing import TYPE_CHECKING, Sequence
+
+from orcaset import Node
+from orcaset.financial import AccrualSeriesBase, BalanceSeriesBase, PaymentSeriesBase
+
+from model.grid import series_values
+from model.query import line_items
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+
+def materialize(node: Node, dates: Sequence[date]) -> dict[str, list[float]]:
+    """
+    Values of every line item below `node` for each period between consecutive `dates`.
+
+    Accruals are accrued and payments summed over each period. Balances are taken at each period end.
+    """
+    return {
+        path: series_values(item, dates)
+        for path, item in line_items(node)
+        if isinstance(item, (AccrualSeriesBase, PaymentSeriesBase, BalanceSeriesBase))
+    }
+
+
+def to_arrow(node: Node, dates: Sequence[date]) -> "pa.Table":
+    """
+    Arrow table with one row per period between consecutive `dates` and one float column per line item below `node`.
+
+    Requires `pyarrow`.
+    """
+    import pyarrow as pa
+
+    periods = list(pairwise(dates))
+    return pa.table(
+        {
+            "period_start": pa.array([start for start, _ in periods], pa.date32()),
+            "period_end": pa.array([end for _, end in periods], pa.date32()),
+            **{path: pa.array(values, pa.float64()) for path, values in materialize(node, dates).items()},
+        }
+    )
+
+
+def to_pandas(table: "pa.Table") -> "pd.DataFrame":
+    """Convert an exported table to a DataFrame indexed by period end, keeping each column in its own block."""
+    return table.to_pandas(split_blocks=True).set_index("period_end")
+
+
+def write_parquet(table: "pa.Table", path: str) -> None:
+    import pyarrow.parquet as pq
+
+    pq.write_table(table, path)
+
+
+if __name__ == "__main__":
+    from dateutil.relativedelta import relativedelta
+    from orcaset.financial import Period
+
+    from base_case import traeger
+
+    quarters = Period.series(date(2023, 12, 31), relativedelta(months=3, day=31), relativedelta(years=3))
+    dates = [date(2023, 12, 31)] + [end for _, end in quarters]
+
+    with traeger as trg:
+        table = to_arrow(trg.balance_sheet, dates)
+
+    write_parquet(table, "balance_sheet.parquet")
+    print(table.schema)
+    print(to_pandas(table).T)
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Sequence
+
+from orcaset.financial import Balance
+
+from base_case import Assumptions, build_traeger, scenario
+from model.grid import balances_at
+from model.model import Traeger
+
+
+@dataclass
+class Convergence:
+    """
+    Result of iterating interest on a debt path until the path stops changing.
+
+    Attributes:
+        model: Model built from the final debt path
+        iterations: Number of models built, including the final one
+        max_change: Largest change in debt at any date on the final iteration
+        converged: Whether `max_change` is within the tolerance
+        debt: Debt bearing the floating rate at each date on the final iteration
+    """
+
+    model: Traeger
+    iterations: int
+    max_change: float
+    converged: bool
+    debt: list[float]
+
+
+def converge(
+    dates: Sequence[date],
+    assumptions: type[Assumptions] = Assumptions,
+    tolerance: float = 0.01,
+    max_iterations: int = 25,
+) -> Convergence:
+    """
+    Solve for interest on the average of beginning and end of period debt at each of `dates`.
+
+    Interest on end of period debt depends on that debt through cash, so each iteration charges interest on the
+    previous iteration's debt path (starting from beginning of period balances) until no balance at `dates` moves by
+    more than `tolerance`. Iterations share the calibration already derived for `assumptions`.
+    """
+    path: tuple[Balance, ...] = ()
+    prior: list[float] | None = None
+
+    for iteration in range(1, max_iterations + 1):
+        model = build_traeger(scenario(assumptions, interest_mode="average", interest_debt_path=path))
+        with model as m:
+            debt = balances_at(m.income.pretax_income.interest_expense.rate_debt, dates)
+
+        max_change = max(abs(d1 - d2) for d1, d2 in zip(debt, prior)) if prior is not None else float("inf")
+        if max_change <= tolerance or iteration == max_iterations:
+            return Convergence(model, iteration, max_change, max_change <= tolerance, debt)
+
+        path, prior = tuple(Balance(dt, value) for dt, value in zip(dates, debt)), debt
+
+    raise ValueError("max_iterations must be at least 1")
+
+
+if __name__ == "__main__":
+    from dateutil.relativedelta import relativedelta
+    from orcaset.financial import Period
+
+    from model.grid import accrue_grid
+
+    start = Assumptions.start_date
+    dates = [start] + [end for _, end in Period.series(start, relativedelta(months=3, day=31), relativedelta(years=5))]
+
+    with build_traeger() as m:
+        beginning = accrue_grid(m.income.pretax_income.interest_expense, dates)
+
+    result = converge(dates)
+    with result.model as m:
+        average = accrue_grid(m.income.pretax_income.interest_expense, dates)
+
+    print(f"Converged: {result.converged} after {result.iterations} iterations (max change {result.max_change:,.4f})\n")
+    print("| Period End | Beginning Balance Interest | Average Balance Interest | Revolver |")
+    print("| --- | --- | --- | --- |")
+    for dt, beg, avg, debt in zip(dates[1:], beginning, average, result.debt[1:]):
+        print(f"| {dt} | {beg:,.0f} | {avg:,.0f} | {debt:,.0f} |")
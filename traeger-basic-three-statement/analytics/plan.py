@@ -0,0 +1,286 @@
+"""
+Compiled evaluation plans for repeated scenario runs.
+
+`compile_plan` evaluates the model once with `Traced` assumptions, which record every arithmetic operation on values
+derived from them. The recorded operations that reach the targets are emitted as one straight-line Python function,
+so a scenario run is a single call doing float arithmetic, without building the node tree or iterating any series.
+The plan repeats the operations of the model evaluation in the same order, so it produces identical numbers.
+
+A plan is specific to the model structure and the periods queried when it was compiled. Values that do not depend
+on the traced assumptions are folded into the plan as constants, and a branch on a traced value (other than
+`model.numeric.minimum`) cannot be compiled.
+"""
+
+import math
+from numbers import Real
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Sequence
+
+from model.curves import StepCurve
+
+if TYPE_CHECKING:
+    from base_case import Assumptions
+    from model.model import Traeger
+
+type Target = Callable[["Traeger"], Any]
+
+_TEMPLATES = {
+    "+": "{} + {}",
+    "-": "{} - {}",
+    "*": "{} * {}",
+    "/": "{} / {}",
+    "**": "{} ** {}",
+    "neg": "-{}",
+    "abs": "abs({})",
+    "min": "min({}, {})",
+}
+
+
+class Tape:
+    """Operations recorded while tracing, in evaluation order, including reading each input."""
+
+    def __init__(self):
+        self.inputs: list[str] = []
+        self.ops: list[tuple[str, tuple[Any, ...]]] = []
+
+    def input(self, label: str) -> "Traced":
+        self.inputs.append(label)
+        return self.record("input", len(self.inputs) - 1)
+
+    def record(self, op: str, *args: Any) -> "Traced":
+        self.ops.append((op, args))
+        return Traced(self, len(self.ops) - 1)
+
+
+class Traced:
+    """
+    Value computed from traced assumptions, standing for operation `index` of `tape`.
+
+    Arithmetic with floats and other traced values is recorded. Traced values cannot be ordered or converted to
+    `bool`, since the plan would not know which branch to take for other assumptions.
+    """
+
+    __slots__ = ("tape", "index")
+
+    def __init__(self, tape: Tape, index: int):
+        self.tape = tape
+        self.index = index
+
+    def _record(self, op: str, *args: Any) -> "Traced":
+        if not all(isinstance(arg, (Traced, Real)) for arg in args):
+            return NotImplemented
+        return self.tape.record(op, *args)
+
+    def __add__(self, other):
+        return self._record("+", self, other)
+
+    def __radd__(self, other):
+        return self._record("+", other, self)
+
+    def __sub__(self, other):
+        return self._record("-", self, other)
+
+    def __rsub__(self, other):
+        return self._record("-", other, self)
+
+    def __mul__(self, other):
+        return self._record("*", self, other)
+
+    def __rmul__(self, other):
+        return self._record("*", other, self)
+
+    def __truediv__(self, other):
+        return self._record("/", self, other)
+
+    def __rtruediv__(self, other):
+        return self._record("/", other, self)
+
+    def __pow__(self, other):
+        return self._record("**", self, other)
+
+    def __neg__(self) -> "Traced":
+        return self.tape.record("neg", self)
+
+    def __pos__(self) -> "Traced":
+        return self
+
+    def __abs__(self) -> "Traced":
+        return self.tape.record("abs", self)
+
+    def __bool__(self) -> bool:
+        raise TypeError("A branch depends on a traced assumption, so the evaluation cannot be compiled")
+
+    def __lt__(self, other):
+        return self.__bool__()
+
+    __le__ = __gt__ = __ge__ = __lt__
+
+    def __repr__(self) -> str:
+        return f"Traced({self.index})"
+
+    @staticmethod
+    def minimum(a: "Traced | float", b: "Traced | float") -> "Traced":
+        tape = a.tape if isinstance(a, Traced) else b.tape  # type: ignore[union-attr]
+        return tape.record("min", a, b)
+
+
+def _literal(value: Any) -> str:
+    if isinstance(value, float) and not math.isfinite(value):
+        return f"float({str(value)!r})"
+    return repr(value)
+
+
+def _trace_input(tape: Tape, value: Any, name: str) -> Any:
+    if isinstance(value, StepCurve):
+        rates = [tape.input(f"{name}[{i}]") for i in range(len(value.rates))]
+        return StepCurve(value.starts, rates, value.yf)
+    return tape.input(name)
+
+
+def _flatten(value: Any, name: str, template: Any) -> list[Any]:
+    if isinstance(template, StepCurve):
+        if not isinstance(value, StepCurve) or value.starts != template.starts:
+            raise ValueError(f"{name} must be a step curve with the start dates the plan was compiled with")
+        return value.rates
+    return [value]
+
+
+class Plan:
+    """
+    Straight-line function from assumption values to target values.
+
+    Attributes:
+        names: Assumptions the plan takes, defaulting to their compiled values.
+        targets: Target names, in the order of `run` results.
+        source: Python source of the compiled function.
+        operations: Operations in the compiled function.
+    """
+
+    def __init__(self, names: Sequence[str], defaults: Mapping[str, Any], targets: Mapping[str, Any], tape: Tape):
+        self.names = list(names)
+        self.defaults = dict(defaults)
+        self.targets = list(targets)
+        self._shapes = {name: isinstance(value, (list, tuple)) for name, value in targets.items()}
+
+        outputs = [value if self._shapes[name] else [value] for name, value in targets.items()]
+
+        # Keep only the operations the targets depend on
+        live = [False] * len(tape.ops)
+        for value in (v for values in outputs for v in values):
+            if isinstance(value, Traced):
+                live[value.index] = True
+        for i in reversed(range(len(tape.ops))):
+            if live[i]:
+                for arg in tape.ops[i][1]:
+                    if isinstance(arg, Traced):
+                        live[arg.index] = True
+
+        # Operations repeated on the same operands (e.g. a rate looked up by several line items) are emitted once
+        lines = ["def kernel(x):"]
+        variables: dict[int, str] = {}
+        emitted: dict[str, str] = {}
+
+        def literal(value: Any) -> str:
+            return variables[value.index] if isinstance(value, Traced) else _literal(value)
+
+        for i, (op, args) in enumerate(tape.ops):
+            if not live[i]:
+                continue
+            expression = f"x[{args[0]}]" if op == "input" else _TEMPLATES[op].format(*map(literal, args))
+            if expression not in emitted:
+                emitted[expression] = f"v{i}"
+                lines.append(f"    v{i} = {expression}")
+            variables[i] = emitted[expression]
+        returns = ("[" + ", ".join(map(literal, values)) + "]" for values in outputs)
+        lines.append(f"    return [{', '.join(returns)}]")
+
+        self.operations = len(lines) - 2
+        self.source = "\n".join(lines)
+        namespace: dict[str, Any] = {}
+        exec(compile(self.source, "<plan>", "exec"), namespace)
+        self._kernel: Callable[[list[Any]], list[list[Any]]] = namespace["kernel"]
+
+    def run(self, **values: Any) -> dict[str, Any]:
+        """
+        Target values with assumptions in `values` and the compiled values for the rest.
+
+        Step curves must have the start dates they were compiled with.
+        """
+        unknown = [name for name in values if name not in self.defaults]
+        if unknown:
+            raise ValueError(f"The plan does not take: {', '.join(unknown)}")
+
+        x = []
+        for name in self.names:
+            x += _flatten(values.get(name, self.defaults[name]), name, self.defaults[name])
+        results = self._kernel(x)
+        return {name: result if self._shapes[name] else result[0] for name, result in zip(self.targets, results)}
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return [_unwrap(v) for v in value]
+    return value if isinstance(value, (Traced, Real)) else getattr(value, "value", value)
+
+
+def compile_plan(
+    targets: Mapping[str, Target], names: Sequence[str], assumptions: type["Assumptions"] | None = None
+) -> Plan:
+    """
+    Trace one evaluation of `targets` with the assumptions in `names` as inputs and compile it to a `Plan`.
+
+    Each target takes a model and returns a value, a `.value` holder such as a `Balance`, or a list of them (e.g.
+    `balances_at` over a date grid). Assumptions not in `names` are fixed at their values in `assumptions`.
+
+    ```python
+    plan = compile_plan({"cash": lambda m: balances_at(m.balance_sheet.assets.cash, dates)}, ["tax_rate"])
+    plan.run(tax_rate=0.25)["cash"]
+    ```
+    """
+    from base_case import Assumptions, build_traeger, scenario
+
+    assumptions = assumptions or Assumptions
+    defaults = {name: getattr(assumptions, name) for name in names}
+    tape = Tape()
+    traced = {name: _trace_input(tape, value, name) for name, value in defaults.items()}
+
+    with build_traeger(scenario(assumptions, **traced)) as m:
+        results = {name: _unwrap(target(m)) for name, target in targets.items()}
+    return Plan(names, defaults, results, tape)
+
+
+if __name__ == "__main__":
+    import time
+    from datetime import date
+
+    from dateutil.relativedelta import relativedelta
+
+    from base_case import build_traeger, scenario
+    from model.grid import accrue_grid, balances_at
+
+    dates = [date(2024, 12, 31) + relativedelta(months=3 * i, day=31) for i in range(13)]
+    targets: dict[str, Target] = {
+        "cash": lambda m: balances_at(m.balance_sheet.assets.cash, dates[1:]),
+        "net_income": lambda m: accrue_grid(m.income, dates),
+    }
+    names = ["revenue_growth_rates", "cost_of_revenue_pct_revenue", "tax_rate", "interest_rate"]
+
+    start = time.perf_counter()
+    plan = compile_plan(targets, names)
+    compile_time = time.perf_counter() - start
+    print(f"Compiled {plan.operations:,} operations in {compile_time:.2f} s\n")
+
+    tax_rates = [0.15 + 0.001 * i for i in range(50)]
+
+    start = time.perf_counter()
+    planned = [plan.run(tax_rate=rate) for rate in tax_rates]
+    plan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    modeled = []
+    for rate in tax_rates:
+        with build_traeger(scenario(tax_rate=rate)) as m:
+            modeled.append({name: target(m) for name, target in targets.items()})
+    model_time = time.perf_counter() - start
+
+    print("| Runs | Model (s) | Plan (s) | Identical |\n| --- | --- | --- | --- |")
+    print(f"| {len(tax_rates)} | {model_time:.2f} | {plan_time:.4f} | {planned == modeled} |")
@@ -0,0 +1,81 @@
+from datetime import date
+from typing import Iterable, Sequence
+
+from dateutil.relativedelta import relativedelta
+from orcaset.financial import Accrual
+
+from model.grid import cumulative
+
+
+def _window_sums(series: Iterable[Accrual], windows: Sequence[tuple[date, date]]) -> list[float]:
+    """Accrued value of `series` over each `(start, end)` window from one prefix integral on their union grid."""
+    grid = sorted({dt for window in windows for dt in window})
+    index = {dt: i for i, dt in enumerate(grid)}
+    cum = cumulative(series, grid)
+    return [cum[index[end]] - cum[index[start]] for start, end in windows]
+
+
+def trailing(series: Iterable[Accrual], dates: Sequence[date], window: relativedelta) -> list[float]:
+    """Accrued value of `series` over the `window` ending on each of `dates`."""
+    return _window_sums(series, [(dt - window, dt) for dt in dates])
+
+
+def ltm(series: Iterable[Accrual], dates: Sequence[date]) -> list[float]:
+    """Last twelve months value of `series` as of each of `dates`."""
+    return trailing(series, dates, relativedelta(years=1))
+
+
+def ytd(
+    series: Iterable[Accrual], dates: Sequence[date], year_end: relativedelta = relativedelta(month=12, day=31)
+) -> list[float]:
+    """Year-to-date value of `series` as of each of `dates` for a fiscal year ending on `year_end`."""
+    windows = []
+    for dt in dates:
+        start = dt + year_end
+        if start >= dt:
+            start -= relativedelta(years=1)
+        windows.append((start, dt))
+    return _window_sums(series, windows)
+
+
+def growth(
+    series: Iterable[Accrual],
+    dates: Sequence[date],
+    freq: relativedelta = relativedelta(months=3, day=31),
+    lag: relativedelta | None = None,
+) -> list[float]:
+    """
+    Growth of the `freq` period ending on each of `dates` over the same length period `lag` earlier.
+
+    `lag` defaults to `freq` (e.g. QoQ growth). Pass `lag=relativedelta(years=1)` for YoY growth of quarterly
+    values. Growth is `nan` where the comparison period value is zero.
+    """
+    lag = lag or freq
+    current = [(dt - freq, dt) for dt in dates]
+    prior = [(start - lag, end - lag) for start, end in current]
+    values = _window_sums(series, current + prior)
+    return [cur / prev - 1 if prev else float("nan") for cur, prev in zip(values[: len(dates)], values[len(dates) :])]
+
+
+if __name__ == "__main__":
+    from orcaset.financial import Period
+
+    from base_case import traeger
+
+    quarters = Period.series(date(2023, 12, 31), relativedelta(months=3, day=31), relativedelta(years=4))
+    dates = [end for _, end in quarters]
+
+    with traeger as trg:
+        operating_income = trg.income.pretax_income.operating_income
+        rows = {
+            "LTM Operating Income": ltm(operating_income, dates),
+            "LTM Net Income": ltm(trg.income, dates),
+            "YTD Revenue": ytd(operating_income.gross_profit.revenue, dates),
+            "QoQ Revenue Growth": growth(operating_income.gross_profit.revenue, dates),
+        }
+
+    print("| Line Item | " + " | ".join(dt.isoformat() for dt in dates) + " |")
+    print("| " + " | ".join(["---"] * (len(dates) + 1)) + " |")
+    for name, values in rows.items():
+        fmt = "{:.1%}" if "Growth" in name else "{:,.0f}"
+        print(f"| {name} | " + " | ".join(fmt.format(v) for v in values) + " |")
@@ -0,0 +1,104 @@
+"""
+Monthly line items rolled up to calendar quarters and years.
+
+Line items are materialized once on a monthly grid with the single-pass helpers in `model.grid`, which pro-rate
+quarterly and annual accruals to months as they go. Quarterly and annual views are then sums (flows) or period-end
+values (balances) of the monthly results over precomputed month ranges, without querying the model again.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import accumulate
+from typing import Literal, Sequence
+
+from dateutil.relativedelta import relativedelta
+from orcaset.financial import AccrualSeriesBase, BalanceSeriesBase, PaymentSeriesBase
+
+from model.grid import series_values
+
+type Rollup = Literal["quarter", "year"]
+
+_PERIOD_MONTHS = {"quarter": 3, "year": 12}
+
+
+@dataclass
+class Calendar:
+    """
+    Month-end grid from `start` for `months` months.
+
+    Attributes:
+        start: First date of the grid, a month end.
+        months: Number of monthly periods.
+        dates: `start` and each following month end.
+    """
+
+    start: date
+    months: int
+    dates: list[date] = field(init=False)
+    _ranges: dict[str, list[tuple[date, int, int]]] = field(init=False, default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self.dates = [self.start + relativedelta(months=i, day=31) for i in range(self.months + 1)]
+
+    def ranges(self, rollup: Rollup) -> list[tuple[date, int, int]]:
+        """
+        `(end date, first month, last month + 1)` for each calendar quarter or year in the grid.
+
+        Months index the monthly periods, so a range sums `values[first:last]`. Periods only partly in the grid are
+        included with the months that are.
+        """
+        if rollup not in self._ranges:
+            n = _PERIOD_MONTHS[rollup]
+            ranges, first = [], 0
+            for i, end in enumerate(self.dates[1:]):
+                if end.month % n == 0 or i == self.months - 1:
+                    ranges.append((end, first, i + 1))
+                    first = i + 1
+            self._ranges[rollup] = ranges
+        return self._ranges[rollup]
+
+    def values(self, series: AccrualSeriesBase | PaymentSeriesBase | BalanceSeriesBase) -> list[float]:
+        """Monthly values of a line item: accrued or paid over each month, or the balance at each month end."""
+        return series_values(series, self.dates)
+
+    def rollup(self, values: Sequence[float], rollup: Rollup, balance: bool = False) -> list[float]:
+        """
+        Monthly `values` rolled up to calendar quarters or years.
+
+        Flows are summed over each period. Balances (`balance=True`) take the value at the period end.
+        """
+        ranges = self.ranges(rollup)
+        if balance:
+            return [values[last - 1] for _, _, last in ranges]
+        totals = list(accumulate(values, initial=0.0))
+        return [totals[last] - totals[first] for _, first, last in ranges]
+
+
+if __name__ == "__main__":
+    import time
+
+    from base_case import build_traeger, scenario
+
+    calendar = Calendar(date(2024, 12, 31), 36)
+    revolver_limit = 100_000
+
+    timings = {}
+    for frequency in ("quarterly", "monthly"):
+        start = time.perf_counter()
+        with build_traeger(scenario(frequency=frequency)) as m:
+            cash = calendar.values(m.balance_sheet.assets.cash)
+            revolver = calendar.values(m.balance_sheet.liabilities.revolver)
+            net_income = calendar.values(m.income)
+        timings[frequency] = time.perf_counter() - start
+
+    print("## Monthly revolver availability\n")
+    print("| Month | Cash | Revolver | Available |\n| --- | --- | --- | --- |")
+    for dt, c, r in zip(calendar.dates[1:], cash, revolver):
+        print(f"| {dt} | {c:,.0f} | {r:,.0f} | {revolver_limit - r:,.0f} |")
+
+    print("\n## Net income by quarter and year\n")
+    for rollup in ("quarter", "year"):
+        ends = [end for end, _, _ in calendar.ranges(rollup)]
+        print(" | ".join(f"{end}: {v:,.0f}" for end, v in zip(ends, calendar.rollup(net_income, rollup))))
+
+    print(f"\nQuarterly model: {timings['quarterly']:.2f} s, monthly model: {timings['monthly']:.2f} s")
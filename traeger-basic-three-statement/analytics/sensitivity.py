@@ -0,0 +1,170 @@
+"""
+One-at-a-time sensitivities of a model output to its assumptions, reported as a tornado table.
+
+Each assumption is bumped up and down by a relative or absolute amount. The base case and every bumped case are
+evaluated together in a single model as lanes of a `Paths` value, so line items that do not depend on any bumped
+assumption are evaluated once as plain floats, and the rest once per period for all cases rather than once per case.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from numbers import Real
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Sequence
+
+from analytics.stochastic import Paths
+from model.curves import StepCurve
+
+if TYPE_CHECKING:
+    from base_case import Assumptions
+    from model.model import Traeger
+
+type Target = Callable[["Traeger"], Any]
+
+
+@dataclass(frozen=True)
+class Sensitivity:
+    """
+    Target output with one assumption bumped down and up.
+
+    Attributes:
+        assumption: Assumption attribute name.
+        down: Target value with the assumption bumped down.
+        up: Target value with the assumption bumped up.
+    """
+
+    assumption: str
+    down: float
+    up: float
+
+    @property
+    def swing(self) -> float:
+        return abs(self.up - self.down)
+
+
+@dataclass
+class Tornado:
+    """
+    Sensitivities of a target output ordered by swing, largest first.
+
+    Attributes:
+        base: Target value in the base case.
+        sensitivities: One per bumped assumption.
+    """
+
+    base: float
+    sensitivities: list[Sensitivity] = field(default_factory=list)
+
+    def report(self) -> str:
+        """Markdown tornado table with the change from base in each direction."""
+        lines = [f"Base: {self.base:,.0f}", "", "| Assumption | Down | Up | Δ Down | Δ Up |"]
+        lines.append("| --- | --- | --- | --- | --- |")
+        for s in self.sensitivities:
+            change = f"{s.down - self.base:+,.0f} | {s.up - self.base:+,.0f}"
+            lines.append(f"| {s.assumption} | {s.down:,.0f} | {s.up:,.0f} | {change} |")
+        return "\n".join(lines)
+
+
+def _bump(value: Any, delta: float, rel: bool) -> Any:
+    """`value` bumped by `delta`, or by `delta` times itself if `rel`. Curves are bumped at every rate."""
+    if isinstance(value, StepCurve):
+        return StepCurve(value.starts, [_bump(rate, delta, rel) for rate in value.rates], value.yf)
+    if isinstance(value, Real) and not isinstance(value, bool):
+        return value + (delta * value if rel else delta)
+    raise TypeError(f"Cannot bump {type(value).__name__} assumption")
+
+
+def _lanes(values: Sequence[Any]) -> Any:
+    """One value carrying each of `values` in its own lane, combining curves rate by rate."""
+    if isinstance(values[0], StepCurve):
+        curve = values[0]
+        rates = [_lanes([v.rates[k] for v in values]) for k in range(len(curve.rates))]
+        return StepCurve(curve.starts, rates, curve.yf)
+    return Paths(values)
+
+
+def scenarios(
+    names: Sequence[str], rel: float, absolute: Mapping[str, float], assumptions: type["Assumptions"]
+) -> list[dict[str, Any]]:
+    """Overrides for the base case followed by the down and up case of each assumption in `names`."""
+    cases: list[dict[str, Any]] = [{}]
+    for name in names:
+        value = getattr(assumptions, name)
+        for sign in (-1, 1):
+            if name in absolute:
+                cases.append({name: _bump(value, sign * absolute[name], rel=False)})
+            else:
+                cases.append({name: _bump(value, sign * rel, rel=True)})
+    return cases
+
+
+def tornado(
+    target: Target,
+    names: Sequence[str],
+    rel: float = 0.1,
+    absolute: Mapping[str, float] | None = None,
+    assumptions: type["Assumptions"] | None = None,
+    batched: bool = True,
+) -> Tornado:
+    """
+    Bump each assumption in `names` down and up and evaluate `target` on the resulting models.
+
+    Assumptions are bumped by `rel` times their base value, or by a fixed amount for names in `absolute` (use this
+    for assumptions that are zero in the base case). Step curves are bumped at every rate. `target` takes a model and
+    returns a float or a `.value` holder such as a `Balance`, e.g.
+    `lambda m: m.balance_sheet.assets.cash.at(date(2027, 12, 31))`.
+
+    With `batched`, every case is evaluated in one model. Assumptions that feed a comparison on model values (other
+    than `model.numeric.minimum`) cannot be batched and raise `TypeError`; pass `batched=False` to build one model per
+    case instead.
+    """
+    from base_case import Assumptions, build_traeger, scenario
+
+    assumptions = assumptions or Assumptions
+    cases = scenarios(names, rel, absolute or {}, assumptions)
+
+    def evaluate(overrides: dict[str, Any]) -> Any:
+        with build_traeger(scenario(assumptions, **overrides)) as m:
+            result = target(m)
+        return getattr(result, "value", result)
+
+    if batched:
+        overrides = {}
+        for name in names:
+            base = getattr(assumptions, name)
+            overrides[name] = _lanes([case.get(name, base) for case in cases])
+        result = evaluate(overrides)
+        values = list(result) if isinstance(result, Paths) else [float(result)] * len(cases)
+    else:
+        values = [float(evaluate(case)) for case in cases]
+
+    sensitivities = [Sensitivity(name, values[2 * i + 1], values[2 * i + 2]) for i, name in enumerate(names)]
+    return Tornado(values[0], sorted(sensitivities, key=lambda s: s.swing, reverse=True))
+
+
+NAMES = (
+    "revenue_growth_rates",
+    "cost_of_revenue_pct_revenue",
+    "sales_and_marketing_pct_revenue",
+    "general_and_admin_growth_rates",
+    "interest_rate",
+    "annual_other_income",
+    "tax_rate",
+    "receivables_pct_revenue",
+    "inventory_pct_cost_of_revenue",
+    "accounts_payable_pct_cost_of_revenue",
+    "accrued_expenses_pct_cost_of_revenue",
+    "depreciation_growth_rate",
+    "capital_expenditures_growth_rate",
+)
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    result = tornado(lambda m: m.balance_sheet.assets.cash.at(date(2027, 12, 31)), NAMES)
+    elapsed = time.perf_counter() - start
+
+    print("## Cash at 2027-12-31, assumptions bumped ±10%\n")
+    print(result.report())
+    print(f"\n{len(NAMES)} assumptions, {1 + 2 * len(NAMES)} cases in one batched evaluation: {elapsed:.2f} s")
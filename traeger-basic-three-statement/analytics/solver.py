@@ -0,0 +1,254 @@
+"""
+Goal seek and multi-assumption solves over the Traeger model.
+
+The targets are compiled once into a `Plan` of the arithmetic from the solved assumptions to the targets (see
+`analytics.plan`). Each iteration runs the plan with `Dual` inputs (see `analytics.autodiff`), which gives the
+residuals and their exact derivatives together without rebuilding or re-evaluating any line item, and takes a Newton
+step.
+
+Targets that branch on a model value (e.g. `max` over dates) cannot be compiled. For those, each iteration evaluates
+the targets on a new model built with `Dual` assumptions, which recomputes every projected line item the targets
+read, upstream or not. Iterations are scenarios of the base assumptions (`base_case.scenario`), so only the
+historicals and calibration are shared between them.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Sequence
+
+from analytics.autodiff import Dual, gradients
+from analytics.plan import Plan, compile_plan
+from model.curves import StepCurve
+
+if TYPE_CHECKING:
+    from base_case import Assumptions
+    from model.model import Traeger
+
+type Target = Callable[["Traeger"], Any]
+
+
+@dataclass
+class Solution:
+    """
+    Attributes:
+        values: Solved value of each assumption. Step curves are solved for a parallel shift of all of their rates,
+                which is reported in place of the curve.
+        residuals: Target value less its goal for each target at the solution.
+        iterations: Evaluations of the residuals and their derivatives made, each a run of the compiled plan or, for
+                    targets that cannot be compiled, a model evaluation.
+        converged: Whether every residual is within tolerance.
+    """
+
+    values: dict[str, float]
+    residuals: list[float]
+    iterations: int
+    converged: bool
+
+
+def _initial(value: Any) -> float:
+    return 0.0 if isinstance(value, StepCurve) else float(value)
+
+
+def _at(value: Any, x: float) -> Any:
+    """Assumption `value` set to `x`, or shifted by `x` if it is a step curve."""
+    if isinstance(value, StepCurve):
+        return StepCurve(value.starts, [rate + x for rate in value.rates], value.yf)
+    return x
+
+
+class _Problem:
+    """
+    Residuals of `targets` and their Jacobian with respect to `names`, evaluated at assumption values.
+
+    Attributes:
+        plan: Compiled targets, or `None` if they branch on a model value and are evaluated on the model instead.
+    """
+
+    def __init__(self, targets: Sequence[tuple[Target, float]], names: Sequence[str], assumptions: type["Assumptions"]):
+        self.targets = targets
+        self.names = names
+        self.assumptions = assumptions
+        self.evaluations = 0
+        try:
+            self.plan: Plan | None = compile_plan({str(i): t for i, (t, _) in enumerate(targets)}, names, assumptions)
+        except TypeError:
+            self.plan = None
+
+    def _results(self, x: Sequence[float]) -> list[Dual]:
+        from base_case import scenario
+
+        if self.plan is not None:
+            values = {
+                name: _at(getattr(self.assumptions, name), Dual(xi, {name: 1.0})) for name, xi in zip(self.names, x)
+            }
+            try:
+                results = self.plan.run(**values)
+            except TypeError:
+                # An operation the plan compiled from traced values is not defined for `Dual` (e.g. a traced exponent)
+                self.plan = None
+            else:
+                return [result if isinstance(result, Dual) else Dual(result) for result in results.values()]
+
+        values = {name: _at(getattr(self.assumptions, name), xi) for name, xi in zip(self.names, x)}
+        return gradients([target for target, _ in self.targets], self.names, scenario(self.assumptions, **values))
+
+    def __call__(self, x: Sequence[float]) -> tuple[list[float], list[list[float]]]:
+        results = self._results(x)
+        self.evaluations += 1
+        residuals = [result.value - goal for result, (_, goal) in zip(results, self.targets)]
+        return residuals, [[result.d(name) for name in self.names] for result in results]
+
+
+def _linear_solve(a: list[list[float]], b: list[float]) -> list[float]:
+    """Solution of `a x = b` by Gaussian elimination with partial pivoting."""
+    n = len(b)
+    m = [row[:] + [bi] for row, bi in zip(a, b)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(m[r][col]))
+        if m[pivot][col] == 0:
+            raise ValueError("Targets do not depend on the assumptions independently")
+        m[col], m[pivot] = m[pivot], m[col]
+        for r in range(col + 1, n):
+            factor = m[r][col] / m[col][col]
+            for c in range(col, n + 1):
+                m[r][c] -= factor * m[col][c]
+    x = [0.0] * n
+    for r in reversed(range(n)):
+        x[r] = (m[r][n] - sum(m[r][c] * x[c] for c in range(r + 1, n))) / m[r][r]
+    return x
+
+
+def solve(
+    targets: Sequence[tuple[Target, float]],
+    names: Sequence[str],
+    bounds: Mapping[str, tuple[float, float]] | None = None,
+    tolerance: float = 1e-6,
+    max_iterations: int = 50,
+    assumptions: type["Assumptions"] | None = None,
+) -> Solution:
+    """
+    Values of the assumptions in `names` at which each `(target, goal)` in `targets` reaches its goal.
+
+    Takes damped Newton steps from the current assumption values, halving any step that does not reduce the largest
+    residual, and keeps each assumption within its `bounds`. Stops, not converged, at the best values found if ten
+    halvings do not reduce it. A residual is within tolerance when it is at most `tolerance` times the larger of 1
+    and its goal. Needs one target per assumption.
+
+    ```python
+    solve(
+        [(lambda m: m.income.accrue(date(2026, 12, 31), date(2027, 12, 31)), 50_000),
+         (lambda m: m.balance_sheet.assets.cash.at(date(2027, 12, 31)), 25_000)],
+        ["revenue_growth_rates", "min_cash"],
+    )
+    ```
+    """
+    from base_case import Assumptions
+
+    if len(targets) != len(names):
+        raise ValueError(f"Cannot solve {len(targets)} targets for {len(names)} assumptions")
+    assumptions = assumptions or Assumptions
+    bounds = bounds or {}
+    problem = _Problem(targets, names, assumptions)
+    limits = [bounds.get(name, (float("-inf"), float("inf"))) for name in names]
+    scales = [tolerance * max(1.0, abs(goal)) for _, goal in targets]
+
+    def clip(x: list[float]) -> list[float]:
+        return [min(max(xi, lo), hi) for xi, (lo, hi) in zip(x, limits)]
+
+    def error(residuals: list[float]) -> float:
+        return max(abs(r) / s for r, s in zip(residuals, scales))
+
+    x = clip([_initial(getattr(assumptions, name)) for name in names])
+    residuals, jacobian = problem(x)
+    while error(residuals) > 1 and problem.evaluations < max_iterations:
+        step = _linear_solve(jacobian, [-r for r in residuals])
+        improved = False
+        for _ in range(10):
+            trial = clip([xi + si for xi, si in zip(x, step)])
+            trial_residuals, trial_jacobian = problem(trial)
+            improved = error(trial_residuals) < error(residuals)
+            if improved or problem.evaluations >= max_iterations:
+                break
+            step = [si / 2 for si in step]
+        if not improved:
+            # No step along the Newton direction reduces the residuals, so stop at the best point found
+            break
+        x, residuals, jacobian = trial, trial_residuals, trial_jacobian
+
+    return Solution(dict(zip(names, x)), residuals, problem.evaluations, error(residuals) <= 1)
+
+
+def goal_seek(
+    target: Target,
+    name: str,
+    goal: float,
+    bracket: tuple[float, float] | None = None,
+    tolerance: float = 1e-6,
+    max_iterations: int = 50,
+    assumptions: type["Assumptions"] | None = None,
+) -> Solution:
+    """
+    Value of assumption `name` at which `target` reaches `goal`.
+
+    With a `bracket` of assumption values where the target is on either side of the goal, takes Newton steps that
+    stay inside the bracket and bisects otherwise, shrinking the bracket each iteration, so it always converges.
+    Without one, see `solve`.
+    """
+    from base_case import Assumptions
+
+    if bracket is None:
+        return solve([(target, goal)], [name], None, tolerance, max_iterations, assumptions)
+
+    assumptions = assumptions or Assumptions
+    problem = _Problem([(target, goal)], [name], assumptions)
+    scale = tolerance * max(1.0, abs(goal))
+
+    lo, hi = bracket
+    (r_lo,), _ = problem([lo])
+    (r_hi,), _ = problem([hi])
+    if r_lo * r_hi > 0:
+        raise ValueError(f"{name} between {lo} and {hi} does not bracket the goal")
+    if abs(r_lo) <= scale or abs(r_hi) <= scale:
+        x, r = (lo, r_lo) if abs(r_lo) <= abs(r_hi) else (hi, r_hi)
+        return Solution({name: x}, [r], problem.evaluations, True)
+
+    x = min(max(_initial(getattr(assumptions, name)), min(lo, hi)), max(lo, hi))
+    while problem.evaluations < max_iterations:
+        (r,), ((dr,),) = problem([x])
+        if abs(r) <= scale:
+            return Solution({name: x}, [r], problem.evaluations, True)
+        if (r < 0) == (r_lo < 0):
+            lo, r_lo = x, r
+        else:
+            hi = x
+        newton = x - r / dr if dr else None
+        x = newton if newton is not None and min(lo, hi) < newton < max(lo, hi) else (lo + hi) / 2
+
+    return Solution({name: x}, [r], problem.evaluations, False)
+
+
+if __name__ == "__main__":
+    from datetime import date
+
+    from dateutil.relativedelta import relativedelta
+
+    def peak_revolver(m: "Traeger") -> Any:
+        quarter_ends = [date(2025, 3, 31) + relativedelta(months=3 * i, day=31) for i in range(1, 12)]
+        return max(m.balance_sheet.liabilities.revolver.at(dt) for dt in quarter_ends)
+
+    limit = 50_000
+    result = goal_seek(peak_revolver, "revenue_growth_rates", limit, bracket=(-0.2, 0.2))
+    print(f"## Revenue growth shift for a peak revolver of {limit:,} through 2027\n")
+    print(f"Shift: {result.values['revenue_growth_rates']:+.4%} ({result.iterations} evaluations)\n")
+
+    def net_income_2027(m: "Traeger") -> Any:
+        return m.income.accrue(date(2026, 12, 31), date(2027, 12, 31))
+
+    def cash_2027(m: "Traeger") -> Any:
+        return m.balance_sheet.assets.cash.at(date(2027, 12, 31))
+
+    result = solve([(net_income_2027, 40_000), (cash_2027, 20_000)], ["cost_of_revenue_pct_revenue", "min_cash"])
+    print("## 2027 net income of 40,000 and cash of 20,000\n")
+    print("| Assumption | Value |\n| --- | --- |")
+    for name, value in result.values.items():
+        print(f"| {name} | {value:,.4f} |")
+    print(f"\n{result.iterations} evaluations, converged: {result.converged}")
@@ -0,0 +1,254 @@
+"""
+Monte Carlo scenarios driven by stochastic growth rates.
+
+Every simulated path is carried through a single model tree as a `Paths` value, so each line item is evaluated once
+per period rather than once per path. Values in the model are ordinary arithmetic on floats, so they accept `Paths`
+unchanged; the only branch on a value (the revolver draw) uses `model.numeric.minimum`.
+"""
+
+import math
+import operator
+import random
+from dataclasses import dataclass
+from datetime import date
+from numbers import Real
+from typing import Callable, Iterator, Sequence
+
+from model.curves import StepCurve
+
+
+class Paths:
+    """
+    One value per simulated path, with elementwise arithmetic.
+
+    Floats broadcast against every path. `Paths` cannot be ordered as a whole, so use `Paths.minimum` or
+    `model.numeric.minimum` in place of `min`, and `model.numeric.divide` for ratios to positive values only.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: Sequence[float]):
+        self.values = list(values)
+
+    def _zip(self, other: "Paths | float", op: Callable[[float, float], float]) -> "Paths":
+        if isinstance(other, Paths):
+            if len(other.values) != len(self.values):
+                raise ValueError(f"Cannot combine {len(self.values)} paths with {len(other.values)} paths")
+            return Paths([op(a, b) for a, b in zip(self.values, other.values)])
+        if isinstance(other, Real):
+            return Paths([op(a, other) for a in self.values])
+        return NotImplemented
+
+    def __add__(self, other):
+        return self._zip(other, operator.add)
+
+    def __radd__(self, other):
+        return self._zip(other, operator.add)
+
+    def __sub__(self, other):
+        return self._zip(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._zip(other, lambda a, b: b - a)
+
+    def __mul__(self, other):
+        return self._zip(other, operator.mul)
+
+    def __rmul__(self, other):
+        return self._zip(other, operator.mul)
+
+    def __truediv__(self, other):
+        return self._zip(other, operator.truediv)
+
+    def __rtruediv__(self, other):
+        return self._zip(other, lambda a, b: b / a)
+
+    def __pow__(self, other):
+        return self._zip(other, operator.pow)
+
+    def __neg__(self) -> "Paths":
+        return Paths([-a for a in self.values])
+
+    def __pos__(self) -> "Paths":
+        return self
+
+    def __abs__(self) -> "Paths":
+        return Paths([abs(a) for a in self.values])
+
+    def __bool__(self) -> bool:
+        raise TypeError("The truth value of Paths is ambiguous; compare the values of each path instead")
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.values)
+
+    def __repr__(self) -> str:
+        return f"Paths(n={len(self.values)}, mean={self.mean():,.4g})"
+
+    @staticmethod
+    def minimum(a: "Paths | float", b: "Paths | float") -> "Paths":
+        """Elementwise minimum, broadcasting floats."""
+        if isinstance(a, Paths):
+            return a._zip(b, min)
+        return b._zip(a, min)  # type: ignore[union-attr]
+
+    @staticmethod
+    def divide(a: "Paths | float", b: "Paths | float", default: float) -> "Paths":
+        """Elementwise `a / b` where `b` is positive and `default` elsewhere, broadcasting floats."""
+        n = len(a) if isinstance(a, Paths) else len(b)  # type: ignore[arg-type]
+        numerators = a.values if isinstance(a, Paths) else [a] * n
+        denominators = b.values if isinstance(b, Paths) else [b] * n
+        if len(numerators) != len(denominators):
+            raise ValueError(f"Cannot combine {len(numerators)} paths with {len(denominators)} paths")
+        return Paths([x / y if y > 0 else default for x, y in zip(numerators, denominators)])
+
+    def mean(self) -> float:
+        return math.fsum(self.values) / len(self.values)
+
+    def percentile(self, q: float) -> float:
+        """`q`th percentile (0 to 100) with linear interpolation between the closest ranks."""
+        ordered = sorted(self.values)
+        rank = q / 100 * (len(ordered) - 1)
+        lo = math.floor(rank)
+        hi = min(lo + 1, len(ordered) - 1)
+        return ordered[lo] + (ordered[hi] - ordered[lo]) * (rank - lo)
+
+
+def percentile(value: "Paths | float", q: float) -> float:
+    """Percentile of a model value, which is a plain float where it does not depend on a stochastic driver."""
+    return value.percentile(q) if isinstance(value, Paths) else float(value)
+
+
+def correlated_normals(
+    correlation: Sequence[Sequence[float]], n_paths: int, n_steps: int, rng: random.Random
+) -> list[list[list[float]]]:
+    """
+    Standard normal shocks indexed `[driver][step][path]`, correlated across drivers by `correlation`.
+
+    Shocks are independent across steps and paths.
+    """
+    n = len(correlation)
+    chol = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1):
+            s = correlation[i][j] - sum(chol[i][k] * chol[j][k] for k in range(j))
+            if i == j:
+                if s <= 0:
+                    raise ValueError("Correlation matrix must be positive definite")
+                chol[i][j] = math.sqrt(s)
+            else:
+                chol[i][j] = s / chol[j][j]
+
+    shocks = [[[0.0] * n_paths for _ in range(n_steps)] for _ in range(n)]
+    for t in range(n_steps):
+        for p in range(n_paths):
+            z = [rng.gauss() for _ in range(n)]
+            for i in range(n):
+                shocks[i][t][p] = sum(chol[i][k] * z[k] for k in range(i + 1))
+    return shocks
+
+
+@dataclass(frozen=True)
+class AR1:
+    """
+    Annual growth rate following `g[t] = mean + phi * (g[t-1] - mean) + sigma * e[t]` at each step.
+
+    Attributes:
+        mean: Long-run growth rate
+        phi: Persistence of deviations from the mean per step
+        sigma: Standard deviation of the shock per step
+        initial: Growth rate before the first step. Defaults to `mean`.
+    """
+
+    mean: float
+    phi: float
+    sigma: float
+    initial: float | None = None
+
+    def paths(self, shocks: Sequence[Sequence[float]]) -> list[Paths]:
+        """Growth rate at each step from `shocks` indexed `[step][path]`."""
+        prior = [self.mean if self.initial is None else self.initial] * len(shocks[0])
+        steps = []
+        for step in shocks:
+            prior = [self.mean + self.phi * (g - self.mean) + self.sigma * e for g, e in zip(prior, step)]
+            steps.append(Paths(prior))
+        return steps
+
+
+@dataclass
+class Simulation:
+    """
+    Percentiles of simulated line items at each date.
+
+    Attributes:
+        dates: Period end dates
+        percentiles: Percentiles reported, e.g. `(5, 50, 95)`
+        results: `results[line item][percentile]` is the value of that percentile at each date
+    """
+
+    dates: list[date]
+    percentiles: tuple[float, ...]
+    results: dict[str, dict[float, list[float]]]
+
+
+def simulate(
+    n_paths: int = 1_000,
+    revenue: AR1 = AR1(mean=0.05, phi=0.6, sigma=0.04),
+    general_and_admin: AR1 = AR1(mean=0.04, phi=0.6, sigma=0.02),
+    correlation: float = 0.5,
+    years: int = 5,
+    percentiles: tuple[float, ...] = (5, 50, 95),
+    seed: int | None = None,
+) -> Simulation:
+    """
+    Simulate `n_paths` correlated revenue and G&A growth paths through one base case model.
+
+    Growth rates step quarterly from the start of the projection. Reports cash, revolver balance and quarterly net
+    income.
+    """
+    from dateutil.relativedelta import relativedelta
+    from orcaset.financial import Period
+
+    from base_case import Assumptions, build_traeger
+    from model.grid import accrue_grid, balances_at
+
+    start = Assumptions.start_date
+    quarters = Period.series(start, relativedelta(months=3, day=31), relativedelta(years=years))
+    dates = [start] + [end for _, end in quarters]
+    n_steps = len(dates) - 1
+
+    rng = random.Random(seed)
+    rev_shocks, ga_shocks = correlated_normals([[1.0, correlation], [correlation, 1.0]], n_paths, n_steps, rng)
+
+    class Scenario(Assumptions):
+        revenue_growth_rates = StepCurve(dates[:-1], revenue.paths(rev_shocks))
+        general_and_admin_growth_rates = StepCurve(dates[:-1], general_and_admin.paths(ga_shocks))
+
+    with build_traeger(Scenario) as m:
+        columns = {
+            "Cash": balances_at(m.balance_sheet.assets.cash, dates[1:]),
+            "Revolver": balances_at(m.balance_sheet.liabilities.revolver, dates[1:]),
+            "Net Income": accrue_grid(m.income, dates),
+        }
+
+    return Simulation(
+        dates=dates[1:],
+        percentiles=percentiles,
+        results={
+            name: {q: [percentile(value, q) for value in values] for q in percentiles}
+            for name, values in columns.items()
+        },
+    )
+
+
+if __name__ == "__main__":
+    simulation = simulate(n_paths=1_000, seed=0)
+
+    for name, by_pct in simulation.results.items():
+        print(f"\n## {name}\n")
+        print("| Date | " + " | ".join(f"P{q:g}" for q in simulation.percentiles) + " |")
+        print("| --- |" + " --- |" * len(simulation.percentiles))
+        for i, dt in enumerate(simulation.dates):
+            print(f"| {dt} | " + " | ".join(f"{by_pct[q][i]:,.0f}" for q in simulation.percentiles) + " |")
@@ -1,196 +1,342 @@
+"""
+Base case assumptions and model.
+
+Nothing is imported, derived or built when this module is imported. Derived assumptions are calculated on first
+access, and the module-level `income`, `balance_sheet`, `cash_flow`, `footnotes` and `traeger` nodes are built the
+first time they are accessed. Use `build_traeger` to create a separate model from a subclass of `Assumptions`.
+"""
+
+import weakref
 from datetime import date
+from functools import cache
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Callable, Literal
+
+if TYPE_CHECKING:
+    from orcaset.financial import Balance
+
+    from historicals.store import HistoricalStore, Section
+    import model.balance_sheet as bs
+    import model.cash_flow as cf
+    import model.footnotes as fn
+    import model.income as inc
+    from model.curves import StepCurve
+    from model.model import Traeger
+
+
+class derived[T]:
+    """
+    Assumption calculated from the assumptions class on first access and cached for that class.
+
+    Values are held weakly by class, so scenario classes and their derived values are freed with their models.
+    """
+
+    def __init__(self, fn: Callable[[Any], T]):
+        self.fn = fn
+        self.values: weakref.WeakKeyDictionary[type, T] = weakref.WeakKeyDictionary()
+
+    def __get__(self, obj, owner: type) -> T:
+        if owner not in self.values:
+            self.values[owner] = self.fn(owner)
+        return self.values[owner]
+
 
-from orcaset.financial import (
-    Accrual,
-    AccrualSeries,
-    BalanceSeries,
-    PaymentSeries,
-    Period,
-)
+def _rates(*segments: tuple[date, float]) -> "StepCurve":
+    """Piecewise constant rates from `(start, rate)` segments. The last rate applies indefinitely."""
+    from model.curves import StepCurve
 
-import model.balance_sheet as bs
-import model.cash_flow as cf
-import model.footnotes as fn
-import model.income as inc
-from historicals import balance_sheet as hist_bs
-from historicals import footnotes as hist_fn
-from historicals import income as hist_inc
-from model.model import Traeger
+    return StepCurve([start for start, _ in segments], [rate for _, rate in segments])
+
+
+@cache
+def _store(path: str) -> "HistoricalStore":
+    return import_module("historicals.store").HistoricalStore(path)
+
+
+def _historicals(a: type["Assumptions"], section: str) -> "Section | Any":
+    """Historicals `section` from the store at `a.historicals_path`, or the literal `historicals` module."""
+    if a.historicals_path is None:
+        return import_module(f"historicals.{section}")
+    return _store(a.historicals_path).section(section)
 
 
 class Assumptions:
+    # HISTORICALS
+    # Store to read the historicals from instead of the literal `historicals` modules (written by
+    # `uv run -m historicals.store`)
+    historicals_path: str | None = None
+    hist_inc = derived(lambda cls: _historicals(cls, "income"))
+    hist_bs = derived(lambda cls: _historicals(cls, "balance_sheet"))
+    hist_fn = derived(lambda cls: _historicals(cls, "footnotes"))
+    calibration = derived(
+        lambda cls: import_module("historicals.calibration").Calibration.from_sections(cls.hist_inc, cls.hist_bs)
+    )
+
     # INCOME ASSUMPTIONS
-    revenue_growth_rates = AccrualSeries(
-        [
-            Accrual.cmonthly(Period(date(2025, 3, 31), date(2025, 12, 31)), 0.05),
-            Accrual.cmonthly(Period(date(2025, 12, 31), date(2026, 12, 31)), 0.15),
-            Accrual.cmonthly(Period(date(2026, 12, 31), date(2027, 12, 31)), 0.1),
-            Accrual.cmonthly(Period(date(2027, 12, 31), date(2030, 12, 31)), 0.05),
-            Accrual.cmonthly(Period(date(2030, 12, 31), date.max), 0.03),
-        ]
+    revenue_growth_rates = derived(
+        lambda cls: _rates(
+            (date(2025, 3, 31), 0.05),
+            (date(2025, 12, 31), 0.15),
+            (date(2026, 12, 31), 0.1),
+            (date(2027, 12, 31), 0.05),
+            (date(2030, 12, 31), 0.03),
+        )
     )
     cost_of_revenue_pct_revenue = -0.6
-    sales_and_marketing_pct_revenue = sum(acc.value for acc in hist_inc.sales_and_marketing) / sum(
-        acc.value for acc in hist_inc.revenue
-    )
-    general_and_admin_growth_rates = AccrualSeries(
-        [
-            Accrual.cmonthly(Period(date(2025, 3, 31), date(2030, 12, 31)), 0.05),
-            Accrual.cmonthly(Period(date(2030, 12, 31), date.max), 0.03),
-        ]
+    sales_and_marketing_pct_revenue = derived(lambda cls: cls.calibration.flow_ratio("sales_and_marketing", "revenue"))
+    general_and_admin_growth_rates = derived(
+        lambda cls: _rates(
+            (date(2025, 3, 31), 0.05),
+            (date(2030, 12, 31), 0.03),
+        )
     )
     amort_of_intangibles_growth_rate = 0.0
     interest_rate = 0.08
-    annual_other_income = sum(acc.value for acc in hist_inc.other_income) / len(hist_inc.other_income) * 4
+    interest_mode: Literal["beginning", "average"] = "beginning"
+    interest_debt_path: tuple["Balance", ...] = ()
+    annual_other_income = derived(lambda cls: cls.calibration.annualized_mean("other_income"))
     tax_rate = 0.21
 
     # BALANCE SHEET ASSUMPTIONS
     min_cash = 10_000
-    receivables_pct_revenue = sum(
-        bal.value / rev.value for rev, bal in zip(hist_inc.revenue, hist_bs.receivables[1:])
-    ) / len(hist_inc.revenue)
-    inventory_pct_cost_of_revenue = sum(
-        bal.value / cost.value for cost, bal in zip(hist_inc.cost_of_revenue, hist_bs.inventory[1:])
-    ) / len(hist_inc.cost_of_revenue)
-    other_current_assets_pct_inventory = sum(
-        oca_bal.value / inv_bal.value for oca_bal, inv_bal in zip(hist_bs.other_current_assets, hist_bs.inventory)
-    ) / len(hist_bs.other_current_assets[1:])
-    accounts_payable_pct_cost_of_revenue = sum(
-        bal.value / cost.value for cost, bal in zip(hist_inc.cost_of_revenue, hist_bs.accounts_payable[1:])
-    ) / len(hist_inc.cost_of_revenue)
-    accrued_expenses_pct_cost_of_revenue = sum(
-        bal.value / cost.value for cost, bal in zip(hist_inc.cost_of_revenue, hist_bs.accrued_expenses[1:])
-    ) / len(hist_inc.cost_of_revenue)
+    receivables_pct_revenue = derived(lambda cls: cls.calibration.pct_of_flow("receivables", "revenue"))
+    inventory_pct_cost_of_revenue = derived(lambda cls: cls.calibration.pct_of_flow("inventory", "cost_of_revenue"))
+    other_current_assets_pct_inventory = derived(
+        lambda cls: cls.calibration.pct_of_balance("other_current_assets", "inventory")
+    )
+    accounts_payable_pct_cost_of_revenue = derived(
+        lambda cls: cls.calibration.pct_of_flow("accounts_payable", "cost_of_revenue")
+    )
+    accrued_expenses_pct_cost_of_revenue = derived(
+        lambda cls: cls.calibration.pct_of_flow("accrued_expenses", "cost_of_revenue")
+    )
     other_current_liabilities_pct_opex = 0.1
+    long_term_debt_tranches = derived(
+        lambda cls: (
+            import_module("model.debt").Tranche(
+                "long_term_debt", cls.hist_bs.long_term_debt[-1].value, rate=cls.interest_rate
+            ),
+        )
+    )
 
     # FOOTNOTE ASSUMPTIONS
     depreciation_growth_rate = 0.05
     capital_expenditures_growth_rate = 0.05
     start_date = date(2025, 3, 31)
+    horizon = date.max
+    frequency: Literal["monthly", "quarterly"] = "quarterly"
+
+
+# Derived assumptions calculated from the historicals alone, which scenarios share rather than re-derive
+HISTORICAL_INPUTS = ("hist_inc", "hist_bs", "hist_fn", "calibration")
+
 
+def scenario(a: type[Assumptions] = Assumptions, **overrides: Any) -> type[Assumptions]:
+    """
+    Subclass of `a` with `overrides`, sharing the historicals and calibration already derived for `a` unless
+    `historicals_path` is overridden.
 
-income = inc.NetIncome(
-    pretax_income=inc.PretaxIncome(
-        operating_income=inc.OperatingIncome(
-            gross_profit=inc.GrossProfit(
-                revenue=inc.Revenue(
-                    historical=AccrualSeries(hist_inc.revenue),
-                    growth_rates=Assumptions.revenue_growth_rates,
+    Other derived assumptions are re-derived for the scenario, since they may depend on the overrides.
+    """
+    unknown = [name for name in overrides if name.startswith("_") or not hasattr(a, name)]
+    if unknown:
+        raise ValueError(f"Unknown assumptions: {', '.join(unknown)}")
+    shared = () if "historicals_path" in overrides else HISTORICAL_INPUTS
+    return type(a.__name__, (a,), {name: getattr(a, name) for name in shared} | overrides)
+
+
+def build_income(a: type[Assumptions] = Assumptions) -> "inc.NetIncome":
+    from orcaset.financial import AccrualSeries
+
+    import model.income as inc
+
+    return inc.NetIncome(
+        pretax_income=inc.PretaxIncome(
+            operating_income=inc.OperatingIncome(
+                gross_profit=inc.GrossProfit(
+                    revenue=inc.Revenue(
+                        historical=AccrualSeries(a.hist_inc.revenue),
+                        growth_rates=a.revenue_growth_rates,
+                    ),
+                    cost_of_revenue=inc.CostOfRevenue(
+                        historical=AccrualSeries(a.hist_inc.cost_of_revenue),
+                        pct_revenue=a.cost_of_revenue_pct_revenue,
+                    ),
                 ),
-                cost_of_revenue=inc.CostOfRevenue(
-                    historical=AccrualSeries(hist_inc.cost_of_revenue),
-                    pct_revenue=Assumptions.cost_of_revenue_pct_revenue,
+                operating_expenses=inc.OperatingExpenses(
+                    sales_and_marketing=inc.SalesAndMarketing(
+                        historical=AccrualSeries(a.hist_inc.sales_and_marketing),
+                        pct_revenue=a.sales_and_marketing_pct_revenue,
+                    ),
+                    general_and_admin=inc.GeneralAndAdmin(
+                        historical=AccrualSeries(a.hist_inc.general_and_administrative),
+                        growth_rates=a.general_and_admin_growth_rates,
+                    ),
+                    amort_of_intangibles=inc.AmortOfIntangibles(
+                        historical=AccrualSeries(a.hist_inc.amort_of_intangibles),
+                        growth_rate=a.amort_of_intangibles_growth_rate,
+                    ),
                 ),
             ),
-            operating_expenses=inc.OperatingExpenses(
-                sales_and_marketing=inc.SalesAndMarketing(
-                    historical=AccrualSeries(hist_inc.sales_and_marketing),
-                    pct_revenue=Assumptions.sales_and_marketing_pct_revenue,
-                ),
-                general_and_admin=inc.GeneralAndAdmin(
-                    historical=AccrualSeries(hist_inc.general_and_administrative),
-                    growth_rates=Assumptions.general_and_admin_growth_rates,
-                ),
-                amort_of_intangibles=inc.AmortOfIntangibles(
-                    historical=AccrualSeries(hist_inc.amort_of_intangibles),
-                    growth_rate=Assumptions.amort_of_intangibles_growth_rate,
-                ),
+            interest_expense=inc.InterestExpense(
+                historical=AccrualSeries(a.hist_inc.interest_expense),
+                interest_rate=a.interest_rate,
+                mode=a.interest_mode,
+                debt_path=a.interest_debt_path,
+            ),
+            other_income=inc.OtherIncome(
+                historical=AccrualSeries(a.hist_inc.other_income),
+                projected_amt=a.annual_other_income,
             ),
         ),
-        interest_expense=inc.InterestExpense(
-            historical=AccrualSeries(hist_inc.interest_expense),
-            interest_rate=Assumptions.interest_rate,
-        ),
-        other_income=inc.OtherIncome(
-            historical=AccrualSeries(hist_inc.other_income),
-            projected_amt=Assumptions.annual_other_income,
-        ),
-    ),
-    tax_expense=inc.TaxExpense(historical=AccrualSeries(hist_inc.tax_expense), tax_rate=Assumptions.tax_rate),
-)
+        tax_expense=inc.TaxExpense(historical=AccrualSeries(a.hist_inc.tax_expense), tax_rate=a.tax_rate),
+    )
 
 
-balance_sheet = bs.BalanceSheet(
-    assets=bs.Assets(
-        cash=bs.Cash(historical=BalanceSeries(hist_bs.cash)),
-        receivables=bs.Receivables(
-            historical=BalanceSeries(hist_bs.receivables),
-            pct_revenue=Assumptions.receivables_pct_revenue,
-        ),
-        inventory=bs.Inventory(
-            historical=BalanceSeries(hist_bs.inventory),
-            pct_cost_of_revenue=Assumptions.inventory_pct_cost_of_revenue,
-        ),
-        other_current_assets=bs.OtherCurrentAssets(
-            historical=BalanceSeries(hist_bs.other_current_assets),
-            pct_inventory=Assumptions.other_current_assets_pct_inventory,
-        ),
-        ppe=bs.PropertyPlantEquipment(
-            historical=BalanceSeries(hist_bs.ppe),
-        ),
-        intangible_assets=bs.IntangibleAssets(
-            total_cost=bs.TotalCost(
-                historical=BalanceSeries(hist_bs.intangible_assets),
+def build_balance_sheet(a: type[Assumptions] = Assumptions) -> "bs.BalanceSheet":
+    from orcaset.financial import BalanceSeries
+
+    import model.balance_sheet as bs
+
+    return bs.BalanceSheet(
+        assets=bs.Assets(
+            cash=bs.Cash(historical=BalanceSeries(a.hist_bs.cash)),
+            receivables=bs.Receivables(
+                historical=BalanceSeries(a.hist_bs.receivables),
+                pct_revenue=a.receivables_pct_revenue,
+            ),
+            inventory=bs.Inventory(
+                historical=BalanceSeries(a.hist_bs.inventory),
+                pct_cost_of_revenue=a.inventory_pct_cost_of_revenue,
+            ),
+            other_current_assets=bs.OtherCurrentAssets(
+                historical=BalanceSeries(a.hist_bs.other_current_assets),
+                pct_inventory=a.other_current_assets_pct_inventory,
             ),
-            accumulated_amortization=bs.AccumulatedAmortization(
-                historical=BalanceSeries(hist_bs.intangible_assets),
+            ppe=bs.PropertyPlantEquipment(
+                historical=BalanceSeries(a.hist_bs.ppe),
+            ),
+            intangible_assets=bs.IntangibleAssets(
+                total_cost=bs.TotalCost(
+                    historical=BalanceSeries(a.hist_bs.intangible_assets),
+                ),
+                accumulated_amortization=bs.AccumulatedAmortization(
+                    historical=BalanceSeries(a.hist_bs.intangible_assets),
+                ),
+            ),
+            other_non_current_assets=bs.OtherNonCurrentAssets(
+                historical=BalanceSeries(a.hist_bs.other_non_current_assets),
             ),
         ),
-        other_non_current_assets=bs.OtherNonCurrentAssets(
-            historical=BalanceSeries(hist_bs.other_non_current_assets),
+        liabilities=bs.Liabilities(
+            accounts_payable=bs.AccountsPayable(
+                historical=BalanceSeries(a.hist_bs.accounts_payable),
+                pct_cost_of_revenue=a.accounts_payable_pct_cost_of_revenue,
+            ),
+            accrued_expenses=bs.AccruedExpenses(
+                historical=BalanceSeries(a.hist_bs.accrued_expenses),
+                pct_cost_of_revenue=a.accrued_expenses_pct_cost_of_revenue,
+            ),
+            other_current_liabilities=bs.OtherCurrentLiabilities(
+                historical=BalanceSeries(a.hist_bs.other_current_liabilities),
+                pct_opex=a.other_current_liabilities_pct_opex,
+            ),
+            revolver=bs.Revolver(historical=BalanceSeries(a.hist_bs.revolver)),
+            long_term_debt=bs.LongTermDebt(
+                historical=BalanceSeries(a.hist_bs.long_term_debt),
+                tranches=a.long_term_debt_tranches,
+            ),
+            other_non_current_liabilities=bs.OtherNonCurrentLiabilities(
+                historical=BalanceSeries(a.hist_bs.other_non_current_liabilities),
+            ),
         ),
-    ),
-    liabilities=bs.Liabilities(
-        accounts_payable=bs.AccountsPayable(
-            historical=BalanceSeries(hist_bs.accounts_payable),
-            pct_cost_of_revenue=Assumptions.accounts_payable_pct_cost_of_revenue,
+        equity=bs.Equity(
+            common_stock=bs.CommonStock(historical=BalanceSeries(a.hist_bs.common_stock)),
         ),
-        accrued_expenses=bs.AccruedExpenses(
-            historical=BalanceSeries(hist_bs.accrued_expenses),
-            pct_cost_of_revenue=Assumptions.accrued_expenses_pct_cost_of_revenue,
+    )
+
+
+def build_footnotes(a: type[Assumptions] = Assumptions) -> "fn.Footnotes":
+    from orcaset.financial import AccrualSeries, PaymentSeries
+
+    import model.footnotes as fn
+
+    return fn.Footnotes(
+        depreciation=fn.Depreciation(
+            historical=AccrualSeries(a.hist_fn.depreciation),
+            growth_rate=a.depreciation_growth_rate,
         ),
-        other_current_liabilities=bs.OtherCurrentLiabilities(
-            historical=BalanceSeries(hist_bs.other_current_liabilities),
-            pct_opex=Assumptions.other_current_liabilities_pct_opex,
+        capital_expenditures=fn.CapitalExpenditures(
+            historical=PaymentSeries(a.hist_fn.capital_expenditures),
+            growth_rate=a.capital_expenditures_growth_rate,
         ),
-        revolver=bs.Revolver(historical=BalanceSeries(hist_bs.revolver)),
-        long_term_debt=bs.LongTermDebt(
-            historical=BalanceSeries(hist_bs.long_term_debt),
+        cash_flow_before_revolver=fn.CashFlowBeforeRevolver(),
+        net_revolver_draws=fn.NetRevolverDraws(
+            last_cash_balance=a.hist_bs.cash[-1],
+            min_cash=a.min_cash,
         ),
-        other_non_current_liabilities=bs.OtherNonCurrentLiabilities(
-            historical=BalanceSeries(hist_bs.other_non_current_liabilities),
+    )
+
+
+def build_cash_flow(a: type[Assumptions] = Assumptions) -> "cf.CashFlow":
+    import model.cash_flow as cf
+
+    return cf.CashFlow(
+        operating=cf.OperatingActivities(
+            net_income=cf.NetIncome(),
+            depreciation=cf.Depreciation(),
+            intangible_amortization=cf.IntangibleAmortization(),
+            changes_in_working_capital=cf.ChangesInWorkingCapital(),
         ),
-    ),
-    equity=bs.Equity(
-        common_stock=bs.CommonStock(historical=BalanceSeries(hist_bs.common_stock)),
-    ),
-)
-
-footnotes = fn.Footnotes(
-    depreciation=fn.Depreciation(
-        historical=AccrualSeries(hist_fn.depreciation),
-        growth_rate=Assumptions.depreciation_growth_rate,
-    ),
-    capital_expenditures=fn.CapitalExpenditures(
-        historical=PaymentSeries(hist_fn.capital_expenditures),
-        growth_rate=Assumptions.capital_expenditures_growth_rate,
-    ),
-    cash_flow_before_revolver=fn.CashFlowBeforeRevolver(),
-    net_revolver_draws=fn.NetRevolverDraws(
-        last_cash_balance=hist_bs.cash[-1],
-        min_cash=Assumptions.min_cash,
-    ),
-)
-
-cash_flow = cf.CashFlow(
-    operating=cf.OperatingActivities(
-        net_income=cf.NetIncome(),
-        depreciation=cf.Depreciation(),
-        intangible_amortization=cf.IntangibleAmortization(),
-        changes_in_working_capital=cf.ChangesInWorkingCapital(),
-    ),
-    investing=cf.InvestingActivities(capital_expenditures=cf.CapitalExpenditures()),
-    financing=cf.FinancingActivities(long_term_debt=cf.LongTermDebt(), revolver=cf.Revolver()),
-)
-
-traeger = Traeger(income=income, balance_sheet=balance_sheet, cash_flow=cash_flow, footnotes=footnotes)
+        investing=cf.InvestingActivities(capital_expenditures=cf.CapitalExpenditures()),
+        financing=cf.FinancingActivities(long_term_debt=cf.LongTermDebt(), revolver=cf.Revolver()),
+    )
+
+
+def build_traeger(a: type[Assumptions] = Assumptions) -> "Traeger":
+    from model.model import Traeger
+
+    return Traeger(
+        income=build_income(a),
+        balance_sheet=build_balance_sheet(a),
+        cash_flow=build_cash_flow(a),
+        footnotes=build_footnotes(a),
+        horizon=a.horizon,
+        frequency=a.frequency,
+    )
+
+
+def _build_base_traeger() -> "Traeger":
+    from model.model import Traeger
+
+    return Traeger(
+        income=_lazy("income"),
+        balance_sheet=_lazy("balance_sheet"),
+        cash_flow=_lazy("cash_flow"),
+        footnotes=_lazy("footnotes"),
+        horizon=Assumptions.horizon,
+        frequency=Assumptions.frequency,
+    )
+
+
+_BUILDERS: dict[str, Callable[[], Any]] = {
+    "income": build_income,
+    "balance_sheet": build_balance_sheet,
+    "cash_flow": build_cash_flow,
+    "footnotes": build_footnotes,
+    "traeger": _build_base_traeger,
+}
+
+
+def _lazy(name: str) -> Any:
+    if name not in globals():
+        globals()[name] = _BUILDERS[name]()
+    return globals()[name]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "Traeger":
+        return import_module("model.model").Traeger
+    if name in _BUILDERS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
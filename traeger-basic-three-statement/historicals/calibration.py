@@ -0,0 +1,123 @@
+import math
+import statistics
+from collections.abc import Iterable
+from functools import wraps
+from typing import Any, Callable, Mapping, Sequence
+
+from orcaset.financial import Accrual, Balance
+
+
+def _cached[F: Callable](method: F) -> F:
+    """Cache a calibration method's result per instance and arguments."""
+
+    @wraps(method)
+    def wrapper(self: "Calibration", *args):
+        key = (method.__name__, *args)
+        if key not in self._cache:
+            self._cache[key] = method(self, *args)
+        return self._cache[key]
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _mean(values: Iterable[float], label: str) -> float:
+    """Mean of `values`, raising a `ValueError` about `label` if there are none."""
+    values = list(values)
+    if not values:
+        raise ValueError(f"No dates align to calibrate {label}")
+    return sum(values) / len(values)
+
+
+def _line_items[T](source: Any, kind: type[T]) -> dict[str, Sequence[T]]:
+    """Public sequences of `kind` on a historicals module or store section."""
+    items = {}
+    for name in dir(source):
+        value = getattr(source, name)
+        if not name.startswith("_") and isinstance(value, Sequence) and value and isinstance(value[0], kind):
+            items[name] = value
+    return items
+
+
+class Calibration:
+    """
+    Model drivers calibrated from one company's historical accruals and balances.
+
+    Balances are aligned to accruals by date (a balance is matched to the accrual for the period ending on its date)
+    rather than by list position, so series with different start dates line up correctly. Each driver is computed
+    once per instance and cached.
+
+    ```python
+    calibration = Calibration.from_sections(hist_inc, hist_bs)
+    calibration.pct_of_flow("receivables", "revenue")
+    ```
+    """
+
+    def __init__(self, accruals: Mapping[str, Sequence[Accrual]], balances: Mapping[str, Sequence[Balance]]):
+        self._accruals = {name: {acc.period.end: acc for acc in series} for name, series in accruals.items()}
+        self._balances = {name: {bal.date: bal.value for bal in series} for name, series in balances.items()}
+        self._cache: dict[tuple, Any] = {}
+
+    @classmethod
+    def from_sections(cls, income: Any, balance_sheet: Any) -> "Calibration":
+        """Calibration over every line item of historicals modules or `HistoricalStore` sections."""
+        return cls(_line_items(income, Accrual), _line_items(balance_sheet, Balance))
+
+    @_cached
+    def pct_of_flow(self, balance: str, accrual: str) -> float:
+        """Average of `balance` at each period end divided by `accrual` over that period."""
+        bals, accs = self._balances[balance], self._accruals[accrual]
+        return _mean(
+            (bals[end] / accs[end].value for end in accs if end in bals and accs[end].value), f"{balance}/{accrual}"
+        )
+
+    @_cached
+    def pct_of_balance(self, balance: str, base: str) -> float:
+        """Average of `balance` divided by the `base` balance on the same date."""
+        bals, base_bals = self._balances[balance], self._balances[base]
+        return _mean((bals[dt] / base_bals[dt] for dt in bals if base_bals.get(dt)), f"{balance}/{base}")
+
+    @_cached
+    def flow_ratio(self, accrual: str, base: str) -> float:
+        """Total of `accrual` divided by total of `base` over the periods both cover."""
+        accs, base_accs = self._accruals[accrual], self._accruals[base]
+        ends = [end for end in accs if end in base_accs]
+        total = sum(base_accs[end].value for end in ends)
+        if not total:
+            raise ValueError(f"{base} totals zero over the periods it shares with {accrual}")
+        return sum(accs[end].value for end in ends) / total
+
+    @_cached
+    def annualized_mean(self, accrual: str, periods_per_year: int = 4) -> float:
+        """Average accrual per period scaled to a year."""
+        return _mean((acc.value for acc in self._accruals[accrual].values()), accrual) * periods_per_year
+
+    @_cached
+    def trend_growth(self, accrual: str) -> float:
+        """Annual growth rate from a log-linear regression of accrual magnitude on time in years."""
+        accs = sorted((acc for acc in self._accruals[accrual].values() if acc.value), key=lambda acc: acc.period.end)
+        if len({acc.period.end for acc in accs}) < 2:
+            raise ValueError(f"{accrual} needs non-zero values in at least two periods to calibrate a trend")
+        start = accs[0].period.end
+        years = [acc.yf(start, acc.period.end) for acc in accs]
+        slope, _ = statistics.linear_regression(years, [math.log(abs(acc.value)) for acc in accs])
+        return math.exp(slope) - 1
+
+    def drivers(self, flows: Sequence[str] = ("revenue", "cost_of_revenue")) -> dict[str, dict[str, float]]:
+        """
+        Every balance as a percent of each of `flows`, every accrual as a ratio of each of `flows`, and the trend
+        growth of every accrual.
+        """
+        return {
+            "pct_of_flow": {f"{bal}/{flow}": self.pct_of_flow(bal, flow) for bal in self._balances for flow in flows},
+            "flow_ratio": {f"{acc}/{flow}": self.flow_ratio(acc, flow) for acc in self._accruals for flow in flows},
+            "trend_growth": {acc: self.trend_growth(acc) for acc in self._accruals},
+        }
+
+
+if __name__ == "__main__":
+    from historicals import balance_sheet, income
+
+    for kind, values in Calibration.from_sections(income, balance_sheet).drivers().items():
+        print(f"\n## {kind}\n")
+        for name, value in values.items():
+            print(f"| {name} | {value:.4f} |")
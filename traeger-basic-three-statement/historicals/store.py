@@ -0,0 +1,226 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+from datetime import date
+from typing import Callable, Iterator, Mapping, Sequence, overload
+
+from orcaset.financial import YF, Accrual, Balance, Payment, Period
+
+MAGIC = b"ORCH"
+_HEADER = struct.Struct("<4sI")  # magic, header length
+
+
+def _data_start(header_len: int) -> int:
+    """Data follows the header at the next 8-byte boundary so columns can be cast in place."""
+    return -(-(_HEADER.size + header_len) // 8) * 8
+
+
+class LazySeries[T](Sequence[T]):
+    """
+    Read-only sequence over memory-mapped date and value columns.
+
+    `Balance`, `Payment` or `Accrual` objects are only created when an item is accessed, and are not retained. Slicing
+    returns another view over the same memory without copying.
+    """
+
+    def __init__(self, columns: tuple[memoryview, ...], make: Callable[..., T]):
+        self._columns = columns
+        self._make = make
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LazySeries[T]": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazySeries(tuple(col[index] for col in self._columns), self._make)
+        return self._make(*(col[index] for col in self._columns))
+
+    def __iter__(self) -> Iterator[T]:
+        make = self._make
+        for row in zip(*self._columns):
+            yield make(*row)
+
+
+class Section:
+    """Line items of one statement, accessed by attribute like the literal `historicals` modules."""
+
+    def __init__(self, items: Mapping[str, LazySeries]):
+        self._items = items
+
+    def __getattr__(self, name: str) -> LazySeries:
+        try:
+            return self._items[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __dir__(self):
+        return list(self._items)
+
+
+class HistoricalStore:
+    """
+    Memory-mapped columnar file of historical line items.
+
+    Each line item is stored as contiguous int64 date ordinals and float64 values (accruals store start and end
+    ordinals, and the name of their `YF` year fraction). Opening a store only parses the small JSON header; data pages
+    are loaded by the OS as items are read.
+
+    Set `Assumptions.historicals_path` to build models from a store instead of the literal `historicals` modules.
+
+    ```python
+    with HistoricalStore("historicals/traeger.hist") as store:
+        hist_bs = store.section("balance_sheet")
+        BalanceSeries(hist_bs.cash)
+    ```
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, header_len = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a historical store")
+        self._header = json.loads(self._mmap[_HEADER.size : _HEADER.size + header_len])
+        if self._header["byteorder"] != sys.byteorder:
+            raise ValueError(f"{path} was written with {self._header['byteorder']} byte order")
+
+        self._data = memoryview(self._mmap)[_data_start(header_len) :]
+        self._sections = {
+            name: Section({item: self._series(spec) for item, spec in items.items()})
+            for name, items in self._header["sections"].items()
+        }
+
+    def _series(self, spec: dict) -> LazySeries:
+        n, offset = spec["length"], spec["offset"]
+        columns = []
+        for fmt in spec["formats"]:
+            columns.append(self._data[offset : offset + 8 * n].cast(fmt))
+            offset += 8 * n
+
+        match spec["kind"]:
+            case "balance":
+                return LazySeries(tuple(columns), lambda d, v: Balance(date.fromordinal(d), v))
+            case "payment":
+                return LazySeries(tuple(columns), lambda d, v: Payment(date.fromordinal(d), v))
+            case "accrual":
+                yf = getattr(YF, spec["yf"])
+                return LazySeries(
+                    tuple(columns),
+                    lambda s, e, v: Accrual(period=Period(date.fromordinal(s), date.fromordinal(e)), value=v, yf=yf),
+                )
+        raise ValueError(f"Unknown line item kind {spec['kind']}")
+
+    def section(self, name: str) -> Section:
+        return self._sections[name]
+
+    def close(self) -> None:
+        self._sections.clear()
+        self._data.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Series handed out by the store are still referenced, so the file is unmapped once they are collected
+            pass
+
+    def __enter__(self) -> "HistoricalStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _yf_name(series: Sequence[Accrual], name: str) -> str:
+    """Name of the `YF` year fraction every accrual in `series` uses."""
+    names = {getattr(YF, n): n for n in dir(YF) if not n.startswith("_")}
+    used = {names.get(acc.yf) for acc in series}
+    if None in used or len(used) != 1:
+        raise ValueError(f"Accruals of {name} must all use the same YF year fraction")
+    return used.pop()  # type: ignore[return-value]
+
+
+def write_store(
+    path: str,
+    sections: Mapping[str, Mapping[str, Sequence[Balance] | Sequence[Payment] | Sequence[Accrual]]],
+) -> None:
+    """
+    Write historical line items grouped by statement section to a store at `path`.
+
+    The year fraction of each accrual line item is stored with it, so accruals read back with the same `yf`.
+    """
+    header: dict = {"byteorder": sys.byteorder, "sections": {}}
+    blocks: list[bytes] = []
+    offset = 0
+
+    for section, items in sections.items():
+        header["sections"][section] = {}
+        for name, series in items.items():
+            first = series[0] if len(series) else None
+            if isinstance(first, Accrual):
+                kind, formats = "accrual", ["q", "q", "d"]
+                columns = [
+                    [acc.period.start.toordinal() for acc in series],
+                    [acc.period.end.toordinal() for acc in series],
+                    [acc.value for acc in series],
+                ]
+            else:
+                kind = "payment" if isinstance(first, Payment) else "balance"
+                formats = ["q", "d"]
+                columns = [[item.date.toordinal() for item in series], [item.value for item in series]]
+
+            header["sections"][section][name] = {
+                "kind": kind,
+                "length": len(series),
+                "offset": offset,
+                "formats": formats,
+            }
+            if kind == "accrual":
+                header["sections"][section][name]["yf"] = _yf_name(series, f"{section}.{name}")
+            for fmt, column in zip(formats, columns):
+                block = array(fmt, column).tobytes()
+                blocks.append(block)
+                offset += len(block)
+
+    header_bytes = json.dumps(header).encode()
+
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, len(header_bytes)))
+        file.write(header_bytes)
+        file.write(b"\0" * (_data_start(len(header_bytes)) - _HEADER.size - len(header_bytes)))
+        for block in blocks:
+            file.write(block)
+
+
+SECTIONS = ("balance_sheet", "income", "footnotes")
+
+
+def write_historicals(path: str) -> None:
+    """Write the line items of the literal `historicals` modules to a store at `path`, one section per module."""
+    from importlib import import_module
+
+    sections = {}
+    for section in SECTIONS:
+        module = import_module(f"historicals.{section}")
+        sections[section] = {
+            name: value
+            for name, value in vars(module).items()
+            if isinstance(value, list) and name not in ("hist_dates", "hist_periods")
+        }
+    write_store(path, sections)
+
+
+if __name__ == "__main__":
+    path = "historicals/traeger.hist"
+    write_historicals(path)
+
+    with HistoricalStore(path) as store:
+        for section in SECTIONS:
+            print(f"{section}: {', '.join(dir(store.section(section)))}")
@@ -0,0 +1,65 @@
+"""
+Cold-start benchmark for importing and querying the base case.
+
+Each statement runs in a fresh interpreter with `python -X importtime`. The report shows the cumulative import time of
+`base_case` and the total wall time of the statement, i.e. the import plus any model construction on first access.
+
+The eager column is the baseline for comparison: the same statement after `EAGER`, which does at import what
+`base_case` used to, i.e. imports the model and historicals, derives every assumption and builds every statement.
+
+    uv run importtime.py
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    "import base_case": "import base_case",
+    "build income": "import base_case; base_case.income",
+    "build traeger": "import base_case; base_case.traeger",
+    "query revenue": (
+        "from datetime import date; import base_case\n"
+        "with base_case.traeger as trg:\n"
+        "    revenue = trg.income.pretax_income.operating_income.gross_profit.revenue\n"
+        "    revenue.accrue(date(2025, 3, 31), date(2025, 6, 30))"
+    ),
+}
+RUNS = 5
+
+EAGER = (
+    "import base_case\n"
+    "for name in dir(base_case.Assumptions):\n"
+    "    getattr(base_case.Assumptions, name)\n"
+    "base_case.income, base_case.balance_sheet, base_case.cash_flow, base_case.footnotes, base_case.traeger\n"
+)
+
+
+def run(statement: str) -> tuple[float, float]:
+    """Import time of `base_case` and wall time of `statement` in milliseconds."""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True
+    )
+    wall = (time.perf_counter() - start) * 1000
+
+    import_us = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = [p.strip() for p in line.removeprefix("import time:").split("|")]
+        if len(parts) == 3 and parts[2] == "base_case":
+            import_us = int(parts[1])
+    return import_us / 1000, wall
+
+
+if __name__ == "__main__":
+    print("| Statement | base_case import (ms) | Wall time (ms) | Eager wall time (ms) |")
+    print("| --- | --- | --- | --- |")
+    for name, statement in STATEMENTS.items():
+        imports, walls = zip(*(run(statement) for _ in range(RUNS)))
+        eager = [run(f"{EAGER}{statement}")[1] for _ in range(RUNS)]
+        print(
+            f"| {name} | {statistics.median(imports):,.1f} | {statistics.median(walls):,.1f} "
+            f"| {statistics.median(eager):,.1f} |"
+        )
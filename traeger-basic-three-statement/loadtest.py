@@ -0,0 +1,72 @@
+"""
+Load test for the model server.
+
+Start the server, then run the load test against it:
+
+    uv run --with uvicorn uvicorn server:app
+    uv run loadtest.py --requests 2000 --concurrency 32
+
+Requests cycle through a few line items and assumption overrides so that some are answered from warm results and
+some build new models.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection
+from threading import local
+
+DATES = ["2025-03-31", "2025-06-30", "2025-09-30", "2025-12-31", "2026-03-31", "2026-06-30", "2026-09-30"]
+PATHS = [
+    "income/pretax_income/operating_income",
+    "income",
+    "balance_sheet/assets/*",
+    "balance_sheet/liabilities/revolver",
+    "income/**/revenue",
+]
+OVERRIDES = [{}, {"tax_rate": 0.25}, {"min_cash": 20_000}]
+
+_connections = local()
+
+
+def request(method: str, path: str, host: str, port: int, body: dict | None = None) -> tuple[int, dict]:
+    if not hasattr(_connections, "conn"):
+        _connections.conn = HTTPConnection(host, port)
+    conn = _connections.conn
+    conn.request(method, path, body=json.dumps(body) if body else None, headers={"content-type": "application/json"})
+    response = conn.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def query(i: int, host: str, port: int) -> float:
+    body = {
+        "model": "traeger",
+        "overrides": OVERRIDES[i % len(OVERRIDES)],
+        "queries": [{"path": PATHS[i % len(PATHS)], "dates": DATES}],
+    }
+    start = time.perf_counter()
+    status, payload = request("POST", "/query", host, port, body)
+    if status != 200:
+        raise RuntimeError(payload)
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--requests", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(args.concurrency) as executor:
+        latencies = sorted(executor.map(lambda i: query(i, args.host, args.port), range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"{args.requests:,} requests in {elapsed:,.2f}s ({args.requests / elapsed:,.0f} req/s)")
+    print(f"Client latency: p50 {percentiles[49]:,.1f} ms, p99 {percentiles[98]:,.1f} ms")
+    print(f"Server metrics: {request('GET', '/metrics', args.host, args.port)[1]}")
@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 from datetime import date
-from typing import TYPE_CHECKING, Iterable
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable, Sequence
 
 from dateutil.relativedelta import relativedelta
 from orcaset import yield_and_return
-from orcaset.financial import Balance, BalanceSeries, BalanceSeriesBase, Period
+from orcaset.financial import Balance, BalanceSeries, BalanceSeriesBase
+
+from .debt import DebtSchedule, Tranche
+from .horizon import frequency, horizon, periods, trailing_quarter
 
 if TYPE_CHECKING:
     from .model import Traeger
@@ -66,10 +70,10 @@ class Receivables[P: Assets = Assets](BalanceSeriesBase[P]):
     def _balances(self) -> Iterable[Balance]:
         last_bal = yield from yield_and_return(self.historical)
 
-        for revenue in self.parent.parent.parent.income.pretax_income.operating_income.gross_profit.revenue.after(
-            last_bal.date
+        for end, revenue in trailing_quarter(
+            self.parent.parent.parent.income.pretax_income.operating_income.gross_profit.revenue, last_bal.date
         ):
-            yield Balance(revenue.period.end, revenue.value * self.pct_revenue)
+            yield Balance(end, revenue * self.pct_revenue)
 
 
 @dataclass
@@ -80,10 +84,10 @@ class Inventory[P: Assets = Assets](BalanceSeriesBase[P]):
     def _balances(self) -> Iterable[Balance]:
         last_bal = yield from yield_and_return(self.historical)
 
-        for cost in self.parent.parent.parent.income.pretax_income.operating_income.gross_profit.cost_of_revenue.after(
-            last_bal.date
+        for end, cost in trailing_quarter(
+            self.parent.parent.parent.income.pretax_income.operating_income.gross_profit.cost_of_revenue, last_bal.date
         ):
-            yield Balance(cost.period.end, cost.value * self.pct_cost_of_revenue)
+            yield Balance(end, cost * self.pct_cost_of_revenue)
 
 
 @dataclass
@@ -105,7 +109,7 @@ class PropertyPlantEquipment[P: Assets = Assets](BalanceSeriesBase[P]):
     def _balances(self) -> Iterable[Balance]:
         bal = yield from yield_and_return(self.historical)
 
-        for period in Period.series(bal.date, relativedelta(months=3, day=31)):
+        for period in periods(self, bal.date):
             bal = Balance(
                 period.end,
                 lambda b=bal, p=period: (
@@ -161,7 +165,7 @@ class OtherNonCurrentAssets[P: Assets = Assets](BalanceSeriesBase[P]):
     def _balances(self) -> Iterable[Balance]:
         last_bal = yield from yield_and_return(self.historical)
 
-        for period in Period.series(last_bal.date, relativedelta(months=3, day=31)):
+        for period in periods(self, last_bal.date):
             yield Balance(period.end, last_bal.value)
 
 
@@ -194,10 +198,10 @@ class AccountsPayable[P: Liabilities = Liabilities](BalanceSeriesBase[P]):
     def _balances(self) -> Iterable[Balance]:
         last_bal = yield from yield_and_return(self.historical)
 
-        for cost in self.parent.parent.parent.income.pretax_income.operating_income.gross_profit.cost_of_revenue.after(
-            last_bal.date
+        for end, cost in trailing_quarter(
+            self.parent.parent.parent.income.pretax_income.operating_income.gross_profit.cost_of_revenue, last_bal.date
         ):
-            yield Balance(cost.period.end, cost.value * self.pct_cost_of_revenue)
+            yield Balance(end, cost * self.pct_cost_of_revenue)
 
 
 @dataclass
@@ -208,10 +212,10 @@ class AccruedExpenses[P: Liabilities = Liabilities](BalanceSeriesBase[P]):
     def _balances(self) -> Iterable[Balance]:
         last_bal = yield from yield_and_return(self.historical)
 
-        for cost in self.parent.parent.parent.income.pretax_income.operating_income.gross_profit.cost_of_revenue.after(
-            last_bal.date
+        for end, cost in trailing_quarter(
+            self.parent.parent.parent.income.pretax_income.operating_income.gross_profit.cost_of_revenue, last_bal.date
         ):
-            yield Balance(cost.period.end, cost.value * self.pct_cost_of_revenue)
+            yield Balance(end, cost * self.pct_cost_of_revenue)
 
 
 @dataclass
@@ -222,10 +226,10 @@ class OtherCurrentLiabilities[P: Liabilities = Liabilities](BalanceSeriesBase[P]
     def _balances(self) -> Iterable[Balance]:
         last_bal = yield from yield_and_return(self.historical)
 
-        for opex in self.parent.parent.parent.income.pretax_income.operating_income.operating_expenses.after(
-            last_bal.date
+        for end, opex in trailing_quarter(
+            self.parent.parent.parent.income.pretax_income.operating_income.operating_expenses, last_bal.date
         ):
-            yield Balance(opex.period.end, opex.value * -self.pct_opex)
+            yield Balance(end, opex * -self.pct_opex)
 
 
 @dataclass
@@ -242,11 +246,32 @@ class Revolver[P: Liabilities = Liabilities](BalanceSeriesBase[P]):
 
 @dataclass
 class LongTermDebt[P: Liabilities = Liabilities](BalanceSeriesBase[P]):
+    """
+    Projected from the debt schedule of `tranches` starting at the last historical balance. Without tranches, the
+    last historical balance is carried forward.
+
+    Tranche opening balances should sum to the last historical balance, otherwise the difference is a draw or
+    repayment in the first projected period.
+    """
+
     historical: "BalanceSeriesBase[LongTermDebt]"
+    tranches: Sequence[Tranche] = ()
+
+    @cached_property
+    def schedule(self) -> DebtSchedule:
+        *_, last_bal = self.historical
+        return DebtSchedule(self.tranches, last_bal.date, frequency(self))
 
     def _balances(self) -> Iterable[Balance]:
         bal = yield from yield_and_return(self.historical)
-        while True:
+        end = horizon(self)
+        if self.tranches:
+            for step in self.schedule:
+                yield Balance(step.period.end, step.balance)
+                if step.period.end >= end:
+                    return
+
+        while bal.date < end:
             bal = Balance(bal.date + relativedelta(years=1, day=31), bal.value)
             yield bal
 
@@ -258,7 +283,7 @@ class OtherNonCurrentLiabilities[P: Liabilities = Liabilities](BalanceSeriesBase
     def _balances(self) -> Iterable[Balance]:
         bal = yield from yield_and_return(self.historical)
 
-        for period in Period.series(bal.date, relativedelta(months=3, day=31)):
+        for period in periods(self, bal.date):
             bal = Balance(period.end, bal.value)
             yield bal
 
@@ -1,15 +1,44 @@
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 from itertools import pairwise
 from typing import TYPE_CHECKING, Iterable
 
-from orcaset.financial import Payment, PaymentSeriesBase
+from orcaset.financial import BalanceSeriesBase, Payment, PaymentSeriesBase
+
+from .streams import BalanceColumn
 
 if TYPE_CHECKING:
     from .model import Traeger
 
 
+@dataclass
+class BalanceDelta[P](PaymentSeriesBase[P], ABC):
+    """
+    Change between consecutive balances of a balance sheet series, dated at the later balance.
+
+    The series is built once per node and read through a `BalanceColumn`, so every pass over the payments (e.g. from
+    the cash flow statement and again through `CashFlowBeforeRevolver` to cash) replays the balances already read
+    instead of rebuilding and re-walking the balance expression. Subclasses return the balance series from
+    `_balance_series`.
+    """
+
+    @abstractmethod
+    def _balance_series(self) -> BalanceSeriesBase: ...
+
+    @cached_property
+    def column(self) -> BalanceColumn:
+        return BalanceColumn(self._balance_series())
+
+    def _payments(self) -> Iterable[Payment]:
+        for bal1, bal2 in pairwise(self.column):
+            yield Payment(bal2.date, bal2.value - bal1.value)
+
+
 @dataclass
 class CashFlow[P: Traeger = Traeger](PaymentSeriesBase[P]):
+    """Historical cash flows are estimated from the historical income statement and balance sheet."""
+
     operating: "OperatingActivities[CashFlow]"
     investing: "InvestingActivities[CashFlow]"
     financing: "FinancingActivities[CashFlow]"
@@ -59,20 +88,17 @@ class IntangibleAmortization[P: OperatingActivities = OperatingActivities](Payme
 
 
 @dataclass
-class ChangesInWorkingCapital[P: OperatingActivities = OperatingActivities](PaymentSeriesBase[P]):
-    def _payments(self) -> Iterable[Payment]:
+class ChangesInWorkingCapital[P: OperatingActivities = OperatingActivities](BalanceDelta[P]):
+    def _balance_series(self) -> BalanceSeriesBase:
         assets = self.parent.parent.parent.balance_sheet.assets
         liabilities = self.parent.parent.parent.balance_sheet.liabilities
-        working_capital = (
+        return (
             liabilities.accounts_payable
             + liabilities.accrued_expenses
             + liabilities.other_current_liabilities
             + -(assets.receivables + assets.inventory + assets.other_current_assets)
         )
 
-        for bal1, bal2 in pairwise(working_capital):
-            yield Payment(bal2.date, bal2.value - bal1.value)
-
 
 @dataclass
 class InvestingActivities[P: CashFlow = CashFlow](PaymentSeriesBase[P]):
@@ -98,23 +124,15 @@ class FinancingActivities[P: CashFlow = CashFlow](PaymentSeriesBase[P]):
 
 
 @dataclass
-class LongTermDebt[P: FinancingActivities = FinancingActivities](PaymentSeriesBase[P]):
-    def _payments(self) -> Iterable[Payment]:
-        for bal1, bal2 in pairwise(
-            self.parent.parent.parent.balance_sheet.liabilities.long_term_debt
-        ):
-            yield Payment(bal2.date, bal2.value - bal1.value)
+class LongTermDebt[P: FinancingActivities = FinancingActivities](BalanceDelta[P]):
+    def _balance_series(self) -> BalanceSeriesBase:
+        return self.parent.parent.parent.balance_sheet.liabilities.long_term_debt
 
 
 @dataclass
-class Revolver[P: FinancingActivities = FinancingActivities](PaymentSeriesBase[P]):
-
-    def _payments(self) -> Iterable[Payment]:
-        for bal1, bal2 in pairwise(self.parent.parent.parent.balance_sheet.liabilities.revolver):
-            yield Payment(bal2.date, bal2.value - bal1.value)
-
-
-print("NOTE: Historical cash flows estimated from historical income and balance sheet.")
+class Revolver[P: FinancingActivities = FinancingActivities](BalanceDelta[P]):
+    def _balance_series(self) -> BalanceSeriesBase:
+        return self.parent.parent.parent.balance_sheet.liabilities.revolver
 
 
 if __name__ == "__main__":
@@ -15,6 +15,9 @@ from orcaset.financial import (
     Period,
 )
 
+from .horizon import QUARTER, frequency, horizon
+from .numeric import minimum
+
 if TYPE_CHECKING:
     from .model import Traeger
 
@@ -37,8 +40,9 @@ class Depreciation[P: Footnotes = Footnotes](AccrualSeriesBase[P]):
     def _accruals(self) -> Iterable[Accrual]:
         acc = yield from yield_and_return(self.historical)
 
-        while True:
-            period = Period(acc.period.end, acc.period.end + relativedelta(months=3, day=31))
+        end, freq = horizon(self), frequency(self)
+        while acc.period.end < end:
+            period = Period(acc.period.end, acc.period.end + freq)
             acc = Accrual(
                 period=period,
                 value=acc.value / acc.yf(*acc.period) * acc.yf(*period) * (1 + self.growth_rate * acc.yf(*period)),
@@ -55,12 +59,14 @@ class CapitalExpenditures[P: Footnotes = Footnotes](PaymentSeriesBase[P]):
     def _payments(self) -> Iterable[Payment]:
         pmt = yield from yield_and_return(self.historical)
 
-        while True:
-            dt1, dt2 = pmt.date, pmt.date + relativedelta(months=3, day=31)
-            pmt = Payment(
-                dt2,
-                pmt.value * (1 + self.growth_rate * YF.cmonthly(dt1, dt2)),
-            )
+        end, freq = horizon(self), frequency(self)
+        step = QUARTER  # Historical payments are quarterly
+        while pmt.date < end:
+            dt1, dt2 = pmt.date, pmt.date + freq
+            value = pmt.value
+            if (prior_step := step) != (step := YF.cmonthly(dt1, dt2)):
+                value = value / prior_step * step
+            pmt = Payment(dt2, value * (1 + self.growth_rate * step))
             yield pmt
 
 
@@ -87,7 +93,7 @@ class NetRevolverDraws[P: Footnotes = Footnotes](PaymentSeriesBase[P]):
             def make_bal(p: Payment):
                 def inner():
                     prior_bal = self.parent.parent.balance_sheet.assets.cash.at(p.date - relativedelta(days=1))
-                    ret_val = -min(p.value + (prior_bal - self.min_cash), (prior_bal - self.min_cash))
+                    ret_val = -minimum(p.value + (prior_bal - self.min_cash), (prior_bal - self.min_cash))
                     return ret_val
 
                 return inner
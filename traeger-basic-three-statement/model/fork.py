@@ -0,0 +1,160 @@
+from collections import defaultdict
+from dataclasses import fields, replace
+from typing import Any
+
+from orcaset import Node
+from orcaset.financial import AccrualSeries, BalanceSeries, PaymentSeries
+
+from . import balance_sheet as bs
+from . import footnotes as fn
+from . import income as inc
+from .query import line_items
+
+_OPERATING = "income/pretax_income/operating_income"
+
+# Cached properties calculated from a node's own fields alone, with the fields (or the settings of an ancestor, such
+# as the model `frequency`) they are calculated from. A fork reuses the cached value while none of those are
+# overridden.
+OWN_CACHES: dict[type, dict[str, tuple[str, ...]]] = {
+    bs.LongTermDebt: {"schedule": ("historical", "tranches", "frequency")},
+}
+
+# Line items each type reads through its parents, as `/`-separated paths from the model root, besides its own child
+# line items and the model `horizon` and `frequency`. A fork of a model shares a line item of a listed type when
+# none of its fields, the line items it reads or its children are overridden, directly or through what they read.
+# Types not listed are always copied.
+READS: dict[type, tuple[str, ...]] = {
+    inc.OperatingIncome: (),
+    inc.GrossProfit: (),
+    inc.Revenue: (),
+    inc.CostOfRevenue: (f"{_OPERATING}/gross_profit/revenue",),
+    inc.OperatingExpenses: (),
+    inc.SalesAndMarketing: (f"{_OPERATING}/gross_profit/revenue",),
+    inc.GeneralAndAdmin: (),
+    inc.AmortOfIntangibles: (),
+    inc.OtherIncome: (),
+    fn.Depreciation: (),
+    fn.CapitalExpenditures: (),
+    bs.Receivables: (f"{_OPERATING}/gross_profit/revenue",),
+    bs.Inventory: (f"{_OPERATING}/gross_profit/cost_of_revenue",),
+    bs.OtherCurrentAssets: ("balance_sheet/assets/inventory",),
+    bs.PropertyPlantEquipment: ("footnotes/depreciation", "footnotes/capital_expenditures"),
+    bs.IntangibleAssets: (),
+    bs.TotalCost: (),
+    bs.AccumulatedAmortization: (f"{_OPERATING}/operating_expenses/amort_of_intangibles",),
+    bs.OtherNonCurrentAssets: (),
+    bs.AccountsPayable: (f"{_OPERATING}/gross_profit/cost_of_revenue",),
+    bs.AccruedExpenses: (f"{_OPERATING}/gross_profit/cost_of_revenue",),
+    bs.OtherCurrentLiabilities: (f"{_OPERATING}/operating_expenses",),
+    bs.LongTermDebt: (),
+    bs.OtherNonCurrentLiabilities: (),
+}
+
+
+def fork[N: Node](node: N, **overrides: Any) -> N:
+    """
+    Scenario copy of `node` with `overrides` applied.
+
+    Overrides are keyed by `__`-separated field paths relative to `node`, e.g. `income__tax_expense__tax_rate=0.25`
+    or `horizon=date(2030, 12, 31)`. Historical input series, assumptions (rates, curves, tranches) and cached values
+    in `OWN_CACHES` are shared with `node`, including anything they have already materialized.
+
+    Forking a whole model also shares the projected line items outside the overrides' dependency cone (see `READS`),
+    e.g. revenue, operating expenses, depreciation and capital expenditures when only `tax_rate` changes, along with
+    their materialized values. Every other projected line item is a new node with an empty cache. Creating a fork
+    evaluates nothing.
+
+    ```python
+    with traeger.fork(income__pretax_income__interest_expense__interest_rate=0.1) as trg:
+        trg.balance_sheet.assets.cash.at(date(2026, 12, 31))
+    ```
+    """
+    from .model import Traeger
+
+    shared = _shared(node, overrides) if isinstance(node, Traeger) else frozenset()
+    return _fork(node, overrides, frozenset(), shared, "")
+
+
+def _shared(root: Node, overrides: dict[str, Any]) -> frozenset[str]:
+    """Paths of the line items below `root` that a fork with `overrides` can share with `root`."""
+    owners = ["/".join(key.split("__")[:-1]) for key in overrides]
+    items = dict(line_items(root))
+    children: dict[str, list[str]] = defaultdict(list)
+    for path in items:
+        children[path.rpartition("/")[0]].append(path)
+
+    def touched(path: str) -> bool:
+        # Overriding a field changes its node and everything below it, and replaces every ancestor
+        return any(not o or o == path or path.startswith(f"{o}/") or o.startswith(f"{path}/") for o in owners)
+
+    shared = {path for path, item in items.items() if type(item) in READS and not touched(path)}
+    while dropped := {
+        path for path in shared if any(dep not in shared for dep in (*READS[type(items[path])], *children[path]))
+    }:
+        shared -= dropped
+    return frozenset(shared)
+
+
+def _fork[N: Node](node: N, overrides: dict[str, Any], changed: frozenset[str], shared: frozenset[str], path: str) -> N:
+    """
+    `fork` of `node` at `path` below ancestors whose fields in `changed` are overridden, keeping the line items at
+    `shared` paths.
+    """
+    names = {field.name for field in fields(node) if field.init}
+    changes: dict[str, Any] = {}
+    nested: dict[str, dict[str, Any]] = {}
+    for key, value in overrides.items():
+        name, _, rest = key.partition("__")
+        if name not in names:
+            raise ValueError(f"{type(node).__name__} has no field {name!r}")
+        if rest:
+            nested.setdefault(name, {})[rest] = value
+        else:
+            changes[name] = value
+
+    changed = changed | changes.keys() | nested.keys()
+    for name in names - changes.keys():
+        child, child_path = getattr(node, name), f"{path}{name}"
+        if name in nested:
+            if not isinstance(child, Node):
+                raise ValueError(f"{type(node).__name__}.{name} is not a node")
+            changes[name] = _fork(child, nested[name], changed, shared, f"{child_path}/")
+        elif child_path in shared:
+            continue
+        elif isinstance(child, Node) and not isinstance(child, (AccrualSeries, BalanceSeries, PaymentSeries)):
+            changes[name] = _fork(child, {}, changed, shared, f"{child_path}/")
+
+    copy = replace(node, **changes)
+    for attr, depends_on in OWN_CACHES.get(type(node), {}).items():
+        if attr in vars(node) and changed.isdisjoint(depends_on):
+            vars(copy)[attr] = vars(node)[attr]
+    return copy
+
+
+if __name__ == "__main__":
+    import time
+    from datetime import date
+
+    from base_case import Assumptions, build_traeger, traeger
+
+    end = date(2027, 12, 31)
+    with traeger as trg:
+        base_cash = trg.balance_sheet.assets.cash.at(end)
+
+    start = time.perf_counter()
+    forks = [traeger.fork(income__tax_expense__tax_rate=0.15 + i * 0.001) for i in range(100)]
+    fork_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(100):
+        build_traeger(type("Scenario", (Assumptions,), {"tax_rate": 0.15 + i * 0.001}))
+    build_time = time.perf_counter() - start
+
+    shared = _shared(traeger, {"income__tax_expense__tax_rate": 0.15})
+    print(f"100 forks: {fork_time * 1000:,.1f} ms, 100 builds: {build_time * 1000:,.1f} ms")
+    print(f"Line items shared by a tax rate fork: {len(shared)} of {len(dict(line_items(traeger)))}")
+    print("\n| Tax Rate | Cash at 2027-12-31 |\n| --- | --- |")
+    print(f"| Base | {base_cash:,.0f} |")
+    for i in (0, 50, 99):
+        with forks[i] as trg:
+            print(f"| {0.15 + i * 0.001:.3f} | {trg.balance_sheet.assets.cash.at(end):,.0f} |")
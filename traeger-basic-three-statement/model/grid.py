@@ -0,0 +1,103 @@
+from bisect import bisect_left, bisect_right
+from datetime import date
+from itertools import accumulate
+from typing import Iterable, Sequence
+
+from orcaset.financial import Accrual, AccrualSeriesBase, Balance, BalanceSeriesBase, Payment, PaymentSeriesBase
+
+
+def accrue_grid(series: Iterable[Accrual], dates: Sequence[date]) -> list[float]:
+    """
+    Accrued value of `series` over each consecutive pair of `dates` from a single pass over its accruals.
+
+    Equivalent to `[series.accrue(d1, d2) for d1, d2 in pairwise(dates)]` without re-walking the series for
+    every period. Accruals straddling a grid date are pro-rated using their own year fraction. `dates` must be
+    strictly increasing.
+    """
+    values = [0.0] * (len(dates) - 1)
+    if not values:
+        return values
+
+    first, last = dates[0], dates[-1]
+    for acc in series:
+        start, end = acc.period
+        if end <= first:
+            continue
+        if start >= last:
+            break
+
+        total_yf = acc.yf(start, end)
+        if not total_yf:
+            continue
+        rate = acc.value / total_yf
+
+        i = max(bisect_right(dates, start) - 1, 0)
+        while i < len(values) and dates[i] < end:
+            lo, hi = max(start, dates[i]), min(end, dates[i + 1])
+            if hi > lo:
+                values[i] += rate * acc.yf(lo, hi)
+            i += 1
+
+    return values
+
+
+def cumulative(series: Iterable[Accrual], dates: Sequence[date]) -> list[float]:
+    """Accrued value of `series` from `dates[0]` to each date in `dates`."""
+    return list(accumulate(accrue_grid(series, dates), initial=0.0))
+
+
+def balances_at(series: Iterable[Balance], dates: Sequence[date]) -> list[float]:
+    """
+    Value of `series` at each of the ascending `dates` from a single pass over its balances.
+
+    Equivalent to `[series.at(dt) for dt in dates]`. Dates before the first balance are zero.
+    """
+    values = []
+    balances = iter(series)
+    prior, following = None, next(balances, None)
+
+    for dt in dates:
+        while following is not None and following.date <= dt:
+            prior, following = following, next(balances, None)
+        values.append(prior.value if prior is not None else 0.0)
+
+    return values
+
+
+def payments_over(series: Iterable[Payment], dates: Sequence[date]) -> list[float]:
+    """
+    Sum of `series` payments over each consecutive pair of `dates` from a single pass over its payments.
+
+    Equivalent to `[series.over(d1, d2) for d1, d2 in pairwise(dates)]`. Payments dated after the start and on or
+    before the end of a period are included in the period.
+    """
+    values = [0.0] * (len(dates) - 1)
+    if not values:
+        return values
+
+    first, last = dates[0], dates[-1]
+    for pmt in series:
+        if pmt.date <= first:
+            continue
+        if pmt.date > last:
+            break
+        values[bisect_left(dates, pmt.date) - 1] += pmt.value
+
+    return values
+
+
+def series_values(
+    series: AccrualSeriesBase | PaymentSeriesBase | BalanceSeriesBase, dates: Sequence[date]
+) -> list[float]:
+    """
+    Value of a line item for each period between consecutive `dates`.
+
+    Accruals are accrued and payments summed over each period. Balances are taken at each period end.
+    """
+    if isinstance(series, AccrualSeriesBase):
+        return accrue_grid(series, dates)
+    if isinstance(series, PaymentSeriesBase):
+        return payments_over(series, dates)
+    if isinstance(series, BalanceSeriesBase):
+        return balances_at(series, dates[1:])
+    raise TypeError(f"{type(series).__name__} is not a line item")
@@ -0,0 +1,87 @@
+from collections import deque
+from datetime import date
+from typing import Any, Iterable, Iterator, Literal
+
+from dateutil.relativedelta import relativedelta
+from orcaset.financial import Accrual, Period
+
+type Frequency = Literal["monthly", "quarterly"]
+
+FREQUENCIES: dict[str, relativedelta] = {
+    "monthly": relativedelta(months=1, day=31),
+    "quarterly": relativedelta(months=3, day=31),
+}
+
+# Year fraction of a quarter. Growth rates and historical payments are quarterly.
+QUARTER = 0.25
+_QUARTER_BACK = relativedelta(months=-3, day=31)
+
+
+def horizon(node: Any) -> date:
+    """
+    Last date projected by the model containing `node`, set by the nearest ancestor with a `horizon` date.
+
+    Projected series stop after the period containing the horizon, so lazily cached series retain a bounded number
+    of items. Defaults to `date.max` (unbounded).
+    """
+    while node is not None:
+        if isinstance(end := getattr(node, "horizon", None), date):
+            return end
+        node = getattr(node, "parent", None)
+    return date.max
+
+
+def frequency(node: Any) -> relativedelta:
+    """
+    Step of projected series in the model containing `node`, set by the nearest ancestor with a `frequency`.
+
+    Defaults to quarterly. Series that step annually (e.g. general and administrative expense) are unaffected.
+    """
+    while node is not None:
+        if isinstance(name := getattr(node, "frequency", None), str):
+            return FREQUENCIES[name]
+        node = getattr(node, "parent", None)
+    return FREQUENCIES["quarterly"]
+
+
+def trailing_quarter(accruals: Iterable[Accrual], start: date) -> Iterator[tuple[date, Any]]:
+    """
+    `(period end, value accrued over the quarter ending then)` for each of `accruals` ending after `start`.
+
+    For ratios calibrated on quarterly flows (e.g. receivables to revenue). Quarterly accruals are returned
+    unchanged. Shorter accruals are summed with the others in the trailing quarter, pro-rating any that start before
+    it (such as the last historical quarter), so monthly and quarterly models give the same ratio at quarter ends.
+    """
+    window: deque[Accrual] = deque()
+    for acc in accruals:
+        end = acc.period.end
+        begin = end + _QUARTER_BACK
+        window.append(acc)
+        while window[0].period.end <= begin:
+            window.popleft()
+        if end <= start:
+            continue
+        if acc.period.start == begin:
+            yield end, acc.value
+        else:
+            yield end, sum(a.value * a.yf(max(a.period.start, begin), a.period.end) / a.yf(*a.period) for a in window)
+
+
+def periods(node: Any, start: date, freq: relativedelta | None = None) -> Iterator[Period]:
+    """
+    `Period.series(start, freq)` through the period containing the horizon of `node`'s model.
+
+    `freq` defaults to the frequency of `node`'s model.
+    """
+    end = horizon(node)
+    for period in Period.series(start, freq or frequency(node)):
+        yield period
+        if period.end >= end:
+            return
+
+
+def grid(node: Any, start: date, freq: relativedelta | None = None) -> list[date]:
+    """`start` and every period end through the horizon of `node`'s model, for sizing results up front."""
+    if horizon(node) == date.max:
+        raise ValueError("The model has no horizon to size a grid to")
+    return [start] + [end for _, end in periods(node, start, freq)]
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, Literal, Sequence
 
 from dateutil.relativedelta import relativedelta
 from orcaset import yield_and_return
-from orcaset.financial import Accrual, AccrualSeries, AccrualSeriesBase, Period
+from orcaset.financial import Accrual, AccrualSeries, AccrualSeriesBase, Balance, BalanceSeriesBase, Period
+
+from .curves import StepCurve
+from .horizon import FREQUENCIES, QUARTER, frequency, horizon, periods
+from .streams import BalanceColumn
 
 if TYPE_CHECKING:
     from .model import Traeger
@@ -46,19 +50,45 @@ class PretaxIncome[P: NetIncome = NetIncome](AccrualSeriesBase[P]):
 
 @dataclass
 class InterestExpense[P: PretaxIncome = PretaxIncome](AccrualSeriesBase[P]):
+    """
+    Interest and fees from the long-term debt schedule, plus `interest_rate` on `rate_debt` (the revolver, and
+    long-term debt without tranches).
+
+    `mode` sets the balance `interest_rate` accrues on: the balance at the start of each period (`"beginning"`) or the
+    average of the start and end balances (`"average"`). The end balance depends on the period's interest through
+    cash, so `"average"` reads it from `debt_path`, the debt balances from a prior iteration (see
+    `analytics.interest.converge`). Without a `debt_path` both modes use the beginning balance.
+    """
+
     historical: "AccrualSeries[list[Accrual], InterestExpense]"
     interest_rate: float
+    mode: Literal["beginning", "average"] = "beginning"
+    debt_path: Sequence[Balance] = ()
+
+    @property
+    def rate_debt(self) -> BalanceSeriesBase:
+        liabilities = self.parent.parent.parent.balance_sheet.liabilities
+        if liabilities.long_term_debt.tranches:
+            return liabilities.revolver
+        return liabilities.revolver + liabilities.long_term_debt
 
     def _accruals(self) -> Iterable[Accrual]:
         last_acc = yield from yield_and_return(self.historical)
 
-        liabilities = self.parent.parent.parent.balance_sheet.liabilities
-        total_debt = liabilities.revolver + liabilities.long_term_debt
+        schedule = self.parent.parent.parent.balance_sheet.liabilities.long_term_debt.schedule
+        debt = BalanceColumn(self.rate_debt)
+        path = BalanceColumn(self.debt_path)
 
-        for period in Period.series(last_acc.period.end, relativedelta(months=3, day=31)):
+        def balance(period: Period) -> float:
+            opening = debt.at(period.start)
+            if self.mode == "beginning" or not self.debt_path:
+                return opening
+            return (opening + path.at(period.end)) / 2
+
+        for period in periods(self, last_acc.period.end):
             yield Accrual(
                 period=period,
-                value=lambda td=total_debt: td.at(period.start) * -self.interest_rate * last_acc.yf(*period),
+                value=lambda p=period: -(balance(p) * self.interest_rate * last_acc.yf(*p) + schedule.cost(*p)),
                 yf=last_acc.yf,
             )
 
@@ -73,7 +103,8 @@ class OtherIncome[P: PretaxIncome = PretaxIncome](AccrualSeriesBase[P]):
     def _accruals(self) -> Iterable[Accrual]:
         last_acc = yield from yield_and_return(self.historical)
 
-        while True:
+        end = horizon(self)
+        while last_acc.period.end < end:
             period = Period(last_acc.period.end, last_acc.period.end + relativedelta(years=1, day=31))
             last_acc = Accrual(period=period, value=self.projected_amt, yf=last_acc.yf)
             yield last_acc
@@ -110,22 +141,36 @@ class GrossProfit[P: OperatingIncome = OperatingIncome](AccrualSeriesBase[P]):
 @dataclass
 class Revenue[P: GrossProfit = GrossProfit](AccrualSeriesBase[P]):
     historical: "AccrualSeries[list[Accrual], Revenue]"
-    growth_rates: "AccrualSeries[list[Accrual], Revenue]"
+    growth_rates: StepCurve
 
     def _accruals(self) -> Iterable[Accrual]:
         acc = yield from yield_and_return(self.historical)
 
-        while True:
-            period = Period(acc.period.end, acc.period.end + relativedelta(months=3, day=31))
+        end, freq = horizon(self), frequency(self)
+        while acc.period.end < end:
+            period = Period(acc.period.end, acc.period.end + FREQUENCIES["quarterly"])
+            growth = 1 + self.growth_rates.w_avg(*period)
             acc = Accrual(
                 period=period,
-                value=acc.value
-                / acc.yf(*acc.period)
-                * acc.yf(*period)
-                * (1 + self.growth_rates.w_avg(*period)),
+                value=acc.value / acc.yf(*acc.period) * acc.yf(*period) * growth,
                 yf=acc.yf,
             )
-            yield acc
+            if freq == FREQUENCIES["quarterly"]:
+                yield acc
+                continue
+
+            # Split the quarter into steps growing at the quarter's rate, so each quarter totals the same as in a
+            # quarterly model
+            steps = []
+            while not steps or steps[-1].end < period.end:
+                step_start = steps[-1].end if steps else period.start
+                steps.append(Period(step_start, min(step_start + freq, period.end)))
+            weights = [acc.yf(*step) * growth ** (acc.yf(period.start, step.start) / QUARTER) for step in steps]
+            total = sum(weights)
+            for step, weight in zip(steps, weights):
+                yield Accrual(period=step, value=acc.value * (weight / total), yf=acc.yf)
+                if step.end >= end:
+                    return
 
 
 @dataclass
@@ -155,12 +200,13 @@ class SalesAndMarketing[P: OperatingExpenses = OperatingExpenses](AccrualSeriesB
 @dataclass
 class GeneralAndAdmin[P: OperatingExpenses = OperatingExpenses](AccrualSeriesBase[P]):
     historical: "AccrualSeries[list[Accrual], GeneralAndAdmin]"
-    growth_rates: "AccrualSeries[list[Accrual], GeneralAndAdmin]"
+    growth_rates: StepCurve
 
     def _accruals(self) -> Iterable[Accrual]:
         acc = yield from yield_and_return(self.historical)
 
-        while True:
+        end = horizon(self)
+        while acc.period.end < end:
             period = Period(
                 acc.period.end,
                 acc.period.end + relativedelta(years=1, day=31),
@@ -184,7 +230,8 @@ class AmortOfIntangibles[P: OperatingExpenses = OperatingExpenses](AccrualSeries
     def _accruals(self) -> Iterable[Accrual]:
         acc = yield from yield_and_return(self.historical)
 
-        while True:
+        end = horizon(self)
+        while acc.period.end < end:
             period = Period(acc.period.end, acc.period.end + relativedelta(years=1, day=31))
             acc = Accrual(
                 period=period,
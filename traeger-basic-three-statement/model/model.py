@@ -1,19 +1,41 @@
 from dataclasses import dataclass
+from datetime import date
+from typing import Any, Sequence
 
 from orcaset import Node
 
 from .balance_sheet import BalanceSheet
 from .cash_flow import CashFlow
 from .footnotes import Footnotes
+from .fork import fork
+from .horizon import Frequency
 from .income import NetIncome
+from .query import query
 
 
 @dataclass
 class Traeger[P = None](Node[P]):
+    """
+    Attributes:
+        horizon: Last date projected. Every projected series stops after the period containing it, which bounds the
+            items cached per series in large batch runs. Unbounded by default.
+        frequency: Step of projected series that are not annual. Quarterly by default.
+    """
+
     income: "NetIncome[Traeger]"
     balance_sheet: "BalanceSheet[Traeger]"
     cash_flow: "CashFlow[Traeger]"
     footnotes: "Footnotes[Traeger]"
+    horizon: date = date.max
+    frequency: Frequency = "quarterly"
+
+    def query(self, pattern: str, dates: Sequence[date]) -> dict[str, list[float]]:
+        """Values of every line item matching the path glob `pattern` over each period between `dates`."""
+        return query(self, pattern, dates)
+
+    def fork(self, **overrides: Any) -> "Traeger[P]":
+        """Scenario copy with `overrides` keyed by `__`-separated field paths. See `model.fork.fork`."""
+        return fork(self, **overrides)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,29 @@
+import math
+from typing import Any
+
+
+def minimum(a: Any, b: Any) -> Any:
+    """
+    `min(a, b)` that also supports the non-float values that can flow through the model.
+
+    Values with a `minimum` static method (e.g. path vectors in a Monte Carlo run) take the elementwise minimum
+    themselves, since they cannot be ordered as a whole.
+    """
+    for value in (a, b):
+        if hasattr(type(value), "minimum"):
+            return type(value).minimum(a, b)
+    return min(a, b)
+
+
+def divide(a: Any, b: Any, default: float = math.inf) -> Any:
+    """
+    `a / b` where `b` is positive and `default` elsewhere, for ratios such as leverage that also supports the
+    non-float values that can flow through the model.
+
+    Values with a `divide` static method (e.g. path vectors in a Monte Carlo run) apply the condition elementwise
+    themselves.
+    """
+    for value in (a, b):
+        if hasattr(type(value), "divide"):
+            return type(value).divide(a, b, default)
+    return a / b if b > 0 else default
@@ -0,0 +1,96 @@
+from dataclasses import fields
+from datetime import date
+from fnmatch import fnmatchcase
+from operator import attrgetter
+from typing import Callable, Iterator, Sequence
+
+from orcaset import Node
+from orcaset.financial import (
+    AccrualSeries,
+    AccrualSeriesBase,
+    BalanceSeries,
+    BalanceSeriesBase,
+    PaymentSeries,
+    PaymentSeriesBase,
+)
+
+from .grid import series_values
+
+type Accessor = tuple[str, Callable[[Node], Node]]
+
+_compiled: dict[tuple[type, str], list[Accessor]] = {}
+
+
+def line_items(node: Node, prefix: str = "") -> Iterator[tuple[str, Node]]:
+    """
+    Yield `(path, node)` for every line item below `node` in depth-first order.
+
+    Paths join attribute names with `/` relative to `node`, e.g. `assets/cash`. Historical input series are inputs
+    rather than line items and are skipped.
+    """
+    for field in fields(node):
+        child = getattr(node, field.name)
+        if not isinstance(child, Node) or isinstance(child, (AccrualSeries, BalanceSeries, PaymentSeries)):
+            continue
+        path = f"{prefix}{field.name}"
+        yield path, child
+        yield from line_items(child, f"{path}/")
+
+
+def _matches(pattern: Sequence[str], path: Sequence[str]) -> bool:
+    if not pattern:
+        return not path
+    head, rest = pattern[0], pattern[1:]
+    if head == "**":
+        return any(_matches(rest, path[i:]) for i in range(len(path) + 1))
+    return bool(path) and fnmatchcase(path[0], head) and _matches(rest, path[1:])
+
+
+def compile_path(node: Node, pattern: str) -> list[Accessor]:
+    """
+    `(path, accessor)` for every accrual, balance or payment series below `node` matching the glob `pattern`.
+
+    Pattern segments are separated by `/`. `*` matches within one segment and `**` matches any number of segments,
+    e.g. `income/**/revenue` or `balance_sheet/assets/*`. Grouping nodes that are not series (e.g. `footnotes`) are
+    never matched. Paths are matched once per model class and pattern and the compiled accessors are cached.
+    """
+    key = (type(node), pattern)
+    if key not in _compiled:
+        parts = pattern.strip("/").split("/")
+        _compiled[key] = [
+            (path, attrgetter(path.replace("/", ".")))
+            for path, item in line_items(node)
+            if isinstance(item, (AccrualSeriesBase, BalanceSeriesBase, PaymentSeriesBase))
+            and _matches(parts, path.split("/"))
+        ]
+    return _compiled[key]
+
+
+def query(node: Node, pattern: str, dates: Sequence[date]) -> dict[str, list[float]]:
+    """
+    Values of every line item below `node` matching `pattern` for each period between consecutive `dates`.
+
+    ```python
+    with traeger as trg:
+        query(trg, "income/**/revenue", dates)
+    ```
+    """
+    return {path: series_values(get(node), dates) for path, get in compile_path(node, pattern)}
+
+
+if __name__ == "__main__":
+    from dateutil.relativedelta import relativedelta
+    from orcaset.financial import Period
+
+    from base_case import traeger
+
+    quarters = Period.series(date(2024, 12, 31), relativedelta(months=3, day=31), relativedelta(years=2))
+    dates = [date(2024, 12, 31)] + [end for _, end in quarters]
+
+    with traeger as trg:
+        results = trg.query("balance_sheet/*/*", dates)
+
+    print("| Line Item | " + " | ".join(dt.isoformat() for dt in dates[1:]) + " |")
+    print("| --- |" + " --- |" * (len(dates) - 1))
+    for path, values in results.items():
+        print(f"| {path} | " + " | ".join(f"{v:,.0f}" for v in values) + " |")
@@ -0,0 +1,85 @@
+from bisect import bisect_left, bisect_right
+from datetime import date
+from itertools import islice
+from typing import Iterable, Iterator
+
+from orcaset.financial import Balance
+
+
+class BalanceColumn:
+    """
+    Balances of a series read once, in date order, as later dates are needed.
+
+    Lookups bisect the balances read so far instead of walking the series from its first balance, and iterating the
+    column again replays them. Balance values are only evaluated when looked up. If the column is used while it is
+    itself reading the series (a balance in the series depends on the column), it falls back to the series.
+
+    ```python
+    debt = BalanceColumn(liabilities.revolver + liabilities.long_term_debt)
+    debt.at(date(2025, 6, 30))
+    ```
+    """
+
+    def __init__(self, series: Iterable[Balance]):
+        self.series = series
+        self._balances = iter(series)
+        self._dates: list[date] = []
+        self._items: list[Balance] = []
+        self._exhausted = False
+        self._reading = False
+
+    def _read_next(self) -> bool:
+        """Read one more balance. False if the series is exhausted."""
+        bal = next(self._balances, None)
+        if bal is None:
+            self._exhausted = True
+            return False
+        self._dates.append(bal.date)
+        self._items.append(bal)
+        return True
+
+    def _read_through(self, dt: date) -> bool:
+        """
+        Read balances until one is dated on or after `dt`. Stopping on a balance dated `dt` avoids generating the
+        next balance, which may itself depend on the lookup. False if the column is already reading.
+        """
+        if self._reading:
+            return False
+        self._reading = True
+        try:
+            while not self._exhausted and (not self._dates or self._dates[-1] < dt) and self._read_next():
+                pass
+        finally:
+            self._reading = False
+        return True
+
+    def __iter__(self) -> Iterator[Balance]:
+        """Balances in date order, reading further into the series only past the balances already read."""
+        i = 0
+        while True:
+            if i == len(self._items):
+                if self._exhausted:
+                    return
+                if self._reading:
+                    yield from islice(self.series, i, None)
+                    return
+                self._reading = True
+                try:
+                    if not self._read_next():
+                        return
+                finally:
+                    self._reading = False
+            yield self._items[i]
+            i += 1
+
+    def at(self, dt: date) -> float:
+        """Value of the last balance on or before `dt`, or zero before the first balance."""
+        if not self._read_through(dt):
+            return self.series.at(dt)  # type: ignore[attr-defined]
+        i = bisect_right(self._dates, dt) - 1
+        return self._items[i].value if i >= 0 else 0.0
+
+    def between(self, start: date, end: date) -> list[Balance]:
+        """Balances dated after `start` and before `end`."""
+        self._read_through(end)
+        return self._items[bisect_right(self._dates, start) : bisect_left(self._dates, end)]
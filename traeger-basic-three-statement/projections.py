@@ -52,6 +52,8 @@ with traeger as trg:
 # Cash Flow Statement Table
 print("\n## Cash Flow Statement")
 print()
+print("NOTE: Historical cash flows estimated from historical income and balance sheet.")
+print()
 header = ["Line Item"] + [end.isoformat() for _, end in cf_periods]
 print("| " + " | ".join(header) + " |")
 print("| " + " | ".join(["---"] * len(header)) + " |")
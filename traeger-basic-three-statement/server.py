@@ -0,0 +1,250 @@
+"""
+Model-serving ASGI app for projection queries against warm models.
+
+    uv run --with uvicorn uvicorn server:app
+
+`POST /query` takes a JSON body naming a registered model, optional assumption overrides and one or more line item
+queries over a date grid:
+
+    {
+        "model": "traeger",
+        "overrides": {"tax_rate": 0.25},
+        "queries": [{"path": "income/**/operating_income", "dates": ["2025-03-31", "2025-06-30"]}]
+    }
+
+Paths are `/`-separated globs (see `model.query.compile_path`) and each query is answered with the values of every
+matching line item by path, for each period between consecutive dates (balances at the end of each period). Models
+are built once per distinct set of overrides and kept warm, so series materialized by one request are reused by later
+ones. Requests for the same model that arrive within a short window are evaluated together.
+
+Malformed requests, unknown models or assumptions and paths matching no line item are answered with 400. Failures
+evaluating the model are answered with 500.
+
+`GET /metrics` reports request and error counts, batch sizes and p50/p99 latency.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Callable
+
+from base_case import Assumptions, build_traeger, scenario
+
+type Query = tuple[str, tuple[date, ...]]
+type Result = dict[str, list[float]]
+
+MODELS: dict[str, Callable[[type[Assumptions]], Any]] = {"traeger": build_traeger}
+
+
+class BadRequest(ValueError):
+    """A request that cannot be answered as written, as opposed to a failure evaluating the model."""
+
+
+class ModelPool:
+    """
+    Warm models keyed by model name and assumption overrides, with the results of queries already answered.
+
+    The least recently used model (and its results) is dropped beyond `max_models`.
+    """
+
+    def __init__(self, max_models: int = 32):
+        self.max_models = max_models
+        self._models: OrderedDict[tuple, Any] = OrderedDict()
+        self._results: dict[tuple, dict[Query, Result]] = {}
+        self.builds = 0
+        self.result_hits = 0
+
+    @staticmethod
+    def key(name: str, overrides: dict[str, Any]) -> tuple:
+        if name not in MODELS:
+            raise BadRequest(f"Unknown model {name!r}")
+        unknown = [k for k in overrides if k.startswith("_") or not any(k in vars(c) for c in Assumptions.__mro__)]
+        if unknown:
+            raise BadRequest(f"Unknown assumptions: {', '.join(unknown)}")
+        return (name, *sorted(overrides.items()))
+
+    def model(self, key: tuple) -> Any:
+        if key not in self._models:
+            name, *overrides = key
+            self._models[key] = MODELS[name](scenario(Assumptions, **dict(overrides)))
+            self._results[key] = {}
+            self.builds += 1
+            if len(self._models) > self.max_models:
+                evicted, _ = self._models.popitem(last=False)
+                del self._results[evicted]
+        self._models.move_to_end(key)
+        return self._models[key]
+
+    def evaluate(self, key: tuple, queries: list[Query]) -> list[Result | Exception]:
+        """
+        Answer `queries` against one model, evaluating each distinct query once.
+
+        A query that fails is answered with its exception, so it does not fail the other queries in the batch.
+        """
+        from model.grid import series_values
+        from model.query import compile_path
+
+        model, results = self.model(key), self._results[key]
+        errors: dict[Query, Exception] = {}
+        with model as m:
+            for query in dict.fromkeys(queries):
+                if query in results:
+                    self.result_hits += 1
+                    continue
+                pattern, dates = query
+                try:
+                    accessors = compile_path(m, pattern)
+                    if not accessors:
+                        raise BadRequest(f"No line items match {pattern!r}")
+                    results[query] = {path: series_values(get(m), dates) for path, get in accessors}
+                except Exception as err:
+                    errors[query] = err
+        return [errors[query] if query in errors else results[query] for query in queries]
+
+
+class Batcher:
+    """
+    Groups requests for the same model that arrive within `window` seconds into one evaluation.
+
+    Evaluations run one at a time on a worker thread, since model series are not safe to iterate concurrently. A
+    failed query fails only the requests that made it, and failing to build the model fails every request for it.
+    """
+
+    def __init__(self, pool: ModelPool, window: float = 0.002):
+        self.pool = pool
+        self.window = window
+        self.batch_sizes: deque[int] = deque(maxlen=10_000)
+        self._pending: dict[tuple, list[tuple[list[Query], asyncio.Future]]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model")
+
+    async def submit(self, key: tuple, queries: list[Query]) -> list[Result]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append((queries, future))
+        if len(self._pending[key]) == 1:
+            loop.call_later(self.window, lambda: asyncio.ensure_future(self._flush(key)))
+        return await future
+
+    async def _flush(self, key: tuple) -> None:
+        batch = self._pending.pop(key)
+        self.batch_sizes.append(len(batch))
+        queries = [query for request, _ in batch for query in request]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self._executor, self.pool.evaluate, key, queries)
+        except Exception as err:
+            for _, future in batch:
+                future.set_exception(err)
+            return
+
+        i = 0
+        for request, future in batch:
+            answers = results[i : i + len(request)]
+            i += len(request)
+            error = next((answer for answer in answers if isinstance(answer, Exception)), None)
+            if error is None:
+                future.set_result(answers)
+            else:
+                future.set_exception(error)
+
+
+class Metrics:
+    def __init__(self, size: int = 10_000):
+        self.latencies: deque[float] = deque(maxlen=size)
+        self.requests = 0
+        self.errors = 0
+
+    def report(self, pool: ModelPool, batcher: Batcher) -> dict[str, Any]:
+        ordered = sorted(self.latencies)
+
+        def pct(q: float) -> float | None:
+            return ordered[min(int(q * len(ordered)), len(ordered) - 1)] * 1000 if ordered else None
+
+        sizes = batcher.batch_sizes
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "latency_ms": {"p50": pct(0.5), "p99": pct(0.99)},
+            "mean_batch_size": sum(sizes) / len(sizes) if sizes else None,
+            "models_built": pool.builds,
+            "result_hits": pool.result_hits,
+        }
+
+
+def parse(body: bytes) -> tuple[tuple, list[Query]]:
+    """Model key and queries of a request body, raising `BadRequest` if it is malformed."""
+    try:
+        request = json.loads(body)
+        key = ModelPool.key(request.get("model", "traeger"), request.get("overrides", {}))
+        queries = [(str(q["path"]), tuple(date.fromisoformat(d) for d in q["dates"])) for q in request["queries"]]
+    except BadRequest:
+        raise
+    except (ValueError, KeyError, AttributeError, TypeError) as err:
+        raise BadRequest(f"Malformed request: {err}") from err
+    if any(len(dates) < 2 for _, dates in queries):
+        raise BadRequest("Each query needs at least two dates")
+    return key, queries
+
+
+pool = ModelPool()
+batcher = Batcher(pool)
+metrics = Metrics()
+
+
+async def _read_body(receive) -> bytes:
+    body, more = b"", True
+    while more:
+        message = await receive()
+        body += message.get("body", b"")
+        more = message.get("more_body", False)
+    return body
+
+
+async def _respond(send, status: int, payload: Any) -> None:
+    body = json.dumps(payload).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def app(scope, receive, send) -> None:
+    if scope["type"] == "lifespan":
+        while (await receive())["type"] != "lifespan.shutdown":
+            await send({"type": "lifespan.startup.complete"})
+        await send({"type": "lifespan.shutdown.complete"})
+        return
+
+    route = (scope["method"], scope["path"])
+    if route == ("GET", "/metrics"):
+        return await _respond(send, 200, metrics.report(pool, batcher))
+    if route == ("GET", "/health"):
+        return await _respond(send, 200, {"status": "ok"})
+    if route != ("POST", "/query"):
+        return await _respond(send, 404, {"error": "Not found"})
+
+    start = time.perf_counter()
+    metrics.requests += 1
+    try:
+        key, queries = parse(await _read_body(receive))
+        status, payload = 200, {"results": await batcher.submit(key, queries)}
+    except BadRequest as err:
+        status, payload = 400, {"error": str(err)}
+    except Exception as err:
+        status, payload = 500, {"error": f"{type(err).__name__}: {err}"}
+    if status != 200:
+        metrics.errors += 1
+    metrics.latencies.append(time.perf_counter() - start)
+    await _respond(send, status, payload)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, port=8000)
@@ -0,0 +1,57 @@
+from datetime import date
+
+import pytest
+
+from analytics.autodiff import Dual, gradient
+from base_case import build_traeger, scenario
+from model.curves import StepCurve
+
+ASSUMPTIONS = scenario(horizon=date(2027, 12, 31))
+STEP = 1e-6
+
+
+def receivables_2026(m):
+    return m.balance_sheet.assets.receivables.at(date(2026, 12, 31))
+
+
+def inventory_2026(m):
+    return m.balance_sheet.assets.inventory.at(date(2026, 12, 31))
+
+
+def evaluate(target, name, shift):
+    value = getattr(ASSUMPTIONS, name)
+    if isinstance(value, StepCurve):
+        value = StepCurve(value.starts, [rate + shift for rate in value.rates], value.yf)
+    else:
+        value = value + shift
+    with build_traeger(scenario(ASSUMPTIONS, **{name: value})) as m:
+        return target(m)
+
+
+@pytest.mark.parametrize(
+    "target, names",
+    [
+        (receivables_2026, ["revenue_growth_rates", "receivables_pct_revenue"]),
+        (inventory_2026, ["revenue_growth_rates", "cost_of_revenue_pct_revenue", "inventory_pct_cost_of_revenue"]),
+    ],
+)
+def test_derivatives_match_finite_differences(target, names):
+    result = gradient(target, names, ASSUMPTIONS)
+
+    assert result.value == pytest.approx(evaluate(target, names[0], 0.0), rel=1e-12)
+    for name in names:
+        central = (evaluate(target, name, STEP) - evaluate(target, name, -STEP)) / (2 * STEP)
+        assert result.d(name) == pytest.approx(central, rel=1e-5), name
+
+
+def test_dual_arithmetic():
+    x, y = Dual(3.0, {"x": 1.0}), Dual(2.0, {"y": 1.0})
+
+    z = (x * y - x / y) ** 2 + abs(-x)
+
+    value = (3.0 * 2.0 - 3.0 / 2.0) ** 2 + 3.0
+    assert z.value == pytest.approx(value)
+    assert z.d("x") == pytest.approx(2 * (6.0 - 1.5) * (2.0 - 0.5) + 1.0)
+    assert z.d("y") == pytest.approx(2 * (6.0 - 1.5) * (3.0 + 3.0 / 4.0))
+    assert z.d("other") == 0.0
+    assert min(x, y) is y
@@ -0,0 +1,37 @@
+from datetime import date
+
+from analytics.covenants import Covenant, Metrics, evaluate, leverage, liquidity
+from analytics.stochastic import Paths
+
+DATES = [date(2025, 6, 30), date(2025, 9, 30), date(2025, 12, 31)]
+
+
+def test_breaches_compare_each_path():
+    covenant = Covenant("Min liquidity", liquidity, 10_000, "min")
+
+    assert covenant.breaches([Paths([9_000.0, 11_000.0])]) == [[True, False]]
+    assert covenant.breaches([9_000.0, 11_000.0]) == [[True], [False]]
+
+
+def test_first_breach_per_path():
+    covenant = Covenant("Max leverage", leverage, 4.5, "max")
+    values = [Paths([4.0, 5.0, 4.0]), Paths([4.6, 5.0, 4.0]), Paths([4.0, 4.0, 4.5 + 1e-12])]
+
+    assert covenant.first_breaches(DATES, values) == [DATES[1], DATES[0], None]
+
+
+def test_evaluate_reports_first_breach_per_path(monkeypatch):
+    metrics = Metrics(
+        dates=DATES,
+        cash=[Paths([12_000.0, 9_000.0, 15_000.0]), Paths([8_000.0, 12_000.0, 15_000.0]), 11_000.0],
+        total_debt=[0.0] * 3,
+        ltm_ebitda=[1.0] * 3,
+        ltm_interest=[1.0] * 3,
+    )
+    monkeypatch.setattr(Metrics, "from_model", classmethod(lambda cls, model, dates: metrics))
+
+    (result,) = evaluate({"Monte Carlo": None}, DATES, [Covenant("Min liquidity", liquidity, 10_000, "min")])
+
+    assert result.path_breaches == [DATES[1], DATES[0], None]
+    assert result.first_breach == DATES[0]
+    assert result.breach_share == 2 / 3
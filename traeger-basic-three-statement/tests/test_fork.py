@@ -0,0 +1,50 @@
+from datetime import date
+
+import pytest
+
+from base_case import build_traeger, scenario
+from model.curves import StepCurve
+from model.grid import accrue_grid, balances_at
+
+END = date(2027, 12, 31)
+DATES = [date(2025, 3, 31), date(2025, 6, 30), date(2025, 9, 30), date(2025, 12, 31)]
+
+
+@pytest.fixture
+def model():
+    return build_traeger(scenario(horizon=END))
+
+
+def test_tax_rate_fork_shares_operating_line_items(model):
+    revenue = model.income.pretax_income.operating_income.gross_profit.revenue
+    materialized = accrue_grid(revenue, DATES)
+
+    forked = model.fork(income__tax_expense__tax_rate=0.3)
+
+    assert forked.income.pretax_income.operating_income.gross_profit.revenue is revenue
+    assert forked.footnotes.depreciation is model.footnotes.depreciation
+    assert forked.balance_sheet.assets.receivables is model.balance_sheet.assets.receivables
+    assert forked.income.tax_expense is not model.income.tax_expense
+    assert forked.balance_sheet.assets.cash is not model.balance_sheet.assets.cash
+    assert accrue_grid(forked.income.pretax_income.operating_income.gross_profit.revenue, DATES) == materialized
+
+
+def test_revenue_fork_copies_dependents(model):
+    gross_profit = model.income.pretax_income.operating_income.gross_profit
+
+    forked = model.fork(
+        income__pretax_income__operating_income__gross_profit__revenue__growth_rates=StepCurve([DATES[0]], [0.0])
+    )
+
+    assert forked.income.pretax_income.operating_income.gross_profit.cost_of_revenue is not gross_profit.cost_of_revenue
+    assert forked.balance_sheet.assets.receivables is not model.balance_sheet.assets.receivables
+    assert forked.balance_sheet.assets.ppe is model.balance_sheet.assets.ppe
+
+
+def test_forked_values_match_a_rebuilt_model(model):
+    forked = model.fork(income__pretax_income__operating_income__gross_profit__cost_of_revenue__pct_revenue=-0.5)
+    rebuilt = build_traeger(scenario(horizon=END, cost_of_revenue_pct_revenue=-0.5))
+
+    base, fork, build = (balances_at(m.balance_sheet.assets.inventory, DATES) for m in (model, forked, rebuilt))
+    assert fork == pytest.approx(build)
+    assert fork != pytest.approx(base)
@@ -0,0 +1,44 @@
+from datetime import date
+from operator import attrgetter
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from analytics.checks import WORKING_CAPITAL, check_frequencies
+from base_case import build_traeger, scenario
+from model.curves import StepCurve
+from model.grid import accrue_grid, balances_at
+
+END = date(2027, 12, 31)
+QUARTER_ENDS = [date(2025, 3, 31) + relativedelta(months=3 * i, day=31) for i in range(12)]
+
+
+@pytest.fixture(scope="module")
+def models():
+    return build_traeger(scenario(horizon=END)), build_traeger(scenario(horizon=END, frequency="monthly"))
+
+
+@pytest.mark.parametrize("growth", [0.05, 0.15])
+def test_monthly_revenue_sums_to_quarterly(growth):
+    rates = StepCurve([date(2025, 3, 31)], [growth])
+    quarterly = build_traeger(scenario(horizon=END, revenue_growth_rates=rates))
+    monthly = build_traeger(scenario(horizon=END, frequency="monthly", revenue_growth_rates=rates))
+    revenue = []
+    for model in (quarterly, monthly):
+        with model as m:
+            revenue.append(accrue_grid(m.income.pretax_income.operating_income.gross_profit.revenue, QUARTER_ENDS))
+
+    assert revenue[1] == pytest.approx(revenue[0], rel=1e-12)
+
+
+def test_working_capital_agrees_at_quarter_ends(models):
+    for path in WORKING_CAPITAL:
+        balances = []
+        for model in models:
+            with model as m:
+                balances.append(balances_at(attrgetter(path)(m), QUARTER_ENDS))
+        assert balances[1] == pytest.approx(balances[0], rel=1e-12), path
+
+
+def test_check_frequencies(models):
+    assert check_frequencies(*models, QUARTER_ENDS) == {}
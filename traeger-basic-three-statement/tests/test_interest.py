@@ -0,0 +1,28 @@
+from datetime import date
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from analytics.interest import converge
+from base_case import scenario
+from model.grid import balances_at
+
+DATES = [date(2025, 3, 31) + relativedelta(months=3 * i, day=31) for i in range(9)]
+
+
+def test_converged_debt_is_a_fixed_point():
+    result = converge(DATES, scenario(horizon=DATES[-1]), tolerance=0.01)
+
+    assert result.converged
+    with result.model as m:
+        debt = balances_at(m.income.pretax_income.interest_expense.rate_debt, DATES)
+    assert debt == pytest.approx(result.debt, abs=0.01)
+
+
+def test_first_iteration_charges_beginning_balances():
+    result = converge(DATES, scenario(horizon=DATES[-1]), max_iterations=1)
+
+    interest = result.model.income.pretax_income.interest_expense
+    assert interest.mode == "average"
+    assert interest.debt_path == ()
+    assert result.iterations == 1
@@ -0,0 +1,50 @@
+from datetime import date
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from analytics.plan import compile_plan
+from base_case import build_traeger, scenario
+from model.curves import StepCurve
+from model.grid import accrue_grid, balances_at
+
+ASSUMPTIONS = scenario(horizon=date(2027, 12, 31))
+DATES = [date(2024, 12, 31) + relativedelta(months=3 * i, day=31) for i in range(9)]
+TARGETS = {
+    "gross_profit": lambda m: accrue_grid(m.income.pretax_income.operating_income.gross_profit, DATES),
+    "receivables": lambda m: balances_at(m.balance_sheet.assets.receivables, DATES[1:]),
+    "inventory": lambda m: balances_at(m.balance_sheet.assets.inventory, DATES[1:]),
+}
+NAMES = ["revenue_growth_rates", "cost_of_revenue_pct_revenue", "receivables_pct_revenue"]
+
+
+@pytest.fixture(scope="module")
+def plan():
+    return compile_plan(TARGETS, NAMES, ASSUMPTIONS)
+
+
+def shifted(shift):
+    curve = ASSUMPTIONS.revenue_growth_rates
+    return StepCurve(curve.starts, [rate + shift for rate in curve.rates], curve.yf)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        {},
+        {"revenue_growth_rates": shifted(0.05), "cost_of_revenue_pct_revenue": -0.5},
+        {"revenue_growth_rates": shifted(-0.1), "receivables_pct_revenue": 0.3},
+    ],
+)
+def test_plan_matches_model(plan, values):
+    with build_traeger(scenario(ASSUMPTIONS, **values)) as m:
+        expected = {name: target(m) for name, target in TARGETS.items()}
+
+    assert plan.run(**values) == expected
+
+
+def test_plan_rejects_other_assumptions(plan):
+    with pytest.raises(ValueError, match="tax_rate"):
+        plan.run(tax_rate=0.3)
+    with pytest.raises(ValueError, match="start dates"):
+        plan.run(revenue_growth_rates=StepCurve([date(2025, 1, 1)], [0.1]))
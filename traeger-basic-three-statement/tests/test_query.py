@@ -0,0 +1,29 @@
+from datetime import date
+
+from orcaset.financial import AccrualSeriesBase, BalanceSeriesBase, PaymentSeriesBase
+
+from base_case import build_traeger, scenario
+from model.query import compile_path
+
+SERIES = (AccrualSeriesBase, BalanceSeriesBase, PaymentSeriesBase)
+
+
+def test_wildcards_match_only_series():
+    traeger = build_traeger(scenario(horizon=date(2026, 12, 31)))
+    with traeger as trg:
+        for pattern in ("*", "**", "footnotes", "*/*"):
+            for path, get in compile_path(trg, pattern):
+                assert isinstance(get(trg), SERIES), f"{pattern!r} matched {path}"
+
+        assert "footnotes" not in dict(compile_path(trg, "*"))
+        assert "footnotes/depreciation" in dict(compile_path(trg, "**"))
+
+
+def test_query_all_line_items():
+    dates = [date(2025, 3, 31), date(2025, 6, 30), date(2025, 9, 30)]
+    traeger = build_traeger(scenario(horizon=dates[-1]))
+    with traeger as trg:
+        results = trg.query("**", dates)
+
+    assert results
+    assert all(len(values) == len(dates) - 1 for values in results.values())
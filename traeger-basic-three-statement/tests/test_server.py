@@ -0,0 +1,71 @@
+import asyncio
+import json
+
+import pytest
+
+import server
+
+DATES = ["2025-03-31", "2025-06-30", "2025-09-30"]
+
+
+def call(body: dict | bytes) -> tuple[int, dict]:
+    messages = [{"type": "http.request", "body": body if isinstance(body, bytes) else json.dumps(body).encode()}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(server.app({"type": "http", "method": "POST", "path": "/query"}, receive, send))
+    return sent[0]["status"], json.loads(sent[1]["body"])
+
+
+@pytest.fixture(autouse=True)
+def fresh_server(monkeypatch):
+    pool = server.ModelPool()
+    monkeypatch.setattr(server, "pool", pool)
+    monkeypatch.setattr(server, "batcher", server.Batcher(pool))
+    monkeypatch.setattr(server, "metrics", server.Metrics())
+
+
+def test_glob_query_returns_values_by_path():
+    status, payload = call(
+        {"overrides": {"tax_rate": 0.25}, "queries": [{"path": "income/**/revenue", "dates": DATES}]}
+    )
+
+    assert status == 200
+    (result,) = payload["results"]
+    assert list(result) == ["income/pretax_income/operating_income/gross_profit/revenue"]
+    assert len(result["income/pretax_income/operating_income/gross_profit/revenue"]) == 2
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"{not json",
+        {"queries": [{"path": "nothing/*", "dates": DATES}]},
+        {"overrides": {"unknown": 1}, "queries": [{"path": "income", "dates": DATES}]},
+        {"queries": [{"path": "income", "dates": ["2025-13-01"]}]},
+    ],
+)
+def test_bad_requests_are_400(body):
+    status, _ = call(body)
+
+    assert status == 400
+    assert server.metrics.errors == 1
+    assert len(server.metrics.latencies) == 1
+
+
+def test_evaluation_failures_are_500(monkeypatch):
+    def fail(key, queries):
+        raise RuntimeError("model failed")
+
+    monkeypatch.setattr(server.pool, "evaluate", fail)
+    status, payload = call({"queries": [{"path": "income", "dates": DATES}]})
+
+    assert status == 500
+    assert "model failed" in payload["error"]
+    assert server.metrics.errors == 1
+    assert len(server.metrics.latencies) == 1
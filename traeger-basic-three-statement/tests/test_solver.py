@@ -0,0 +1,72 @@
+from datetime import date
+
+import pytest
+
+from analytics.solver import _Problem, goal_seek, solve
+from base_case import build_traeger, scenario
+from model.grid import balances_at
+
+ASSUMPTIONS = scenario(horizon=date(2027, 12, 31))
+
+
+def revenue_2026(m):
+    return m.income.pretax_income.operating_income.gross_profit.revenue.accrue(date(2025, 12, 31), date(2026, 12, 31))
+
+
+def receivables_2026(m):
+    return m.balance_sheet.assets.receivables.at(date(2026, 12, 31))
+
+
+def peak_receivables(m):
+    return max(balances_at(m.balance_sheet.assets.receivables, [date(2025, 12, 31), date(2026, 12, 31)]))
+
+
+def evaluate(target, **values):
+    with build_traeger(scenario(ASSUMPTIONS, **values)) as m:
+        return target(m)
+
+
+def test_goal_seek_reaches_goal():
+    goal = evaluate(revenue_2026) * 1.1
+
+    result = goal_seek(revenue_2026, "revenue_growth_rates", goal, bracket=(-0.5, 0.5), assumptions=ASSUMPTIONS)
+
+    assert result.converged
+    curve = ASSUMPTIONS.revenue_growth_rates
+    shifted = type(curve)(curve.starts, [r + result.values["revenue_growth_rates"] for r in curve.rates], curve.yf)
+    assert evaluate(revenue_2026, revenue_growth_rates=shifted) == pytest.approx(goal, rel=1e-6)
+
+
+def test_solve_two_targets():
+    goals = [(revenue_2026, evaluate(revenue_2026) * 0.95), (receivables_2026, 40_000.0)]
+
+    result = solve(goals, ["revenue_growth_rates", "receivables_pct_revenue"], assumptions=ASSUMPTIONS)
+
+    assert result.converged
+    assert max(abs(r) for r in result.residuals) < 1e-6 * 40_000
+
+
+def test_compiled_jacobian_matches_model_gradients():
+    targets = [(revenue_2026, 0.0), (receivables_2026, 0.0)]
+    names = ["revenue_growth_rates", "receivables_pct_revenue"]
+    compiled = _Problem(targets, names, ASSUMPTIONS)
+    assert compiled.plan is not None
+
+    uncompiled = _Problem(targets, names, ASSUMPTIONS)
+    uncompiled.plan = None
+
+    for x in ([0.0, 0.2], [0.03, 0.25]):
+        residuals, jacobian = compiled(x)
+        expected_residuals, expected_jacobian = uncompiled(x)
+        assert residuals == pytest.approx(expected_residuals, rel=1e-12)
+        for row, expected in zip(jacobian, expected_jacobian):
+            assert row == pytest.approx(expected, rel=1e-9)
+
+
+def test_branching_targets_fall_back_to_the_model():
+    problem = _Problem([(peak_receivables, 0.0)], ["receivables_pct_revenue"], ASSUMPTIONS)
+
+    assert problem.plan is None
+    (residual,), ((derivative,),) = problem([0.25])
+    assert residual == pytest.approx(evaluate(peak_receivables, receivables_pct_revenue=0.25))
+    assert derivative == pytest.approx(residual / 0.25)
@@ -0,0 +1,51 @@
+from datetime import date
+
+import pytest
+from orcaset.financial import YF, Accrual, Period
+
+from base_case import build_traeger, scenario
+from historicals import income
+from historicals.store import HistoricalStore, write_historicals, write_store
+from model.grid import accrue_grid, balances_at
+
+DATES = [date(2024, 12, 31), date(2025, 3, 31), date(2025, 6, 30), date(2025, 9, 30)]
+
+
+@pytest.fixture(scope="module")
+def path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("store") / "traeger.hist")
+    write_historicals(path)
+    return path
+
+
+def test_store_round_trips_accruals_with_their_year_fraction(path):
+    with HistoricalStore(path) as store:
+        revenue = list(store.section("income").revenue)
+
+    assert [(acc.period, acc.value, acc.yf) for acc in revenue] == [
+        (acc.period, acc.value, acc.yf) for acc in income.revenue
+    ]
+
+
+def test_models_read_historicals_from_the_store(path):
+    results = []
+    for assumptions in (scenario(horizon=DATES[-1]), scenario(horizon=DATES[-1], historicals_path=path)):
+        with build_traeger(assumptions) as m:
+            results.append(
+                (
+                    accrue_grid(m.income.pretax_income.operating_income.gross_profit.revenue, DATES),
+                    balances_at(m.balance_sheet.assets.receivables, DATES[1:]),
+                    assumptions.receivables_pct_revenue,
+                )
+            )
+
+    assert results[1] == results[0]
+
+
+def test_mixed_year_fractions_are_rejected(tmp_path):
+    accruals = [
+        Accrual(period=Period(date(2024, 1, 1), date(2024, 4, 1)), value=1.0, yf=YF.cmonthly),
+        Accrual(period=Period(date(2024, 4, 1), date(2024, 7, 1)), value=1.0, yf=YF.thirty360),
+    ]
+    with pytest.raises(ValueError, match="income.mixed"):
+        write_store(str(tmp_path / "mixed.hist"), {"income": {"mixed": accruals}})